@@ -6,10 +6,104 @@ Provides an interactive menu-driven interface for placing trades,
 viewing orders, and managing positions.
 """
 
+import atexit
+import math
+import sys
+import time
+from collections import OrderedDict
+from operator import itemgetter
+from pathlib import Path
+from typing import Callable, Optional
+
+try:
+    import readline  # Upgrades input() with line editing and history
+except ImportError:  # pragma: no cover - e.g. Windows without pyreadline
+    readline = None
+
 from trade_executor import TradeExecutor, TradeExecutionError
 from trade_logger import TradeLogger
 
 
+# Valid-input sets, built once and shared by every prompt
+_YES_TOKENS = frozenset({"yes", "y"})
+_SIDES = frozenset({"yes", "no"})
+_OPEN_STATUSES = frozenset({"active", "open"})
+
+# Order display fields: defaults are merged in once, then unpacked in one call
+_ORDER_DEFAULTS = {
+    "order_id": "N/A", "ticker": "N/A", "side": "N/A", "action": "N/A",
+    "status": "N/A", "yes_price": None, "no_price": None, "count": 0,
+}
+_ORDER_FIELDS = itemgetter(
+    "order_id", "ticker", "side", "action", "status", "yes_price", "no_price", "count",
+)
+_ORDER_STATUS_DEFAULTS = {**_ORDER_DEFAULTS, "count": "N/A", "remaining_count": "N/A"}
+
+# Static display blocks, each emitted with a single print()
+_BAR = "=" * 50
+_MENU_TEXT = (
+    "\n  -------------------------\n"
+    "  1. Search markets\n"
+    "  2. Place market order\n"
+    "  3. Place limit order\n"
+    "  4. View open orders\n"
+    "  5. Cancel order(s)\n"
+    "  6. Check order status\n"
+    "  7. Exit\n"
+    "  -------------------------"
+)
+
+HISTORY_PATH = Path.home() / ".kalshi_cli_history"
+HISTORY_LENGTH = 500
+
+_history_enabled = False
+
+
+def enable_history(history_path: Path = HISTORY_PATH) -> None:
+    """
+    Load prompt history from disk and save it again on exit.
+
+    No-op when readline is unavailable, stdin is not interactive, or
+    history is already enabled.
+    """
+    global _history_enabled
+    if readline is None or _history_enabled or not sys.stdin.isatty():
+        return
+    _history_enabled = True
+
+    readline.set_history_length(HISTORY_LENGTH)
+    try:
+        readline.read_history_file(str(history_path))
+    except (FileNotFoundError, OSError):
+        pass  # First run or unreadable history — start fresh
+
+    def _save_history() -> None:
+        try:
+            readline.write_history_file(str(history_path))
+        except OSError:
+            pass  # History is a convenience; never fail on exit
+
+    atexit.register(_save_history)
+
+
+def _install_completer(completer: Callable[[str, int], Optional[str]]) -> None:
+    """
+    Bind Tab to completer for input() prompts.
+
+    Only whitespace delimits words, so hyphenated tickers (KXBTC-25...)
+    complete as one token. macOS ships libedit, which needs its own
+    binding syntax.
+    """
+    if readline is None:
+        return
+    readline.set_completer(completer)
+    readline.set_completer_delims(" \t\n")
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+
+
 def format_price_dollars(cents: int) -> str:
     """Convert cents to dollar string."""
     return f"${cents / 100:.2f}"
@@ -17,25 +111,35 @@ def format_price_dollars(cents: int) -> str:
 
 def format_order_summary(order: dict) -> str:
     """Format an order dict for display."""
-    order_data = order.get("order", order)
-    order_id = order_data.get("order_id", "N/A")
-    ticker = order_data.get("ticker", "N/A")
-    side = order_data.get("side", "N/A")
-    action = order_data.get("action", "N/A")
-    status = order_data.get("status", "N/A")
-    count = order_data.get("remaining_count", order_data.get("count", 0))
-
-    price = order_data.get("yes_price") or order_data.get("no_price")
+    fields = {**_ORDER_DEFAULTS, **order.get("order", order)}
+    order_id, ticker, side, action, status, yes_price, no_price, count = _ORDER_FIELDS(fields)
+    count = fields.get("remaining_count", count)
+
+    price = yes_price or no_price
     price_str = f"{price}c" if price else "market"
 
     return f"  {order_id[:12]}...  {action.upper()} {count} {side.upper()} @ {price_str}  [{status}]  {ticker}"
 
 
+def format_market_block(market: dict) -> str:
+    """Format a market as the multi-line block shown in search results."""
+    ticker = market.get("ticker", "N/A")
+    title = market.get("title", "N/A")
+    status = market.get("status", "N/A")
+    yes_bid = market.get("yes_bid", 0)
+    yes_ask = market.get("yes_ask", 0)
+    volume = market.get("volume_24h", 0)
+
+    if yes_bid or yes_ask:
+        detail = f"    YES: {yes_bid}c bid / {yes_ask}c ask  |  Status: {status}  |  24h Vol: {volume}"
+    else:
+        detail = f"    Status: {status}  |  24h Vol: {volume}"
+    return f"  {ticker}\n    {title[:70]}\n{detail}\n"
+
+
 def print_header(title: str) -> None:
     """Print a section header."""
-    print(f"\n{'='*50}")
-    print(f"  {title}")
-    print(f"{'='*50}")
+    print(f"\n{_BAR}\n  {title}\n{_BAR}")
 
 
 def print_market_info(market: dict) -> None:
@@ -63,34 +167,59 @@ def get_input(prompt: str, validator=None, error_msg: str = "Invalid input") ->
 
 def get_int_input(prompt: str, min_val: int = None, max_val: int = None) -> int:
     """Get integer input with optional bounds."""
+    # Resolve open bounds once so each attempt is a single range comparison
+    lo = -math.inf if min_val is None else min_val
+    hi = math.inf if max_val is None else max_val
     while True:
-        value = input(prompt).strip()
         try:
-            num = int(value)
-            if min_val is not None and num < min_val:
-                print(f"  Error: Must be at least {min_val}")
-                continue
-            if max_val is not None and num > max_val:
-                print(f"  Error: Must be at most {max_val}")
-                continue
-            return num
+            num = int(input(prompt).strip())
         except ValueError:
             print("  Error: Please enter a valid number")
+            continue
+        if lo <= num <= hi:
+            return num
+        if num < lo:
+            print(f"  Error: Must be at least {min_val}")
+        else:
+            print(f"  Error: Must be at most {max_val}")
 
 
 def confirm(prompt: str) -> bool:
     """Ask for yes/no confirmation."""
-    response = input(f"{prompt} (yes/no): ").strip().lower()
-    return response in ("yes", "y")
+    return input(f"{prompt} (yes/no): ").strip().lower() in _YES_TOKENS
 
 
 class TradingCLI:
     """Interactive command-line interface for trading."""
 
+    # Search results are reused while the user iterates between menus
+    SEARCH_CACHE_TTL = 60.0  # seconds
+    SEARCH_CACHE_MAX = 32    # most recent (query, status, series, limit) keys kept
+    # Open orders change on every placement/cancel, so keep this short
+    OPEN_ORDERS_CACHE_TTL = 5.0  # seconds
+    # Bid/ask shown before an order goes stale quickly; keep only briefly
+    MARKET_INFO_CACHE_TTL = 15.0  # seconds
+
+    EXIT_CHOICE = "7"
+
     def __init__(self, logger: TradeLogger = None):
         """Initialize the CLI with a trade executor."""
         self.executor = None
         self.logger = logger
+        self._search_cache: OrderedDict = OrderedDict()  # key -> (fetched_at, markets)
+        self._open_orders_cache: Optional[tuple] = None  # (fetched_at, orders)
+        self._market_info_cache: dict = {}  # ticker -> (fetched_at, market)
+        self._last_tickers: list = []  # tickers from the latest search, for Tab completion
+
+        # Menu choice -> handler, built once instead of an if/elif ladder per iteration
+        self._handlers = {
+            "1": self._search_markets,
+            "2": self._place_market_order,
+            "3": self._place_limit_order,
+            "4": self._view_open_orders,
+            "5": self._cancel_order,
+            "6": self._check_order_status,
+        }
 
     def _ensure_executor(self) -> bool:
         """Ensure executor is initialized. Returns False if initialization fails."""
@@ -105,43 +234,105 @@ class TradingCLI:
                 return False
         return True
 
+    def _cached_search(
+        self,
+        query: Optional[str],
+        status: Optional[str],
+        series_ticker: Optional[str] = None,
+        limit: int = 50,
+    ) -> tuple:
+        """
+        Search markets, reusing results fetched within SEARCH_CACHE_TTL.
+
+        Returns (markets, blocks) where blocks are the preformatted display
+        strings for each market, built once per fetch.
+        """
+        key = (query, status, series_ticker, limit)
+        cached = self._search_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.SEARCH_CACHE_TTL:
+            self._search_cache.move_to_end(key)
+            return cached[1], cached[2]
+
+        kwargs = {"query": query, "status": status, "limit": limit}
+        if series_ticker:
+            kwargs["series_ticker"] = series_ticker
+        markets = self.executor.search_markets(**kwargs)
+        blocks = [format_market_block(m) for m in markets]
+
+        self._search_cache[key] = (time.monotonic(), markets, blocks)
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > self.SEARCH_CACHE_MAX:
+            self._search_cache.popitem(last=False)
+        return markets, blocks
+
+    def _cached_open_orders(self) -> list:
+        """List open orders, reusing results fetched within OPEN_ORDERS_CACHE_TTL."""
+        cached = self._open_orders_cache
+        if cached is not None and time.monotonic() - cached[0] < self.OPEN_ORDERS_CACHE_TTL:
+            return cached[1]
+
+        orders = self.executor.list_open_orders()
+        self._open_orders_cache = (time.monotonic(), orders)
+        return orders
+
+    def _invalidate_open_orders(self) -> None:
+        """Drop cached open orders after an order is placed or cancelled."""
+        self._open_orders_cache = None
+
+    def _fetch_market_for_trading(self, ticker: str) -> Optional[dict]:
+        """
+        Look up and display a market before placing an order on it.
+
+        Reuses market info fetched within MARKET_INFO_CACHE_TTL. Returns None
+        (after printing the reason) if the lookup fails or the market is not open.
+        """
+        cached = self._market_info_cache.get(ticker)
+        if cached is not None and time.monotonic() - cached[0] < self.MARKET_INFO_CACHE_TTL:
+            market = cached[1]
+        else:
+            try:
+                market = self.executor.get_market_info(ticker)
+            except TradeExecutionError as e:
+                print(f"  Error: {e}")
+                return None
+            self._market_info_cache[ticker] = (time.monotonic(), market)
+
+        print_market_info(market)
+
+        if market.get("status") not in _OPEN_STATUSES:
+            print("  Error: This market is not open for trading.")
+            return None
+        return market
+
+    def _complete_ticker(self, text: str, state: int) -> Optional[str]:
+        """readline completer: match tickers from the most recent search."""
+        prefix = text.upper()
+        matches = [t for t in self._last_tickers if t.startswith(prefix)]
+        return matches[state] if state < len(matches) else None
+
     def run(self) -> None:
         """Run the trading CLI main loop."""
+        _install_completer(self._complete_ticker)
+
         print_header("Kalshi Trading Interface")
 
         while True:
             self._show_menu()
             choice = input("\n  Enter choice (1-7): ").strip()
 
-            if choice == "1":
-                self._search_markets()
-            elif choice == "2":
-                self._place_market_order()
-            elif choice == "3":
-                self._place_limit_order()
-            elif choice == "4":
-                self._view_open_orders()
-            elif choice == "5":
-                self._cancel_order()
-            elif choice == "6":
-                self._check_order_status()
-            elif choice == "7":
+            if choice == self.EXIT_CHOICE:
                 print("\n  Goodbye!")
                 break
-            else:
+
+            handler = self._handlers.get(choice)
+            if handler is None:
                 print("  Invalid choice. Please enter 1-7.")
+            else:
+                handler()
 
     def _show_menu(self) -> None:
         """Display the main menu."""
-        print("\n  -------------------------")
-        print("  1. Search markets")
-        print("  2. Place market order")
-        print("  3. Place limit order")
-        print("  4. View open orders")
-        print("  5. Cancel an order")
-        print("  6. Check order status")
-        print("  7. Exit")
-        print("  -------------------------")
+        print(_MENU_TEXT)
 
     def _search_markets(self) -> None:
         """Search and browse available markets."""
@@ -168,7 +359,7 @@ class TradingCLI:
             status = "open"
 
         try:
-            markets = self.executor.search_markets(
+            markets, blocks = self._cached_search(
                 query=query if query else None,
                 status=status,
                 limit=50
@@ -182,7 +373,7 @@ class TradingCLI:
                 series = input("\n  Enter series ticker (or press Enter to skip): ").strip().upper()
 
                 if series:
-                    markets = self.executor.search_markets(
+                    markets, blocks = self._cached_search(
                         query=query,
                         status=status,
                         series_ticker=series,
@@ -193,26 +384,15 @@ class TradingCLI:
                 print("\n  No markets found matching your criteria.")
                 return
 
+            self._last_tickers = [m.get("ticker") for m in markets if m.get("ticker")]
             print(f"\n  Found {len(markets)} market(s):\n")
 
-            for market in markets:
-                ticker = market.get("ticker", "N/A")
-                title = market.get("title", "N/A")
-                status_str = market.get("status", "N/A")
-                yes_bid = market.get("yes_bid", 0)
-                yes_ask = market.get("yes_ask", 0)
-                volume = market.get("volume_24h", 0)
-
-                print(f"  {ticker}")
-                print(f"    {title[:70]}")
-                if yes_bid or yes_ask:
-                    print(f"    YES: {yes_bid}c bid / {yes_ask}c ask  |  Status: {status_str}  |  24h Vol: {volume}")
-                else:
-                    print(f"    Status: {status_str}  |  24h Vol: {volume}")
-                print()
-
-            print("  Tip: Copy a ticker from above to use when placing orders.")
-            print()
+            # Blocks are preformatted at fetch time; write the listing in one call
+            sys.stdout.write(
+                "\n".join(blocks)
+                + "\n  Tip: Copy a ticker from above to use when placing orders.\n\n"
+            )
+            sys.stdout.flush()
 
         except TradeExecutionError as e:
             print(f"\n  Error: {e}")
@@ -230,20 +410,12 @@ class TradingCLI:
             print("  Cancelled.")
             return
 
-        try:
-            market = self.executor.get_market_info(ticker)
-            print_market_info(market)
-
-            if market.get("status") not in ("active", "open"):
-                print("  Error: This market is not open for trading.")
-                return
-        except TradeExecutionError as e:
-            print(f"  Error: {e}")
+        if self._fetch_market_for_trading(ticker) is None:
             return
 
         # Get side
         side = input("  Enter side (yes/no): ").strip().lower()
-        if side not in ("yes", "no"):
+        if side not in _SIDES:
             print("  Error: Side must be 'yes' or 'no'")
             return
 
@@ -255,12 +427,13 @@ class TradingCLI:
             return
 
         # Confirm order
-        print("\n  Order Summary:")
-        print(f"    Market:   {ticker}")
-        print(f"    Side:     {side.upper()}")
-        print(f"    Quantity: {quantity}")
-        print(f"    Type:     MARKET")
-        print()
+        print(
+            f"\n  Order Summary:\n"
+            f"    Market:   {ticker}\n"
+            f"    Side:     {side.upper()}\n"
+            f"    Quantity: {quantity}\n"
+            f"    Type:     MARKET\n"
+        )
 
         if not confirm("  Confirm order?"):
             print("  Order cancelled.")
@@ -269,6 +442,8 @@ class TradingCLI:
         # Place order
         try:
             result = self.executor.place_market_order(ticker, side, quantity)
+            self._invalidate_open_orders()
+            self._market_info_cache.pop(ticker, None)
             order = result.get("order", result)
             print(f"\n  Order placed successfully!")
             print(f"  Order ID: {order.get('order_id', 'N/A')}")
@@ -294,20 +469,12 @@ class TradingCLI:
             print("  Cancelled.")
             return
 
-        try:
-            market = self.executor.get_market_info(ticker)
-            print_market_info(market)
-
-            if market.get("status") not in ("active", "open"):
-                print("  Error: This market is not open for trading.")
-                return
-        except TradeExecutionError as e:
-            print(f"  Error: {e}")
+        if self._fetch_market_for_trading(ticker) is None:
             return
 
         # Get side
         side = input("  Enter side (yes/no): ").strip().lower()
-        if side not in ("yes", "no"):
+        if side not in _SIDES:
             print("  Error: Side must be 'yes' or 'no'")
             return
 
@@ -326,14 +493,15 @@ class TradingCLI:
             return
 
         # Confirm order
-        print("\n  Order Summary:")
-        print(f"    Market:   {ticker}")
-        print(f"    Side:     {side.upper()}")
-        print(f"    Quantity: {quantity}")
-        print(f"    Price:    {price}c ({format_price_dollars(price)})")
-        print(f"    Type:     LIMIT")
-        print(f"    Cost:     {format_price_dollars(price * quantity)} (max)")
-        print()
+        print(
+            f"\n  Order Summary:\n"
+            f"    Market:   {ticker}\n"
+            f"    Side:     {side.upper()}\n"
+            f"    Quantity: {quantity}\n"
+            f"    Price:    {price}c ({format_price_dollars(price)})\n"
+            f"    Type:     LIMIT\n"
+            f"    Cost:     {format_price_dollars(price * quantity)} (max)\n"
+        )
 
         if not confirm("  Confirm order?"):
             print("  Order cancelled.")
@@ -342,6 +510,8 @@ class TradingCLI:
         # Place order
         try:
             result = self.executor.place_limit_order(ticker, side, quantity, price)
+            self._invalidate_open_orders()
+            self._market_info_cache.pop(ticker, None)
             order = result.get("order", result)
             print(f"\n  Order placed successfully!")
             print(f"  Order ID: {order.get('order_id', 'N/A')}")
@@ -362,16 +532,15 @@ class TradingCLI:
             return
 
         try:
-            orders = self.executor.list_open_orders()
+            orders = self._cached_open_orders()
 
             if not orders:
                 print("\n  No open orders.")
                 return
 
             print(f"\n  Found {len(orders)} open order(s):\n")
-            for order in orders:
-                print(format_order_summary(order))
-            print()
+            sys.stdout.write("\n".join(format_order_summary(o) for o in orders) + "\n\n")
+            sys.stdout.flush()
         except TradeExecutionError as e:
             print(f"\n  Error: {e}")
 
@@ -384,19 +553,23 @@ class TradingCLI:
 
         # Show open orders first
         try:
-            orders = self.executor.list_open_orders()
+            orders = self._cached_open_orders()
             if orders:
                 print("\n  Current open orders:")
-                for order in orders:
-                    print(format_order_summary(order))
-                print()
+                sys.stdout.write("\n".join(format_order_summary(o) for o in orders) + "\n\n")
+                sys.stdout.flush()
         except TradeExecutionError:
             pass  # Continue even if we can't list orders
 
-        order_id = input("  Enter order ID to cancel: ").strip()
-        if not order_id:
+        entry = input("  Enter order ID(s) to cancel (comma-separated): ")
+        order_ids = [oid.strip() for oid in entry.split(",") if oid.strip()]
+        if not order_ids:
             print("  Cancelled.")
             return
+        if len(order_ids) > 1:
+            self._cancel_orders(order_ids)
+            return
+        order_id = order_ids[0]
 
         if not confirm(f"  Cancel order {order_id[:20]}...?"):
             print("  Cancelled.")
@@ -404,6 +577,7 @@ class TradingCLI:
 
         try:
             result = self.executor.cancel_order(order_id)
+            self._invalidate_open_orders()
             order = result.get("order", result)
             print(f"\n  Order cancelled successfully!")
             print(f"  Status: {order.get('status', 'cancelled')}")
@@ -415,6 +589,34 @@ class TradingCLI:
         except TradeExecutionError as e:
             print(f"\n  Error: {e}")
 
+    def _cancel_orders(self, order_ids: list) -> None:
+        """Cancel several orders with one batched request after confirmation."""
+        if not confirm(f"  Cancel {len(order_ids)} orders?"):
+            print("  Cancelled.")
+            return
+
+        try:
+            results = self.executor.cancel_orders(order_ids)
+        except TradeExecutionError as e:
+            print(f"\n  Error: {e}")
+            return
+        finally:
+            # Some orders may be gone even when the call fails part-way
+            self._invalidate_open_orders()
+
+        print()
+        for entry in results:
+            order_id = entry.get("order_id", "N/A")
+            if entry.get("error"):
+                print(f"  {order_id}: failed ({entry['error']})")
+                continue
+            print(f"  {order_id}: cancelled")
+            if self.logger is not None:
+                try:
+                    self.logger.log_order_cancellation(order_id)
+                except Exception:
+                    pass
+
     def _check_order_status(self) -> None:
         """Check the status of a specific order."""
         print_header("Check Order Status")
@@ -429,18 +631,18 @@ class TradingCLI:
 
         try:
             result = self.executor.get_order_status(order_id)
-            order = result.get("order", result)
+            order = {**_ORDER_STATUS_DEFAULTS, **result.get("order", result)}
 
             print(f"\n  Order Details:")
-            print(f"    Order ID:  {order.get('order_id', 'N/A')}")
-            print(f"    Ticker:    {order.get('ticker', 'N/A')}")
-            print(f"    Side:      {order.get('side', 'N/A').upper()}")
-            print(f"    Action:    {order.get('action', 'N/A').upper()}")
-            print(f"    Status:    {order.get('status', 'N/A')}")
-            print(f"    Quantity:  {order.get('count', 'N/A')}")
-            print(f"    Remaining: {order.get('remaining_count', 'N/A')}")
-
-            price = order.get("yes_price") or order.get("no_price")
+            print(f"    Order ID:  {order['order_id']}")
+            print(f"    Ticker:    {order['ticker']}")
+            print(f"    Side:      {order['side'].upper()}")
+            print(f"    Action:    {order['action'].upper()}")
+            print(f"    Status:    {order['status']}")
+            print(f"    Quantity:  {order['count']}")
+            print(f"    Remaining: {order['remaining_count']}")
+
+            price = order["yes_price"] or order["no_price"]
             if price:
                 print(f"    Price:     {price}c")
 
@@ -451,6 +653,7 @@ class TradingCLI:
 
 def run_trading_cli() -> None:
     """Entry point for the trading CLI."""
+    enable_history()
     cli = TradingCLI()
     try:
         cli.run()
@@ -7,6 +7,7 @@ Validates required configuration at import time.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -25,6 +26,10 @@ API_URLS = {
 # Valid log levels
 VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR"}
 
+# Pre-joined choices for validation error messages
+_API_URLS_STR = ", ".join(API_URLS.keys())
+_LOG_LEVELS_STR = ", ".join(VALID_LOG_LEVELS)
+
 
 class ConfigurationError(Exception):
     """Raised when required configuration is missing or invalid."""
@@ -48,12 +53,16 @@ def _get_optional(key: str, default: str) -> str:
     return os.getenv(key, default)
 
 
+@lru_cache(maxsize=1)
 def get_config() -> dict:
     """
     Load and validate configuration.
 
     Returns a dictionary with all configuration values.
     Raises ConfigurationError if required values are missing.
+
+    The result is memoized after the first successful call; call
+    get_config.cache_clear() after changing environment variables.
     """
     # Load required values
     api_key = _get_required("KALSHI_API_KEY")
@@ -67,14 +76,14 @@ def get_config() -> dict:
     if environment not in API_URLS:
         raise ConfigurationError(
             f"Invalid KALSHI_ENVIRONMENT: '{environment}'\n"
-            f"Must be one of: {', '.join(API_URLS.keys())}"
+            f"Must be one of: {_API_URLS_STR}"
         )
 
     # Validate log level
     if log_level not in VALID_LOG_LEVELS:
         raise ConfigurationError(
             f"Invalid LOG_LEVEL: '{log_level}'\n"
-            f"Must be one of: {', '.join(VALID_LOG_LEVELS)}"
+            f"Must be one of: {_LOG_LEVELS_STR}"
         )
 
     return {
@@ -124,4 +133,4 @@ def get_log_level() -> str:
 
 def is_production() -> bool:
     """Check if running in production environment."""
-    return get_environment() == "production"
+    return get_config()["environment"] == "production"
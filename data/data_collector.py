@@ -9,21 +9,24 @@ with checkpointing to skip already-collected tickers.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import partial
+from itertools import compress
+from typing import Callable, Optional
 
+import numpy as np
 import pandas as pd
 
-from kalshi_client import KalshiClient, KalshiAPIError
+from kalshi_client import KalshiClient, KalshiAPIError, iter_pages
 from data.data_store import DataStore
-from trade_executor import TradeExecutor as _TradeExecutor
-
-# Module-level alias so the rest of the code reads clearly
-POPULAR_SERIES = _TradeExecutor.POPULAR_SERIES
+from market_series import POPULAR_SERIES
 
 logger = logging.getLogger(__name__)
 
+_UNIX_EPOCH = pd.Timestamp(0, tz="UTC")
+
 
 class DataCollectionError(Exception):
     """Raised for unrecoverable data collection failures."""
@@ -53,6 +56,7 @@ class DataCollector:
 
     BATCH_SIZE = 100  # max tickers per batch candlestick call
     MAX_PAGES = 50    # safety limit for pagination
+    MAX_WORKERS = 8   # concurrent API requests; kept low for Kalshi rate limits
 
     def __init__(
         self,
@@ -92,18 +96,19 @@ class DataCollector:
         if series_tickers is None:
             series_tickers = list(POPULAR_SERIES)
 
-        for series in series_tickers:
-            logger.info("[collect] Series %s: fetching live settled markets", series)
-            live = self._paginate_markets(series_ticker=series, status="settled")
-            for m in live:
-                all_markets[m["ticker"]] = m
-
-            logger.info("[collect] Series %s: fetching historical markets", series)
-            historical = self._paginate_historical_markets(series_ticker=series)
-            for m in historical:
-                all_markets[m["ticker"]] = m
-
-        filtered = [m for m in all_markets.values() if _within_window(m, cutoff_date)]
+        # Paginate every (series, endpoint) pair concurrently, then merge in
+        # submission order so later series / historical rows still win ties
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            futures = []
+            for series in series_tickers:
+                logger.info("[collect] Series %s: fetching live settled and historical markets", series)
+                futures.append(pool.submit(self._paginate_markets, series_ticker=series, status="settled"))
+                futures.append(pool.submit(self._paginate_historical_markets, series_ticker=series))
+            for future in futures:
+                for m in future.result():
+                    all_markets[m["ticker"]] = m
+
+        filtered = _filter_within_window(list(all_markets.values()), cutoff_date)
         new_count = self.store.save_markets(filtered) if filtered else 0
 
         logger.info("[collect] %d markets found (%d new)", len(filtered), new_count)
@@ -118,9 +123,10 @@ class DataCollector:
         """Collect candlesticks for the given tickers.
 
         Skips tickers already present in the store (checkpointing). Splits
-        remaining tickers into live (batch endpoint) and historical (per-ticker
-        endpoint) based on settlement_ts; falls back to close_time when
-        settlement_ts is absent. Continues past individual ticker errors.
+        remaining tickers into live (batch endpoint) and historical (client-side
+        batch over the per-ticker endpoint) based on settlement_ts; falls back
+        to close_time when settlement_ts is absent. Continues past individual
+        ticker errors.
 
         Returns {ticker: candle_count}.
         """
@@ -138,21 +144,19 @@ class DataCollector:
         # Build epoch-seconds lookup: prefer settlement_ts, fall back to close_time.
         # Markets without settlement_ts are open/pending — close_time is the proxy.
         ticker_to_epoch: dict = {}
-        markets_df = self.store.get_markets()
+        markets_df = self.store.get_markets(columns=["ticker", "settlement_ts", "close_time"])
         if not markets_df.empty:
-            settlement_col = markets_df["settlement_ts"].fillna("").astype(str)
-            close_time_col = markets_df["close_time"].fillna("").astype(str)
-            for ticker, s_ts, c_time in zip(markets_df["ticker"], settlement_col, close_time_col):
-                ticker_to_epoch[ticker] = _parse_ts(s_ts or c_time)
-
-        live_tickers = []
-        historical_tickers = []
-        for ticker in remaining:
-            epoch = ticker_to_epoch.get(ticker)
-            if epoch is not None and epoch <= cutoff_ts:
-                historical_tickers.append(ticker)
-            else:
-                live_tickers.append(ticker)
+            ticker_to_epoch = _epochs_by_ticker(markets_df)
+
+        # Tickers with no known timestamp default past the cutoff, i.e. live
+        epochs = np.fromiter(
+            (ticker_to_epoch.get(t, cutoff_ts + 1) for t in remaining),
+            dtype=np.int64,
+            count=len(remaining),
+        )
+        is_historical = epochs <= cutoff_ts
+        historical_tickers = list(compress(remaining, is_historical))
+        live_tickers = list(compress(remaining, ~is_historical))
 
         total = len(remaining)
         live_done = 0
@@ -165,58 +169,51 @@ class DataCollector:
 
         results: dict = {}
 
-        # Batch-fetch live tickers (up to BATCH_SIZE per API call)
-        for i in range(0, len(live_tickers), self.BATCH_SIZE):
-            batch = live_tickers[i:i + self.BATCH_SIZE]
-            try:
-                resp = self.client.get_batch_candlesticks(
-                    batch, period_interval=granularity, start_ts=start_ts, end_ts=end_ts
-                )
-                if "candlesticks" not in resp:
-                    logger.warning("[collect] Batch response missing 'candlesticks' key: %r", resp)
-                    for ticker in batch:
-                        results[ticker] = 0
-                else:
-                    candles_by_ticker = resp["candlesticks"]
-                    for ticker, candles in candles_by_ticker.items():
-                        results[ticker] = self.store.save_candles(ticker, candles, granularity)
-                    # Tickers the API returned no candles for
-                    for ticker in batch:
-                        if ticker not in results:
-                            results[ticker] = 0
-            except KalshiAPIError as e:
-                logger.error("[collect] Batch candlestick error: %s", e)
-                for ticker in batch:
-                    results[ticker] = 0
-            live_done += len(batch)
-            print(
-                f"[collect] Fetching candles: {live_done + hist_done}/{total} done "
-                f"({live_done} live batch, {hist_done} historical per-ticker)"
-            )
-
-        # Per-ticker fetch for historical tickers
-        for ticker in historical_tickers:
-            try:
-                resp = self.client.get_market_candlesticks(
-                    ticker,
+        # Batch-fetch live tickers (up to BATCH_SIZE per API call). Batches are
+        # requested concurrently; saves stay on this thread.
+        batches = [
+            live_tickers[i:i + self.BATCH_SIZE]
+            for i in range(0, len(live_tickers), self.BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            batch_futures = {
+                pool.submit(
+                    self.client.get_batch_candlesticks,
+                    batch,
                     period_interval=granularity,
                     start_ts=start_ts,
                     end_ts=end_ts,
-                    historical=True,
-                )
-                candles = resp.get("candlesticks", [])
-                results[ticker] = self.store.save_candles(ticker, candles, granularity)
-            except KalshiAPIError as e:
-                logger.error("[collect] Ticker %s candlestick error: %s", ticker, e)
-                results[ticker] = 0
-            hist_done += 1
-            # Print after every BATCH_SIZE historical tickers and at the final one
-            if hist_done % self.BATCH_SIZE == 0 or hist_done == len(historical_tickers):
+                ): batch
+                for batch in batches
+            }
+            for future in as_completed(batch_futures):
+                batch = batch_futures[future]
+                live_done += len(batch)
+                self._save_batch_candles(future.result, batch, granularity, results)
                 print(
                     f"[collect] Fetching candles: {live_done + hist_done}/{total} done "
                     f"({live_done} live batch, {hist_done} historical per-ticker)"
                 )
 
+        # Historical tickers go through the client's batch helper one BATCH_SIZE
+        # batch at a time; the client fans each batch out to the per-ticker
+        # endpoint concurrently. Saves stay on this thread (DataStore is not thread-safe).
+        for i in range(0, len(historical_tickers), self.BATCH_SIZE):
+            batch = historical_tickers[i:i + self.BATCH_SIZE]
+            fetch = partial(
+                self.client.get_batch_historical_candlesticks,
+                batch,
+                period_interval=granularity,
+                start_ts=start_ts,
+                end_ts=end_ts,
+            )
+            hist_done += len(batch)
+            self._save_batch_candles(fetch, batch, granularity, results)
+            print(
+                f"[collect] Fetching candles: {live_done + hist_done}/{total} done "
+                f"({live_done} live batch, {hist_done} historical per-ticker)"
+            )
+
         return results
 
     def run(
@@ -226,7 +223,7 @@ class DataCollector:
     ) -> CollectionSummary:
         """Full orchestration: markets → candles → return summary.
 
-        series_tickers defaults to POPULAR_SERIES from trade_executor.
+        series_tickers defaults to POPULAR_SERIES from market_series.
         """
         summary = CollectionSummary()
 
@@ -241,6 +238,8 @@ class DataCollector:
             candle_results = self.collect_candlesticks(tickers, days_back=days_back)
             summary.tickers_with_candles = sum(1 for c in candle_results.values() if c > 0)
             summary.candles_collected = sum(candle_results.values())
+            # Candle saves are append-only; fold updated rows once per run
+            self.store.compact()
 
         print(str(summary))
         return summary
@@ -249,64 +248,80 @@ class DataCollector:
     # Private pagination helpers
     # -------------------------------------------------------------------------
 
+    def _save_batch_candles(
+        self, fetch: Callable[[], dict], batch: list, granularity: int, results: dict
+    ) -> None:
+        """Save the candles returned by fetch() for one batch into results (0 on error).
+
+        fetch returns a {"candlesticks": {ticker: [...]}} batch response.
+        """
+        try:
+            resp = fetch()
+            if "candlesticks" not in resp:
+                logger.warning("[collect] Batch response missing 'candlesticks' key: %r", resp)
+                for ticker in batch:
+                    results[ticker] = 0
+                return
+            for ticker, candles in resp["candlesticks"].items():
+                results[ticker] = self.store.save_candles(ticker, candles, granularity)
+            # Tickers the API returned no candles for
+            for ticker in batch:
+                if ticker not in results:
+                    results[ticker] = 0
+        except KalshiAPIError as e:
+            logger.error("[collect] Batch candlestick error: %s", e)
+            for ticker in batch:
+                results[ticker] = 0
+
     def _paginate_markets(self, series_ticker: str, status: str) -> list:
         """Paginate GET /markets for a single series/status combination."""
-        results = []
-        cursor = None
-        for _ in range(self.MAX_PAGES):
-            resp = self.client.get_markets(
-                limit=1000,
-                cursor=cursor,
-                series_ticker=series_ticker,
-                status=status,
-            )
-            page = resp.get("markets", [])
-            results.extend(page)
-            cursor = resp.get("cursor", "")
-            if not cursor or not page:
-                break
-        return results
+        return list(iter_pages(
+            self.client.get_markets, "markets", max_pages=self.MAX_PAGES,
+            limit=1000, series_ticker=series_ticker, status=status,
+        ))
 
     def _paginate_historical_markets(self, series_ticker: str) -> list:
         """Paginate GET /historical/markets for a single series."""
-        results = []
-        cursor = None
-        for _ in range(self.MAX_PAGES):
-            resp = self.client.get_historical_markets(
-                limit=1000,
-                cursor=cursor,
-                series_ticker=series_ticker,
-            )
-            page = resp.get("markets", [])
-            results.extend(page)
-            cursor = resp.get("cursor", "")
-            if not cursor or not page:
-                break
-        return results
+        return list(iter_pages(
+            self.client.get_historical_markets, "markets", max_pages=self.MAX_PAGES,
+            limit=1000, series_ticker=series_ticker,
+        ))
 
 
 # ---------------------------------------------------------------------------
 # Module-level helpers
 # ---------------------------------------------------------------------------
 
-def _within_window(market: dict, cutoff_date: datetime) -> bool:
-    """Return True if the market's close_time falls within the collection window."""
-    close_time_str = market.get("close_time", "")
-    if not close_time_str:
-        return False
-    try:
-        close_dt = pd.to_datetime(close_time_str, utc=True).to_pydatetime()
-        return close_dt >= cutoff_date
-    except Exception:
-        return False
-
-
-def _parse_ts(ts_str: str) -> Optional[int]:
-    """Parse an ISO8601 timestamp string to epoch seconds. Returns None on failure."""
-    if not ts_str:
-        return None
-    try:
-        return int(pd.to_datetime(ts_str, utc=True).timestamp())
-    except (ValueError, TypeError) as e:
-        logger.warning("Failed to parse timestamp %r: %s", ts_str, e)
-        return None
+def _filter_within_window(markets: list, cutoff_date: datetime) -> list:
+    """Return the markets whose close_time falls within the collection window.
+
+    All close_time strings are parsed in one pd.to_datetime call; missing or
+    unparseable values are excluded.
+    """
+    if not markets:
+        return []
+    close_times = pd.Series([m.get("close_time") or None for m in markets], dtype=object)
+    parsed = pd.to_datetime(close_times, utc=True, format="ISO8601", errors="coerce")
+    keep = (parsed >= cutoff_date).to_numpy()
+    return list(compress(markets, keep))
+
+
+def _epochs_by_ticker(markets_df: pd.DataFrame) -> dict:
+    """Map ticker -> epoch seconds of settlement_ts, falling back to close_time.
+
+    Parses the whole column in one pd.to_datetime call. Tickers whose
+    timestamp is missing or unparseable are left out of the result.
+    """
+    settlement = markets_df["settlement_ts"]
+    ts_col = settlement.where(settlement.notna() & (settlement != ""), markets_df["close_time"])
+    parsed = pd.to_datetime(ts_col, utc=True, format="ISO8601", errors="coerce")
+
+    valid = parsed.notna()
+    if not valid.all():
+        bad = ts_col[~valid & ts_col.notna() & (ts_col != "")]
+        if not bad.empty:
+            logger.warning("Failed to parse %d timestamps, e.g. %r", len(bad), bad.iloc[0])
+        parsed = parsed[valid]
+    # NaT rows are already dropped, so this stays int64 with no float/NaN round trip
+    epochs = (parsed - _UNIX_EPOCH) // pd.Timedelta(seconds=1)
+    return dict(zip(markets_df["ticker"][valid], epochs))
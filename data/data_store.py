@@ -1,21 +1,36 @@
 """
-DataStore — CSV persistence layer for the ML pipeline.
+DataStore — CSV/Parquet persistence layer for the ML pipeline.
 
 Provides upsert-based storage for Kalshi market metadata and OHLC candlestick
-data. Two CSV files are maintained:
+data. Two tables are maintained:
   - data_store/markets.csv  — one row per market, keyed on ticker
   - data_store/candles.csv  — one row per (ticker, period_end_ts, granularity)
+
+plus data_store/candles.tickers, a one-ticker-per-line index of tickers that
+have candles, so checkpointing does not have to scan the candles table.
+
+Either path may instead end in ".parquet", in which case it is a directory of
+part-<uuid>.parquet files (requires pyarrow). New keys are written as a new
+part file; the directory is only rewritten when existing keys are updated.
 """
 
 from __future__ import annotations
 
 import logging
+import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional; see requirements_ml.txt
+    pa = pacsv = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +39,7 @@ class DataStoreError(Exception):
 
 
 class DataStore:
-    """CSV-backed persistence layer for market and candlestick data."""
+    """CSV- or Parquet-backed persistence layer for market and candlestick data."""
 
     MARKETS_COLUMNS = [
         "ticker", "event_ticker", "series_ticker", "title", "market_type",
@@ -36,6 +51,7 @@ class DataStore:
         "low_cents", "close_cents", "volume", "open_interest",
         "yes_bid_cents", "yes_ask_cents",
     ]
+    CANDLES_KEY_COLUMNS = ["ticker", "period_end_ts", "granularity"]
 
     def __init__(
         self,
@@ -44,9 +60,16 @@ class DataStore:
     ) -> None:
         self.markets_path = markets_path
         self.candles_path = candles_path
+        # Sidecar index of tickers with candles, one per line (e.g. data_store/candles.tickers)
+        self.tickers_index_path = str(Path(candles_path).with_suffix(".tickers"))
         Path(self.markets_path).parent.mkdir(parents=True, exist_ok=True)
         Path(self.candles_path).parent.mkdir(parents=True, exist_ok=True)
 
+        # Read caches, keyed on the file's (mtime_ns, size) so any write invalidates them
+        self._markets_cache: Optional[tuple] = None            # (stamp, columns, df)
+        self._collected_tickers: Optional[set] = None          # loaded from the sidecar index
+        self._candle_keys_cache: Optional[tuple] = None        # (stamp, set of key tuples)
+
     # -------------------------------------------------------------------------
     # Write methods
     # -------------------------------------------------------------------------
@@ -54,54 +77,46 @@ class DataStore:
     def save_markets(self, markets: list[dict]) -> int:
         """Append markets to CSV; deduplicate on ticker (keep last).
 
+        Only the ticker column is read to detect collisions. Batches of all-new
+        tickers are appended; the file is rewritten only when a ticker is updated.
+
         Returns count of tickers that were not already present before this call.
         """
         if not markets:
             return 0
 
-        collected_at = datetime.now(timezone.utc).isoformat()
-        new_rows = []
-        for m in markets:
-            settlement_dollars = m.get("settlement_value_dollars") or 0
-            try:
-                settlement_cents = round(float(settlement_dollars) * 100)
-            except (TypeError, ValueError):
-                logger.warning(
-                    "Invalid settlement_value_dollars for ticker %s: %r — storing 0",
-                    m.get("ticker"),
-                    settlement_dollars,
-                )
-                settlement_cents = 0
-
-            new_rows.append({
-                "ticker": m.get("ticker", ""),
-                "event_ticker": m.get("event_ticker", ""),
-                "series_ticker": m.get("series_ticker", ""),
-                "title": m.get("title", ""),
-                "market_type": m.get("market_type", ""),
-                "status": m.get("status", ""),
-                "result": m.get("result", ""),
-                "settlement_value_cents": settlement_cents,
-                "open_time": m.get("open_time", ""),
-                "close_time": m.get("close_time", ""),
-                "settlement_ts": m.get("settlement_ts", ""),
-                "collected_at": collected_at,
-            })
-
-        new_df = pd.DataFrame(new_rows, columns=self.MARKETS_COLUMNS)
-
-        if Path(self.markets_path).exists():
-            existing_df = pd.read_csv(self.markets_path)
-            existing_tickers = set(existing_df["ticker"].tolist())
-            combined = pd.concat([existing_df, new_df], ignore_index=True)
-        else:
-            existing_tickers = set()
-            combined = new_df
+        # Dedupe within the batch up front (dict keeps the last market per ticker)
+        by_ticker = {m.get("ticker", ""): m for m in markets}
+        batch = list(by_ticker.values())
+
+        # Build each column as one list instead of a dict per row, so pandas
+        # does not have to infer columns row by row
+        columns = {field: [m.get(field, "") for m in batch] for field in _MARKET_TEXT_FIELDS}
+        columns["settlement_value_cents"] = [_settlement_cents(m) for m in batch]
+        columns["collected_at"] = datetime.now(timezone.utc).isoformat()
+        new_df = pd.DataFrame(columns, columns=self.MARKETS_COLUMNS)
 
-        # Count unique new tickers (set handles duplicates within the same batch)
-        newly_added = len({r["ticker"] for r in new_rows} - existing_tickers)
+        if _is_parquet(self.markets_path):
+            return self._upsert_parquet(self.markets_path, new_df, ["ticker"])
 
-        combined = combined.drop_duplicates(subset=["ticker"], keep="last")
+        if not Path(self.markets_path).exists():
+            new_df.to_csv(self.markets_path, index=False)
+            return len(by_ticker)
+
+        existing_tickers = self._read_markets(["ticker"])["ticker"]
+        collisions = new_df["ticker"].isin(existing_tickers)
+        newly_added = len(by_ticker) - int(collisions.sum())
+
+        if not collisions.any():
+            # Fast path: nothing to replace, so append without reading the rest of the file
+            new_df.to_csv(self.markets_path, mode="a", header=False, index=False)
+            return newly_added
+
+        existing_df = self._read_markets(None)
+        updated = existing_df["ticker"].isin(by_ticker.keys())
+        # The file is already unique on ticker, so dropping the rows being
+        # replaced is enough; no drop_duplicates over the whole frame
+        combined = pd.concat([existing_df[~updated], new_df], ignore_index=True)
         combined.to_csv(self.markets_path, index=False)
 
         return newly_added
@@ -109,62 +124,87 @@ class DataStore:
     def save_candles(self, ticker: str, candles: list[dict], granularity: int) -> int:
         """Append candles for a ticker; deduplicate on (ticker, period_end_ts, granularity).
 
+        CSV storage is append-only: rows are appended without rereading or
+        rewriting the file. Rows that update an existing key leave a stale
+        duplicate behind, which get_candles hides (keep last) and compact()
+        removes from disk.
+
         Returns count of (ticker, period_end_ts, granularity) rows not already present.
         """
         if not candles:
             return 0
 
-        new_rows = []
-        for c in candles:
-            ts = c.get("end_period_ts")
-            if not ts:
-                logger.warning(
-                    "Candle missing end_period_ts for ticker %s — skipping: %r", ticker, c
-                )
-                continue
-            period_end_ts = datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
-            price = c.get("price", {})
-            yes_bid = c.get("yes_bid", {})
-            yes_ask = c.get("yes_ask", {})
-            new_rows.append({
-                "ticker": ticker,
-                "period_end_ts": period_end_ts,
-                "granularity": granularity,
-                "open_cents": price.get("open", 0),
-                "high_cents": price.get("high", 0),
-                "low_cents": price.get("low", 0),
-                "close_cents": price.get("close", 0),
-                "volume": c.get("volume", 0),
-                "open_interest": c.get("open_interest", 0),
-                "yes_bid_cents": yes_bid.get("close", 0),
-                "yes_ask_cents": yes_ask.get("close", 0),
-            })
-
-        if not new_rows:
+        # One vectorized flatten of the nested API payload; nested keys become
+        # price_open, yes_bid_close, ... (see _CANDLE_VALUE_FIELDS)
+        flat = pd.json_normalize(candles, sep="_")
+        if "end_period_ts" not in flat:
+            flat["end_period_ts"] = 0
+        missing = flat["end_period_ts"].fillna(0) == 0
+        for i in flat.index[missing]:
+            logger.warning(
+                "Candle missing end_period_ts for ticker %s — skipping: %r", ticker, candles[i]
+            )
+        kept = [candles[i] for i in flat.index[~missing]]
+        flat = flat[~missing].reset_index(drop=True)
+        if flat.empty:
             return 0
 
-        new_df = pd.DataFrame(new_rows, columns=self.CANDLES_COLUMNS)
-        key_cols = ["ticker", "period_end_ts", "granularity"]
+        new_df = pd.DataFrame({
+            "ticker": ticker,
+            "period_end_ts": _epoch_to_iso(flat["end_period_ts"].to_numpy(dtype="int64")),
+            "granularity": granularity,
+        })
+        for dest, src in _CANDLE_VALUE_FIELDS.items():
+            new_df[dest] = _int_column(flat, src, kept)
+        key_cols = self.CANDLES_KEY_COLUMNS
+
+        if _is_parquet(self.candles_path):
+            fresh = not Path(self.candles_path).exists()
+            newly_added = self._upsert_parquet(self.candles_path, new_df, key_cols)
+            self._record_collected_ticker(ticker, fresh)
+            return newly_added
+
+        # Dedupe within the batch, then count keys not yet on disk
+        new_df = new_df.drop_duplicates(subset=key_cols, keep="last")
+        new_keys = set(new_df[key_cols].itertuples(index=False, name=None))
+        existing_keys = self._load_candle_keys()
+        newly_added = len(new_keys - existing_keys)
+
+        write_header = not Path(self.candles_path).exists()
+        new_df.to_csv(self.candles_path, mode="a", header=write_header, index=False)
+
+        # Carry the in-memory key index forward instead of rereading the file
+        existing_keys |= new_keys
+        self._candle_keys_cache = (_file_stamp(self.candles_path), existing_keys)
+        self._record_collected_ticker(ticker, write_header)
 
-        if Path(self.candles_path).exists():
-            existing_df = pd.read_csv(self.candles_path)
-            existing_keys = set(
-                zip(existing_df["ticker"], existing_df["period_end_ts"], existing_df["granularity"])
-            )
-            combined = pd.concat([existing_df, new_df], ignore_index=True)
-        else:
-            existing_keys = set()
-            combined = new_df
+        return newly_added
 
-        # Count unique new composite keys (set handles duplicates within the same batch)
-        newly_added = len(
-            {(r["ticker"], r["period_end_ts"], r["granularity"]) for r in new_rows} - existing_keys
-        )
+    def compact(self) -> int:
+        """Rewrite the candles store without duplicate keys (keep last).
 
-        combined = combined.drop_duplicates(subset=key_cols, keep="last")
-        combined.to_csv(self.candles_path, index=False)
+        Call once after a batch of save_candles calls. Returns the number of
+        stale rows removed.
+        """
+        if not Path(self.candles_path).exists():
+            return 0
 
-        return newly_added
+        df = _read_table(self.candles_path)
+        deduped = df.drop_duplicates(subset=self.CANDLES_KEY_COLUMNS, keep="last")
+        removed = len(df) - len(deduped)
+
+        if _is_parquet(self.candles_path):
+            old_parts = list(Path(self.candles_path).glob("part-*.parquet"))
+            if len(old_parts) > 1 or removed:
+                _write_parquet_part(deduped, self.candles_path)
+                for part in old_parts:
+                    part.unlink()
+        elif removed:
+            deduped.to_csv(self.candles_path, index=False)
+
+        if removed:
+            logger.info("Compacted %s: removed %d duplicate rows", self.candles_path, removed)
+        return removed
 
     # -------------------------------------------------------------------------
     # Read methods
@@ -174,36 +214,284 @@ class DataStore:
         self,
         series_ticker: Optional[str] = None,
         status: Optional[str] = None,
+        columns: Optional[list[str]] = None,
     ) -> pd.DataFrame:
-        """Load markets CSV, optionally filtered by series_ticker and/or status."""
+        """Load markets CSV, optionally filtered by series_ticker and/or status.
+
+        columns restricts the CSV parse (and the result) to the given columns.
+        Parsed frames are cached until the file changes on disk.
+        """
         if not Path(self.markets_path).exists():
-            return pd.DataFrame(columns=self.MARKETS_COLUMNS)
-        df = pd.read_csv(self.markets_path)
+            return pd.DataFrame(columns=columns or self.MARKETS_COLUMNS)
+
+        usecols = None
+        if columns:
+            filter_cols = [c for c, v in (("series_ticker", series_ticker), ("status", status)) if v]
+            usecols = list(dict.fromkeys([*columns, *filter_cols]))
+
+        df = self._read_markets(usecols)
         if series_ticker:
             df = df[df["series_ticker"] == series_ticker]
         if status:
             df = df[df["status"] == status]
+        if columns:
+            df = df[columns]
         return df.reset_index(drop=True)
 
     def get_candles(self, ticker: Optional[str] = None) -> pd.DataFrame:
         """Load candles CSV, optionally filtered by ticker."""
         if not Path(self.candles_path).exists():
             return pd.DataFrame(columns=self.CANDLES_COLUMNS)
-        df = pd.read_csv(self.candles_path)
+        df = _read_table(self.candles_path)
         if ticker:
             df = df[df["ticker"] == ticker]
+        # Hide rows superseded by later appends that compact() has not removed yet
+        df = df.drop_duplicates(subset=self.CANDLES_KEY_COLUMNS, keep="last")
         return df.reset_index(drop=True)
 
     def ticker_has_candles(self, ticker: str) -> bool:
-        """Return True if the ticker has at least one candle stored."""
+        """Return True if the ticker has at least one candle stored.
+
+        A hashed lookup in the collected-ticker index; no scan of the candles table.
+        """
         if not Path(self.candles_path).exists():
             return False
-        df = pd.read_csv(self.candles_path)
-        return ticker in df["ticker"].values
+        return ticker in self._load_collected_tickers()
+
+    def get_collected_tickers(self) -> frozenset:
+        """Return frozenset of tickers that already have candles (used for checkpointing).
 
-    def get_collected_tickers(self) -> set:
-        """Return set of tickers that already have candles (used for checkpointing)."""
+        Answered from the sidecar index at tickers_index_path; the candles
+        table is only scanned to rebuild a missing index.
+        """
         if not Path(self.candles_path).exists():
+            return frozenset()
+        return frozenset(self._load_collected_tickers())
+
+    # -------------------------------------------------------------------------
+    # Internal helpers
+    # -------------------------------------------------------------------------
+
+    def _load_collected_tickers(self) -> set:
+        """Return the in-memory collected-ticker set, loading or rebuilding the index."""
+        if self._collected_tickers is None:
+            index = Path(self.tickers_index_path)
+            if index.exists():
+                self._collected_tickers = set(index.read_text().split())
+            else:
+                tickers = _read_ticker_set(self.candles_path)
+                index.write_text("".join(f"{t}\n" for t in sorted(tickers)))
+                self._collected_tickers = tickers
+        return self._collected_tickers
+
+    def _record_collected_ticker(self, ticker: str, fresh: bool) -> None:
+        """Add ticker to the sidecar index after its candles were written.
+
+        fresh means this save created the candles table, so any existing
+        index belongs to a deleted table and is discarded.
+        """
+        index = Path(self.tickers_index_path)
+        if fresh:
+            index.write_text(f"{ticker}\n")
+            self._collected_tickers = {ticker}
+            return
+        tickers = self._load_collected_tickers()
+        if ticker not in tickers:
+            with index.open("a") as f:
+                f.write(f"{ticker}\n")
+            tickers.add(ticker)
+
+    def _read_markets(self, usecols: Optional[list[str]]) -> pd.DataFrame:
+        """Read the markets CSV (only usecols, if given), reusing the cached parse."""
+        stamp = _file_stamp(self.markets_path)
+        key = tuple(usecols) if usecols else None
+        cached = self._markets_cache
+        if cached is not None and cached[0] == stamp and cached[1] == key:
+            return cached[2]
+        if _is_parquet(self.markets_path):
+            df = _read_table(self.markets_path, usecols)
+        else:
+            # Text columns come back as strings with "" for blanks: skipping
+            # NaN detection saves a pass per column and callers need no fillna
+            df = pd.read_csv(
+                self.markets_path, usecols=usecols, dtype=_MARKETS_CSV_DTYPES, na_filter=False
+            )
+        self._markets_cache = (stamp, key, df)
+        return df
+
+    def _load_candle_keys(self) -> set:
+        """Return the set of candle key tuples on disk, reusing the in-memory copy."""
+        stamp = _file_stamp(self.candles_path)
+        if stamp is None:
             return set()
-        df = pd.read_csv(self.candles_path)
-        return set(df["ticker"].unique())
+        cached = self._candle_keys_cache
+        if cached is None or cached[0] != stamp:
+            keys_df = _read_table(self.candles_path, self.CANDLES_KEY_COLUMNS)
+            cached = (stamp, set(keys_df.itertuples(index=False, name=None)))
+            self._candle_keys_cache = cached
+        return cached[1]
+
+    def _upsert_parquet(self, path: str, new_df: pd.DataFrame, key_cols: list[str]) -> int:
+        """Upsert new_df into a Parquet dataset directory; return count of new keys.
+
+        Only the key columns of existing parts are scanned. If no existing key is
+        touched the batch is written as a new part file; otherwise the dataset is
+        rewritten as a single part with the replaced rows dropped (keep last).
+        Keys are compared as hashed MultiIndexes rather than sets of tuples.
+        """
+        new_df = new_df.drop_duplicates(subset=key_cols, keep="last")
+        new_idx = pd.MultiIndex.from_frame(new_df[key_cols])
+
+        if not Path(path).exists():
+            _write_parquet_part(new_df, path)
+            return len(new_df)
+
+        existing_idx = pd.MultiIndex.from_frame(_read_table(path, key_cols))
+        is_new = ~new_idx.isin(existing_idx)
+
+        if is_new.all():
+            _write_parquet_part(new_df, path)
+        else:
+            existing_df = _read_table(path)
+            replaced = pd.MultiIndex.from_frame(existing_df[key_cols]).isin(new_idx)
+            combined = pd.concat([existing_df[~replaced], new_df], ignore_index=True)
+            old_parts = list(Path(path).glob("part-*.parquet"))
+            _write_parquet_part(combined, path)
+            for part in old_parts:
+                part.unlink()
+
+        return int(is_new.sum())
+
+
+# Market fields copied verbatim from the API payload ("" when absent)
+_MARKET_TEXT_FIELDS = (
+    "ticker", "event_ticker", "series_ticker", "title", "market_type", "status",
+    "result", "open_time", "close_time", "settlement_ts",
+)
+
+_MARKETS_CSV_DTYPES = {field: "string" for field in (*_MARKET_TEXT_FIELDS, "collected_at")}
+
+# Flattened candle column -> json_normalize'd API field
+_CANDLE_VALUE_FIELDS = {
+    "open_cents": "price_open",
+    "high_cents": "price_high",
+    "low_cents": "price_low",
+    "close_cents": "price_close",
+    "volume": "volume",
+    "open_interest": "open_interest",
+    "yes_bid_cents": "yes_bid_close",
+    "yes_ask_cents": "yes_ask_close",
+}
+
+# json_normalize'd API field -> key path in the raw candle
+_CANDLE_FIELD_PATHS = {
+    "price_open": ("price", "open"),
+    "price_high": ("price", "high"),
+    "price_low": ("price", "low"),
+    "price_close": ("price", "close"),
+    "volume": ("volume",),
+    "open_interest": ("open_interest",),
+    "yes_bid_close": ("yes_bid", "close"),
+    "yes_ask_close": ("yes_ask", "close"),
+}
+
+
+def _settlement_cents(market: dict) -> int:
+    """Convert settlement_value_dollars to cents; 0 (with a warning) if invalid."""
+    settlement_dollars = market.get("settlement_value_dollars") or 0
+    try:
+        return round(float(settlement_dollars) * 100)
+    except (TypeError, ValueError):
+        logger.warning(
+            "Invalid settlement_value_dollars for ticker %s: %r — storing 0",
+            market.get("ticker"),
+            settlement_dollars,
+        )
+        return 0
+
+
+def _epoch_to_iso(epochs: np.ndarray) -> np.ndarray:
+    """Format epoch seconds as UTC ISO8601 strings, e.g. '2023-12-01T00:00:00+00:00'.
+
+    Matches datetime.fromtimestamp(ts, tz=timezone.utc).isoformat() for whole
+    seconds, but formats the whole array in one numpy call.
+    """
+    iso = np.datetime_as_string(epochs.astype("datetime64[s]"), unit="s")
+    return np.char.add(iso, "+00:00")
+
+
+def _int_column(flat: pd.DataFrame, name: str, candles: list[dict]) -> pd.Series:
+    """Return flat[name] with missing keys as 0, kept integral where possible.
+
+    json_normalize gives NaN both for absent keys and explicit nulls. Kalshi
+    sends null prices for periods with no trades, so those stay null (a blank
+    CSV cell) rather than reading as a trade at 0. Only the NaN rows are
+    checked against the raw candles.
+    """
+    if name not in flat:
+        return pd.Series(0, index=flat.index)
+    col = flat[name]
+    nan_rows = col.index[col.isna()]
+    if len(nan_rows):
+        path = _CANDLE_FIELD_PATHS[name]
+        absent = [i for i in nan_rows if not _has_key_path(candles[i], path)]
+        col = col.copy()
+        col[absent] = 0
+    # An all-null batch comes back as object dtype; it still needs an integer type
+    # so Parquet parts agree on the schema
+    if col.dtype.kind in "fO" and (col.dropna() % 1 == 0).all():
+        col = col.astype("Int64" if col.hasnans else "int64")
+    return col
+
+
+def _has_key_path(candle: dict, path: tuple) -> bool:
+    """Return True if the nested keys in path exist in candle, even with a null value."""
+    node = candle
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return False
+        node = node[key]
+    return True
+
+
+def _is_parquet(path: str) -> bool:
+    """Return True if path names a Parquet dataset directory rather than a CSV file."""
+    return path.endswith(".parquet")
+
+
+def _read_table(path: str, columns: Optional[list[str]] = None) -> pd.DataFrame:
+    """Read a CSV file or Parquet dataset, parsing only the given columns."""
+    if _is_parquet(path):
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_csv(path, usecols=columns)
+
+
+def _read_ticker_set(path: str) -> set:
+    """Return the distinct tickers in a table, parsing only the ticker column.
+
+    Plain CSVs go through pyarrow's multithreaded reader when it is installed.
+    """
+    if pacsv is None or _is_parquet(path):
+        return set(_read_table(path, ["ticker"])["ticker"].unique())
+    table = pacsv.read_csv(
+        path,
+        convert_options=pacsv.ConvertOptions(
+            include_columns=["ticker"], column_types={"ticker": pa.string()}
+        ),
+    )
+    return set(table.column("ticker").unique().to_pylist())
+
+
+def _write_parquet_part(df: pd.DataFrame, path: str) -> None:
+    """Write df as a new part file inside the Parquet dataset directory at path."""
+    Path(path).mkdir(parents=True, exist_ok=True)
+    df.to_parquet(Path(path) / f"part-{uuid.uuid4().hex}.parquet", index=False)
+
+
+def _file_stamp(path: str) -> Optional[tuple]:
+    """Return (mtime_ns, size) for path, or None if it does not exist."""
+    try:
+        st = Path(path).stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
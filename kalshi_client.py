@@ -4,19 +4,27 @@ Kalshi API client for the Trading System.
 
 Provides authenticated access to Kalshi's trading API with:
 - RSA-based request signing
-- Automatic retry with exponential backoff
+- Automatic retry with jittered exponential backoff
 - Comprehensive error handling
 - Request/response logging
 """
 
 import base64
+import hashlib
 import logging
 import os
+import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional, Union
+from email.utils import parsedate_to_datetime
+from itertools import product
+from typing import Callable, Iterator, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
@@ -25,9 +33,56 @@ from cryptography.hazmat.backends import default_backend
 from config import get_api_credentials, get_api_base_url
 
 
+def _json_codec() -> tuple:
+    """
+    Return (module with loads(), dumps() -> compact bytes) for API payloads.
+
+    Prefers orjson, which parses response bytes directly and is several times
+    faster; falls back to the stdlib json module with matching output.
+    """
+    try:
+        import orjson
+        return orjson, orjson.dumps
+    except ImportError:
+        import json
+
+        def dumps(obj) -> bytes:
+            return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+        return json, dumps
+
+
+_json, _dumps = _json_codec()
+
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Accepted place_order enums; every (side, action, order_type) combination is valid
+_ORDER_SIDES = ("yes", "no")
+_ORDER_ACTIONS = ("buy", "sell")
+_ORDER_TYPES = ("market", "limit")
+_ORDER_KINDS = frozenset(product(_ORDER_SIDES, _ORDER_ACTIONS, _ORDER_TYPES))
+
+# Request signing parameters (salt_length must be DIGEST_LENGTH per Kalshi docs);
+# immutable, so built once and shared by every signature
+_SIGNING_HASH = hashes.SHA256()
+_PSS_PADDING = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()),
+    salt_length=padding.PSS.DIGEST_LENGTH
+)
+
+# GET endpoints worth caching briefly: small responses re-read within one
+# interaction. Bulk candlestick and market listings are never cached.
+_CACHEABLE_GET = re.compile(
+    r"/portfolio/(?:balance|positions)"
+    r"|/historical/cutoff"
+    r"|/markets/(?!candlesticks$)[^/]+(?:/orderbook)?"
+)
+
+# SHA-256 of PEM bytes -> loaded key, so clients sharing a key parse it once
+_PRIVATE_KEY_CACHE: dict = {}
+
 
 class KalshiAPIError(Exception):
     """Exception raised for Kalshi API errors."""
@@ -44,6 +99,40 @@ class KalshiAPIError(Exception):
         return f"KalshiAPIError: {self.message}"
 
 
+class _RateLimiter:
+    """Thread-safe token bucket spacing requests to at most rate per second.
+
+    Up to rate requests may go out back to back; after that each acquire()
+    reserves the next free slot and sleeps until it arrives.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._rate = rate
+        self._clock = clock
+        self._sleep = sleep
+        self._capacity = max(rate, 1.0)
+        self._tokens = self._capacity
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request slot is available."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            # A negative balance is a reservation for a future slot
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+
+
 class KalshiClient:
     """
     Client for interacting with the Kalshi Trading API.
@@ -62,13 +151,32 @@ class KalshiClient:
     MAX_RETRIES = 3
     MAX_RATE_LIMIT_RETRIES = 5  # Separate limit for rate limiting
     RETRY_BACKOFF_BASE = 1.0  # seconds
+    MAX_BACKOFF = 30.0  # seconds; cap for jittered backoff between retries
+    DEFAULT_RATE_LIMIT_WAIT = 5.0  # seconds to wait on a 429 without a usable Retry-After
     RETRY_STATUS_CODES = {500, 502, 503, 504}  # Server errors worth retrying
+    BATCH_FANOUT_WORKERS = 8  # concurrent requests for client-side batch helpers
+    BATCH_CANCEL_SIZE = 20  # max order IDs per batch-cancel request
+
+    RATE_LIMIT_PER_SEC = 10.0  # proactive client-side request rate; 0 disables
+    API_PATH_PREFIX = "/trade-api/v2"  # signed path prefix for every endpoint
+
+    # Short-lived cache for small, hot GETs (see _CACHEABLE_GET); repeated
+    # lookups within one interaction (e.g. a portfolio refresh) reuse the
+    # response. 0 disables caching.
+    GET_CACHE_TTL = 2.0  # seconds
+    GET_CACHE_MAXSIZE = 1024
+
+    # Connection pool sizing (per host); must cover the thread fan-outs above
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 32
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         api_secret: Optional[str] = None,
         base_url: Optional[str] = None,
+        pool_maxsize: Optional[int] = None,
+        rate_per_sec: Optional[float] = None,
     ):
         """
         Initialize the Kalshi client.
@@ -77,6 +185,11 @@ class KalshiClient:
             api_key: API key. Loaded from config if not provided.
             api_secret: API secret (PEM key path or string). Loaded from config if not provided.
             base_url: API base URL. Loaded from config if not provided.
+            pool_maxsize: Connections kept open per host. Defaults to POOL_MAXSIZE;
+                raise it for callers that run more concurrent requests.
+            rate_per_sec: Requests per second to allow before throttling locally.
+                Defaults to RATE_LIMIT_PER_SEC; 0 disables the limiter (429
+                responses are still retried either way).
         """
         if api_key and api_secret:
             self.api_key = api_key
@@ -89,15 +202,58 @@ class KalshiClient:
         # Load private key for signing
         self._private_key = self._load_private_key(self.api_secret)
 
-        # Setup session for connection reuse
+        # Setup session for connection reuse. The default adapter keeps only
+        # 10 idle connections per host, so concurrent fan-outs would reopen
+        # TLS connections; size the pool for them instead.
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize or self.POOL_MAXSIZE,
+            pool_block=False,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Connection": "keep-alive",
         })
 
+        # (timestamp_ms, {(method, path): signature}) for the latest millisecond
+        self._signature_cache: tuple = (None, {})
+
+        # Throttle before sending rather than only reacting to 429s
+        rate = self.RATE_LIMIT_PER_SEC if rate_per_sec is None else rate_per_sec
+        self._rate_limiter: Optional[_RateLimiter] = _RateLimiter(rate) if rate > 0 else None
+
+        # (endpoint, sorted params) -> (expires_at, response) for GET requests
+        self._get_cache: dict = {}
+        self._get_cache_lock = threading.Lock()
+
         logger.info("KalshiClient initialized for %s", self.base_url)
 
+    def warm_up(self) -> threading.Thread:
+        """
+        Open a pooled connection to the API host in the background.
+
+        The TCP and TLS handshakes complete while the caller is doing other
+        work (e.g. the user reading the CLI menu), and the connection is
+        returned to the session pool for the first real request to reuse.
+        Failures are only logged; the first request simply connects itself.
+
+        Returns:
+            The started daemon thread
+        """
+        def _connect() -> None:
+            try:
+                self.session.head(self.base_url, timeout=10)
+            except requests.exceptions.RequestException as e:
+                logger.debug("Connection warm-up failed: %s", e)
+
+        thread = threading.Thread(target=_connect, name="kalshi-warm-up", daemon=True)
+        thread.start()
+        return thread
+
     def _load_private_key(self, key_data: str) -> PrivateKeyTypes:
         """
         Load RSA private key from PEM string or file path.
@@ -127,11 +283,15 @@ class KalshiClient:
 
                 key_bytes = key_data.encode("utf-8")
 
-            private_key = serialization.load_pem_private_key(
-                key_bytes,
-                password=None,
-                backend=default_backend()
-            )
+            digest = hashlib.sha256(key_bytes).digest()
+            private_key = _PRIVATE_KEY_CACHE.get(digest)
+            if private_key is None:
+                private_key = serialization.load_pem_private_key(
+                    key_bytes,
+                    password=None,
+                    backend=default_backend()
+                )
+                _PRIVATE_KEY_CACHE[digest] = private_key
             return private_key
         except KalshiAPIError:
             raise
@@ -159,23 +319,33 @@ class KalshiClient:
         message = f"{timestamp}{method}{path}"
         message_bytes = message.encode("utf-8")
 
-        # Sign with RSA-PSS (salt_length must be DIGEST_LENGTH per Kalshi docs)
-        signature = self._private_key.sign(
-            message_bytes,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.DIGEST_LENGTH
-            ),
-            hashes.SHA256()
-        )
+        # Sign with RSA-PSS
+        signature = self._private_key.sign(message_bytes, _PSS_PADDING, _SIGNING_HASH)
 
         return base64.b64encode(signature).decode("utf-8")
 
+    @staticmethod
+    def _timestamp_ms() -> int:
+        """Current Unix time in milliseconds, as the Kalshi auth headers require."""
+        return time.time_ns() // 1_000_000
+
     def _get_auth_headers(self, method: str, path: str) -> dict:
-        """Generate authentication headers for a request."""
-        # Timestamp must be Unix milliseconds per Kalshi API docs
-        timestamp = int(datetime.now(timezone.utc).timestamp() * 1000)
-        signature = self._sign_request(method, path, timestamp)
+        """Generate authentication headers for a request.
+
+        The signature covers only timestamp + method + path, so requests to the
+        same endpoint within one millisecond reuse it instead of re-signing.
+        """
+        timestamp = self._timestamp_ms()
+        # (timestamp, signatures) is swapped as one tuple so a thread never
+        # stores a signature under another thread's millisecond
+        cache_ts, signatures = self._signature_cache
+        if cache_ts != timestamp:
+            signatures = {}
+            self._signature_cache = (timestamp, signatures)
+        signature = signatures.get((method, path))
+        if signature is None:
+            signature = self._sign_request(method, path, timestamp)
+            signatures[(method, path)] = signature
 
         return {
             "KALSHI-ACCESS-KEY": self.api_key,
@@ -205,31 +375,52 @@ class KalshiClient:
         Raises:
             KalshiAPIError: On API errors or after max retries
         """
-        url = f"{self.base_url}{endpoint}"
-        path = f"/trade-api/v2{endpoint}"
+        cache_key = None
+        if method == "GET" and self.GET_CACHE_TTL > 0 and _CACHEABLE_GET.fullmatch(endpoint):
+            cache_key = (endpoint, tuple(sorted(params.items())) if params else ())
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Cache hit: GET %s", endpoint)
+                return cached
+        elif method != "GET":
+            # Orders and cancels change balance, positions and order state
+            self.invalidate("/portfolio")
+
+        url = self.base_url + endpoint
+        path = self.API_PATH_PREFIX + endpoint
+        # Encoded once for all attempts; the session already sends
+        # Content-Type: application/json. Bodyless calls (every GET) skip
+        # the data kwarg entirely rather than passing data=None.
+        body = _dumps(json_data) if json_data is not None else None
+        body_kwargs = {"data": body} if body is not None else {}
 
         last_exception = None
         rate_limit_retries = 0
+        prev_wait = self.RETRY_BACKOFF_BASE
 
         for attempt in range(self.MAX_RETRIES):
             try:
-                # Generate fresh auth headers for each attempt
-                auth_headers = self._get_auth_headers(method, path)
-                headers = {**self.session.headers, **auth_headers}
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
+
+                # Generate fresh auth headers for each attempt; the session
+                # merges in its own common headers
+                headers = self._get_auth_headers(method, path)
 
                 logger.info("API Request: %s %s (attempt %d)", method, endpoint, attempt + 1)
-                if params:
-                    logger.debug("Query params: %s", params)
-                if json_data:
-                    logger.debug("Request body: %s", json_data)
+                if logger.isEnabledFor(logging.DEBUG):
+                    if params:
+                        logger.debug("Query params: %s", _Truncated(params))
+                    if body:
+                        logger.debug("Request body: %s", _Truncated(body))
 
                 response = self.session.request(
                     method=method,
                     url=url,
                     headers=headers,
                     params=params,
-                    json=json_data,
                     timeout=30,
+                    **body_kwargs,
                 )
 
                 # Log response
@@ -243,15 +434,22 @@ class KalshiClient:
                             "Max rate limit retries exceeded",
                             status_code=429
                         )
-                    retry_after = int(response.headers.get("Retry-After", 5))
-                    logger.warning("Rate limited. Waiting %d seconds. (retry %d/%d)",
+                    retry_after = _parse_retry_after(response)
+                    if retry_after is None:
+                        retry_after = self.DEFAULT_RATE_LIMIT_WAIT
+                    logger.warning("Rate limited. Waiting %.1f seconds. (retry %d/%d)",
                                    retry_after, rate_limit_retries, self.MAX_RATE_LIMIT_RETRIES)
                     time.sleep(retry_after)
                     continue
 
                 # Handle retryable server errors
                 if response.status_code in self.RETRY_STATUS_CODES:
-                    wait_time = self.RETRY_BACKOFF_BASE * (2 ** attempt)
+                    # Some gateways send Retry-After on 5xx too; prefer it when present
+                    retry_after = _parse_retry_after(response)
+                    if retry_after is not None:
+                        wait_time = min(self.MAX_BACKOFF, retry_after)
+                    else:
+                        wait_time = prev_wait = self._backoff(prev_wait)
                     logger.warning(
                         "Server error %d. Retrying in %.1f seconds.",
                         response.status_code,
@@ -280,11 +478,20 @@ class KalshiClient:
                 if response.status_code == 204:
                     return {}  # No content
 
-                return response.json()
+                try:
+                    data = _json.loads(response.content)
+                except ValueError as e:
+                    raise KalshiAPIError(
+                        f"Invalid JSON in response: {e}",
+                        status_code=response.status_code
+                    ) from e
+                if cache_key is not None:
+                    self._cache_put(cache_key, response.content)
+                return data
 
             except requests.exceptions.RequestException as e:
                 last_exception = e
-                wait_time = self.RETRY_BACKOFF_BASE * (2 ** attempt)
+                wait_time = prev_wait = self._backoff(prev_wait)
                 logger.warning("Request failed: %s. Retrying in %.1f seconds.", e, wait_time)
                 time.sleep(wait_time)
 
@@ -296,10 +503,65 @@ class KalshiClient:
             status_code=status_code
         )
 
+    def _cache_get(self, key: tuple) -> Optional[dict]:
+        """Return a freshly parsed copy of the cached GET response, or None if absent or expired.
+
+        Entries hold the raw response bytes, so callers never share (or
+        mutate) a cached object.
+        """
+        with self._get_cache_lock:
+            entry = self._get_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._get_cache[key]
+                return None
+            content = entry[1]
+        return _json.loads(content)
+
+    def _cache_put(self, key: tuple, content: bytes) -> None:
+        """Cache raw GET response bytes for GET_CACHE_TTL seconds.
+
+        Every entry shares the same TTL and is re-inserted at the end, so the
+        dict stays in expiry order: expired entries are purged from the front,
+        and the oldest entry is evicted when the cache is full.
+        """
+        now = time.monotonic()
+        with self._get_cache_lock:
+            self._get_cache.pop(key, None)
+            while self._get_cache:
+                oldest = next(iter(self._get_cache))
+                if self._get_cache[oldest][0] > now and len(self._get_cache) < self.GET_CACHE_MAXSIZE:
+                    break
+                del self._get_cache[oldest]
+            self._get_cache[key] = (now + self.GET_CACHE_TTL, content)
+
+    def invalidate(self, endpoint_prefix: str = "") -> None:
+        """
+        Drop cached GET responses whose endpoint starts with endpoint_prefix.
+
+        Args:
+            endpoint_prefix: Endpoint prefix to flush (e.g. "/portfolio");
+                the default empty prefix clears the whole cache
+        """
+        with self._get_cache_lock:
+            for key in [k for k in self._get_cache if k[0].startswith(endpoint_prefix)]:
+                del self._get_cache[key]
+
+    def _backoff(self, prev: float) -> float:
+        """
+        Return the next retry delay using decorrelated jitter.
+
+        Each delay is drawn from [RETRY_BACKOFF_BASE, 3 * prev] and capped at
+        MAX_BACKOFF, so clients retrying after the same outage spread out
+        instead of hitting the API in lockstep.
+        """
+        return min(self.MAX_BACKOFF, random.uniform(self.RETRY_BACKOFF_BASE, prev * 3))
+
     def _parse_error_response(self, response: requests.Response) -> dict:
         """Parse error response body."""
         try:
-            data = response.json()
+            data = _json.loads(response.content)
             # Handle nested error format: {"error": {"code": ..., "message": ..., "details": ...}}
             if "error" in data and isinstance(data["error"], dict):
                 error = data["error"]
@@ -363,6 +625,7 @@ class KalshiClient:
         event_ticker: Optional[str] = None,
         series_ticker: Optional[str] = None,
         status: Optional[str] = None,
+        tickers: Optional[list] = None,
     ) -> dict:
         """
         Get available markets.
@@ -373,6 +636,7 @@ class KalshiClient:
             event_ticker: Filter by event ticker
             series_ticker: Filter by series ticker
             status: Filter by market status (open, closed, settled)
+            tickers: List of specific market tickers to fetch
 
         Returns:
             dict with:
@@ -388,6 +652,8 @@ class KalshiClient:
             params["series_ticker"] = series_ticker
         if status:
             params["status"] = status
+        if tickers:
+            params["tickers"] = ",".join(tickers)
 
         return self._make_request("GET", "/markets", params=params)
 
@@ -491,6 +757,48 @@ class KalshiClient:
             params["end_ts"] = end_ts
         return self._make_request("GET", "/markets/candlesticks", params=params)
 
+    def get_batch_historical_candlesticks(
+        self,
+        tickers: list,
+        period_interval: int = 1440,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+    ) -> dict:
+        """Fetch historical OHLC candlesticks for several tickers.
+
+        Kalshi has no batch historical endpoint, so this fans out to
+        GET /historical/markets/{ticker}/candlesticks on a thread pool and
+        mirrors get_batch_candlesticks' response shape. Tickers whose request
+        fails are logged and left out of the result.
+        Returns: {"candlesticks": {ticker: [...]}}
+        """
+        if not tickers:
+            raise KalshiAPIError("tickers list must not be empty")
+
+        def fetch(ticker: str) -> Optional[list]:
+            try:
+                resp = self.get_market_candlesticks(
+                    ticker,
+                    period_interval=period_interval,
+                    start_ts=start_ts,
+                    end_ts=end_ts,
+                    historical=True,
+                )
+                return resp.get("candlesticks", [])
+            except KalshiAPIError as e:
+                logger.error("Historical candlestick request failed for %s: %s", ticker, e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.BATCH_FANOUT_WORKERS) as pool:
+            fetched = pool.map(fetch, tickers)
+            return {
+                "candlesticks": {
+                    ticker: candles
+                    for ticker, candles in zip(tickers, fetched)
+                    if candles is not None
+                }
+            }
+
     # -------------------------------------------------------------------------
     # Order Methods
     # -------------------------------------------------------------------------
@@ -525,20 +833,23 @@ class KalshiClient:
         Raises:
             KalshiAPIError: If order placement fails or validation fails
         """
-        # Validate side
-        if side not in ("yes", "no"):
-            raise KalshiAPIError("Side must be 'yes' or 'no'")
-
-        # Validate action
-        if action not in ("buy", "sell"):
-            raise KalshiAPIError("Action must be 'buy' or 'sell'")
+        # Validate side, action and order type with one lookup; on a miss the
+        # individual checks pick the error, in side, action, quantity, type order
+        try:
+            known_kind = (side, action, order_type) in _ORDER_KINDS
+        except TypeError:  # unhashable argument, e.g. a list
+            known_kind = False
+        if not known_kind:
+            if side not in _ORDER_SIDES:
+                raise KalshiAPIError("Side must be 'yes' or 'no'")
+            if action not in _ORDER_ACTIONS:
+                raise KalshiAPIError("Action must be 'buy' or 'sell'")
 
         # Validate quantity
         if not isinstance(quantity, int) or quantity <= 0:
             raise KalshiAPIError("Quantity must be a positive integer")
 
-        # Validate order type
-        if order_type not in ("market", "limit"):
+        if not known_kind:
             raise KalshiAPIError("Order type must be 'market' or 'limit'")
 
         # Validate price for limit orders
@@ -586,6 +897,71 @@ class KalshiClient:
         """
         return self._make_request("DELETE", f"/portfolio/orders/{order_id}")
 
+    def batch_cancel_orders(self, order_ids: list) -> dict:
+        """
+        Cancel many orders with as few requests as possible.
+
+        Sends DELETE /portfolio/orders/batched in chunks of BATCH_CANCEL_SIZE.
+        If the endpoint itself is missing (a 404/405 without a Kalshi error
+        body), the remaining orders are cancelled individually over
+        BATCH_FANOUT_WORKERS threads. Any other API error fails only its own
+        chunk: each ID in it gets an error entry and the next chunk is still
+        sent, so orders cancelled by earlier chunks are always reported.
+
+        Args:
+            order_ids: Order IDs to cancel
+
+        Returns:
+            dict with:
+            - orders: one entry per order ID, each with order_id and either
+              order (the cancelled order) or error (message string)
+
+        Raises:
+            KalshiAPIError: If order_ids is empty
+        """
+        if not order_ids:
+            raise KalshiAPIError("order_ids must not be empty")
+
+        results = []
+        for i in range(0, len(order_ids), self.BATCH_CANCEL_SIZE):
+            chunk = order_ids[i:i + self.BATCH_CANCEL_SIZE]
+            try:
+                resp = self._make_request(
+                    "DELETE", "/portfolio/orders/batched", json_data={"ids": chunk}
+                )
+            except KalshiAPIError as e:
+                if not _is_missing_endpoint(e):
+                    logger.warning("Batch cancel failed for %d orders starting at %s: %s",
+                                   len(chunk), chunk[0], e)
+                    results.extend({"order_id": oid, "error": str(e)} for oid in chunk)
+                    continue
+                logger.warning("Batch cancel unavailable; cancelling %d orders individually",
+                               len(order_ids) - i)
+                results.extend(self._cancel_orders_individually(order_ids[i:]))
+                break
+            for entry in resp.get("orders", []):
+                # The API reports per-order failures as {"code", "message"} objects;
+                # flatten them so every entry's error is a message string
+                error = entry.get("error")
+                if isinstance(error, dict):
+                    entry = {**entry, "error": _error_message(error)}
+                results.append(entry)
+
+        return {"orders": results}
+
+    def _cancel_orders_individually(self, order_ids: list) -> list:
+        """Cancel each order concurrently; failures become entries with an error."""
+        def cancel(order_id: str) -> dict:
+            try:
+                resp = self.cancel_order(order_id)
+                return {"order_id": order_id, "order": resp.get("order", resp)}
+            except KalshiAPIError as e:
+                logger.warning("Failed to cancel order %s: %s", order_id, e)
+                return {"order_id": order_id, "error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=self.BATCH_FANOUT_WORKERS) as pool:
+            return list(pool.map(cancel, order_ids))
+
     def get_order(self, order_id: str) -> dict:
         """
         Get status of a specific order.
@@ -629,6 +1005,37 @@ class KalshiClient:
 
         return self._make_request("GET", "/portfolio/orders", params=params)
 
+    def get_orders_for_tickers(
+        self,
+        tickers: set,
+        status: Optional[str] = None,
+    ) -> list:
+        """
+        Get orders across several markets in as few requests as possible.
+
+        Walks the unfiltered orders listing in pages of 1000 and filters by
+        ticker client-side, instead of one get_orders(ticker=...) call per
+        market. That trades response size for round trips and signatures:
+        prefer it when tickers is more than a handful of markets, and plain
+        get_orders(ticker=...) for a single market or when the account has
+        far more orders outside tickers than inside it.
+
+        Args:
+            tickers: Market tickers to keep
+            status: Filter by status (resting, canceled, executed)
+
+        Returns:
+            list of order objects whose ticker is in tickers, in API order
+
+        Raises:
+            KalshiAPIError: If any page request fails
+        """
+        if not tickers:
+            return []
+        tickers = set(tickers)
+        orders = iter_pages(self.get_orders, "orders", status=status, limit=1000)
+        return [o for o in orders if o.get("ticker") in tickers]
+
     # -------------------------------------------------------------------------
     # Fill Methods
     # -------------------------------------------------------------------------
@@ -664,6 +1071,29 @@ class KalshiClient:
 
         return self._make_request("GET", "/portfolio/fills", params=params)
 
+    def get_fills_for_orders(self, order_ids: set) -> list:
+        """
+        Get fills for several orders in as few requests as possible.
+
+        Same round-trip-for-bandwidth tradeoff as get_orders_for_tickers:
+        one paginated walk of the fills listing filtered client-side, rather
+        than one get_fills(order_id=...) call per order.
+
+        Args:
+            order_ids: Order IDs to keep
+
+        Returns:
+            list of fill objects whose order_id is in order_ids, in API order
+
+        Raises:
+            KalshiAPIError: If any page request fails
+        """
+        if not order_ids:
+            return []
+        order_ids = set(order_ids)
+        fills = iter_pages(self.get_fills, "fills", limit=1000)
+        return [f for f in fills if f.get("order_id") in order_ids]
+
     # -------------------------------------------------------------------------
     # Settlement Methods
     # -------------------------------------------------------------------------
@@ -690,3 +1120,110 @@ class KalshiClient:
             params["cursor"] = cursor
 
         return self._make_request("GET", "/portfolio/settlements", params=params)
+
+
+DEFAULT_MAX_PAGES = 50  # safety cap for cursor loops
+
+
+def iter_pages(
+    fetch_method: Callable[..., dict],
+    items_keys: Union[str, tuple],
+    max_pages: int = DEFAULT_MAX_PAGES,
+    **params,
+) -> Iterator[dict]:
+    """
+    Yield every item from a cursor-paginated endpoint, one page ahead.
+
+    The next page is requested on a background thread as soon as the
+    current page's cursor is known, so its round trip overlaps with
+    whatever the caller does with the current page's items. Stops at the
+    first empty page, a missing cursor, or after max_pages pages.
+
+    Args:
+        fetch_method: Client list method (e.g. client.get_fills); must accept
+            a cursor keyword argument
+        items_keys: Response key holding the page's items, or several
+            candidate keys where the first non-empty one is used
+        max_pages: Maximum number of pages to request
+        **params: Extra arguments passed to every fetch_method call
+
+    Yields:
+        Items across all pages, in API order
+
+    Raises:
+        KalshiAPIError: If any page request fails
+    """
+    if isinstance(items_keys, str):
+        items_keys = (items_keys,)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(fetch_method, cursor=None, **params)
+        pages = 1
+        while future is not None:
+            page = future.result()
+            items = next((page[k] for k in items_keys if page.get(k)), [])
+            cursor = page.get("cursor")
+            future = None
+            if cursor and items:
+                if pages < max_pages:
+                    future = pool.submit(fetch_method, cursor=cursor, **params)
+                    pages += 1
+                else:
+                    logger.warning("Stopped paginating %s after %d pages",
+                                   getattr(fetch_method, "__name__", "endpoint"), max_pages)
+            yield from items
+
+
+def _is_missing_endpoint(error: KalshiAPIError) -> bool:
+    """
+    True if error means the route does not exist, not that a resource was not found.
+
+    Kalshi answers unknown resources with a JSON {"error": {"code": ...}} body;
+    a route the server does not serve comes back 404/405 without one.
+    """
+    if error.status_code not in (404, 405):
+        return False
+    body = error.response_body or {}
+    return "error" not in body and "code" not in body
+
+
+def _error_message(error: dict) -> str:
+    """Return the readable message from an API error object, falling back to its code."""
+    return str(error.get("message") or error.get("code") or error)
+
+
+def _parse_retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Return the Retry-After header in seconds, or None if absent or unparseable.
+
+    Accepts both delay-seconds (including fractional values) and HTTP-date forms.
+    """
+    try:
+        value = response.headers["Retry-After"]
+    except (KeyError, TypeError):
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _Truncated:
+    """Log argument rendered as JSON only when formatted, cut to LIMIT characters."""
+
+    __slots__ = ("obj",)
+    LIMIT = 512
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        data = self.obj if isinstance(self.obj, bytes) else _dumps(self.obj)
+        text = data[:self.LIMIT].decode("utf-8", "replace")
+        return text + "..." if len(data) > self.LIMIT else text
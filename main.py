@@ -12,7 +12,7 @@ from kalshi_client import KalshiClient
 from trade_executor import TradeExecutor, TradeExecutionError
 from portfolio_tracker import PortfolioTracker, PortfolioError
 from trade_logger import TradeLogger
-from cli_interface import TradingCLI, confirm, format_order_summary
+from cli_interface import TradingCLI, confirm, enable_history, format_order_summary
 
 
 class MainApp:
@@ -50,6 +50,9 @@ class MainApp:
             print("  Please check your API credentials and configuration, then try again.")
             return
 
+        # Handshake with the API host while the user reads the menu
+        self.client.warm_up()
+
         print(f"\n{'='*50}")
         print("  Kalshi Trading System")
         print(f"{'='*50}")
@@ -104,6 +107,9 @@ class MainApp:
             cli.run()
         except Exception as exc:
             print(f"\n  Error in trading interface: {exc}")
+        finally:
+            # Orders placed during the session may have filled
+            self.tracker.invalidate_realized()
 
     def _view_open_orders(self) -> None:
         """Fetch and display all open orders."""
@@ -148,6 +154,7 @@ class MainApp:
 
 def main() -> None:
     """Create and run the main application."""
+    enable_history()
     app = MainApp()
     try:
         app.run()
@@ -0,0 +1,37 @@
+# market_series.py - Shared series ticker constants
+"""
+Series tickers shared by the trading CLI and the ML data pipeline.
+
+Kept in a dependency-free module so importers such as data.data_collector
+do not have to load trade_executor just to read a list of strings.
+"""
+
+# Popular series on Kalshi (searched in order)
+POPULAR_SERIES = [
+    # Crypto
+    "KXBTC",      # Bitcoin price
+    "KXETH",      # Ethereum price
+    # Financial / Economic
+    "INXD",       # S&P 500 / indexes
+    "KXFED",      # Federal Reserve
+    "KXCPI",      # Inflation / CPI
+    "KXGDP",      # GDP
+    "KXJOBS",     # Jobs / employment
+    "KXRATE",     # Interest rates
+    # Politics
+    "PRES",       # Presidential / politics
+    "KXELECT",    # Elections
+    # Sports
+    "KXNBA",      # NBA
+    "KXNFL",      # NFL
+    "KXMLB",      # MLB
+    "KXNHL",      # NHL
+    "KXSOCCER",   # Soccer
+    "KXNCAAMB",   # NCAA basketball
+    # Entertainment / Events
+    "KXFIRSTSUPERBOWLSONG",  # Super Bowl halftime
+    "KXSUPERBOWL",           # Super Bowl
+    "KXOSCARS",              # Oscars
+    "KXGRAMMYS",             # Grammys
+    "KXEMMYS",               # Emmys
+]
@@ -9,14 +9,21 @@ Provides real-time portfolio visibility including:
 - Formatted portfolio summary display
 """
 
+import copy
 import logging
-from typing import Optional
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
+from typing import Iterator, Optional
 
-from kalshi_client import KalshiClient, KalshiAPIError
+from kalshi_client import KalshiClient, KalshiAPIError, iter_pages
 
 
 logger = logging.getLogger(__name__)
 
+# Per-contract value in cents of a settled position, by (result, side)
+_SETTLED_PAYOUT = {("yes", "yes"): 100, ("no", "no"): 100}
+
 
 # =============================================================================
 # Helper Functions
@@ -34,7 +41,10 @@ def _format_dollars(cents: Optional[int]) -> str:
     """
     if cents is None:
         return "$0.00"
-    return f"${abs(cents) / 100:.2f}"
+    # Integer split keeps whole-cent amounts exact with no float round trip;
+    # computed averages can arrive as float cents, so round those first
+    dollars, rem = divmod(abs(int(round(cents))), 100)
+    return f"${dollars}.{rem:02d}"
 
 
 def _format_pnl(cents: Optional[int]) -> str:
@@ -49,18 +59,57 @@ def _format_pnl(cents: Optional[int]) -> str:
     """
     if cents is None:
         return "+$0.00"
-    if cents >= 0:
-        return f"+${cents / 100:.2f}"
-    else:
-        return f"-${abs(cents) / 100:.2f}"
+    sign = "+" if cents >= 0 else "-"
+    return f"{sign}{_format_dollars(cents)}"
+
+
+def _fee_cents(fee_cost) -> int:
+    """
+    Parse an API fee amount into cents.
 
+    Args:
+        fee_cost: Dollar amount as the API returns it (e.g. "0.0900")
+
+    Returns:
+        Fee in cents, or 0 if the value is missing or malformed
+    """
+    try:
+        return int(round(float(fee_cost) * 100))
+    except (ValueError, TypeError):
+        return 0
 
-def _print_position_line(pos: dict) -> None:
+
+def _market_pricing(market: dict) -> dict:
+    """
+    Extract the pricing fields used for P&L from a market object.
+
+    Args:
+        market: Market dict from the API (unwrapped from any "market" key)
+
+    Returns:
+        dict with keys: yes_bid, yes_ask, yes_price, last_price, status,
+        title, result.
+    """
+    return {
+        "yes_bid": market.get("yes_bid", 0),
+        "yes_ask": market.get("yes_ask", 0),
+        "yes_price": market.get("yes_price", 0),
+        "last_price": market.get("last_price", 0),
+        "status": market.get("status", "unknown"),
+        "title": market.get("title", ""),
+        "result": market.get("result", ""),
+    }
+
+
+def _format_position_lines(pos: dict) -> str:
     """
-    Print a formatted single position line.
+    Format a single position as the multi-line block shown in the summary.
 
     Args:
         pos: Position dict with ticker, title, quantity, side, cost, value, pnl, etc.
+
+    Returns:
+        The position's lines joined with newlines (no trailing newline)
     """
     ticker = pos.get("ticker", "UNKNOWN")
     title = pos.get("title", "")
@@ -75,11 +124,12 @@ def _print_position_line(pos: dict) -> None:
     # Calculate percentage return
     pnl_pct = (pnl / cost * 100) if cost else 0.0
 
-    print(f"  {ticker}")
-    if title:
-        print(f"    {title}")
-    print(f"    {quantity} {side} @ {avg_price}c  |  Cost: {_format_dollars(cost)}  |  Value: {_format_dollars(value)}")
-    print(f"    P&L: {_format_pnl(pnl)} ({pnl_pct:+.1f}%)  |  Status: {status}")
+    title_line = f"\n    {title}" if title else ""
+    return (
+        f"  {ticker}{title_line}\n"
+        f"    {quantity} {side} @ {avg_price}c  |  Cost: {_format_dollars(cost)}  |  Value: {_format_dollars(value)}\n"
+        f"    P&L: {_format_pnl(pnl)} ({pnl_pct:+.1f}%)  |  Status: {status}"
+    )
 
 
 # =============================================================================
@@ -108,22 +158,45 @@ class PortfolioTracker:
     # Maximum pages to fetch to prevent infinite loops
     MAX_PAGES = 50
 
+    # Items per page for list endpoints (the API maximum), and the default
+    # page size used for an endpoint that rejects it
+    PAGE_LIMIT = 1000
+    FALLBACK_PAGE_LIMIT = 100
+
+    # Seconds a computed realized P&L is reused; it only changes when an
+    # order fills or a market settles. 0 disables the cache.
+    REALIZED_TTL_SEC = 30.0
+
+    # Tickers per bulk GET /markets call when pricing open positions
+    MARKET_BATCH_SIZE = 100
+
+    # Concurrent single-market lookups for tickers the bulk call missed
+    PRICE_FETCH_WORKERS = 8
+
     def __init__(self, client: Optional[KalshiClient] = None):
         """
         Initialize the portfolio tracker.
 
         Args:
             client: Optional KalshiClient instance. Creates one if not provided.
+                Pass the application's shared client so the tracker's
+                concurrent lookups reuse its pooled keep-alive connections.
         """
         self.client = client or KalshiClient()
 
+        # (expires_at, realized P&L dict) from the last get_realized_pnl call
+        self._realized_cache: Optional[tuple] = None
+
+        # error_label -> page size, for endpoints that rejected PAGE_LIMIT
+        self._page_limits: dict = {}
+
     # -------------------------------------------------------------------------
     # Internal Fetchers
     # -------------------------------------------------------------------------
 
-    def _paginate(self, fetch_method, result_keys: list, error_label: str) -> list:
+    def _iter_paginated(self, fetch_method, result_keys: list, error_label: str) -> Iterator[dict]:
         """
-        Generic pagination helper for Kalshi list endpoints.
+        Yield items from a Kalshi list endpoint as each page arrives.
 
         Args:
             fetch_method: Client method to call (e.g. self.client.get_positions).
@@ -132,42 +205,60 @@ class PortfolioTracker:
                 The first key that returns a truthy value is used.
             error_label: Human-readable label for error messages (e.g. "positions").
 
-        Returns:
-            List of all items across all pages.
+        Yields:
+            Items across all pages, in API order.
 
         Raises:
             PortfolioError: If the API call fails.
         """
-        all_items = []
-        cursor = None
-
+        limit = self._page_limits.get(error_label, self.PAGE_LIMIT)
+        yielded = 0
         try:
-            for _ in range(self.MAX_PAGES):
-                result = fetch_method(limit=100, cursor=cursor)
+            try:
+                # Next page is prefetched while the current one is consumed
+                for item in iter_pages(
+                    fetch_method, tuple(result_keys), max_pages=self.MAX_PAGES, limit=limit
+                ):
+                    yielded += 1
+                    yield item
+            except KalshiAPIError as e:
+                # Only restart from the first page if nothing was handed out yet
+                if e.status_code != 400 or limit == self.FALLBACK_PAGE_LIMIT or yielded:
+                    raise
+                logger.info("Page size %d rejected for %s; retrying with %d",
+                            limit, error_label, self.FALLBACK_PAGE_LIMIT)
+                self._page_limits[error_label] = self.FALLBACK_PAGE_LIMIT
+                yield from iter_pages(
+                    fetch_method, tuple(result_keys), max_pages=self.MAX_PAGES,
+                    limit=self.FALLBACK_PAGE_LIMIT,
+                )
+        except KalshiAPIError as e:
+            logger.error("Failed to fetch %s: %s", error_label, e)
+            raise PortfolioError(f"Failed to fetch {error_label}: {e}")
 
-                # Try each possible key; fall back to empty list
-                items = None
-                for key in result_keys:
-                    items = result.get(key)
-                    if items:
-                        break
-                if not items:
-                    break
+    def _paginate(self, fetch_method, result_keys: list, error_label: str) -> list:
+        """
+        Generic pagination helper for Kalshi list endpoints.
 
-                all_items.extend(items)
+        Same arguments as _iter_paginated.
 
-                cursor = result.get("cursor")
-                if not cursor:
-                    break
+        Returns:
+            List of all items across all pages.
 
-            return all_items
-        except KalshiAPIError as e:
-            logger.error("Failed to fetch %s: %s", error_label, e)
-            raise PortfolioError(f"Failed to fetch {error_label}: {e}")
+        Raises:
+            PortfolioError: If the API call fails.
+        """
+        return list(self._iter_paginated(fetch_method, result_keys, error_label))
+
+    def _iter_all_positions(self) -> Iterator[dict]:
+        """Yield all positions page by page."""
+        return self._iter_paginated(
+            self.client.get_positions, ["market_positions", "positions"], "positions"
+        )
 
     def _fetch_all_positions(self) -> list:
         """Fetch all positions with pagination."""
-        return self._paginate(self.client.get_positions, ["market_positions", "positions"], "positions")
+        return list(self._iter_all_positions())
 
     def _fetch_all_fills(self) -> list:
         """Fetch all fills with pagination."""
@@ -193,27 +284,76 @@ class PortfolioTracker:
         """
         try:
             result = self.client.get_market(ticker)
-            market = result.get("market", result)
-            return {
-                "yes_bid": market.get("yes_bid", 0),
-                "yes_ask": market.get("yes_ask", 0),
-                "yes_price": market.get("yes_price", 0),
-                "last_price": market.get("last_price", 0),
-                "status": market.get("status", "unknown"),
-                "title": market.get("title", ""),
-                "result": market.get("result", ""),
-            }
+            return _market_pricing(result.get("market", result))
         except KalshiAPIError as e:
-            logger.error("Failed to get market price for %s: %s", ticker, e)
+            # Callers report failures, batched across positions
+            logger.debug("Failed to get market price for %s: %s", ticker, e)
             raise PortfolioError(f"Failed to get market price for {ticker}: {e}")
 
-    def _compute_fill_based_realized_pnl(self) -> dict:
+    def invalidate_prices(self) -> None:
+        """
+        Drop cached market lookups so the next summary re-prices every position.
+
+        Single-market GETs (the get_market fallback) are cached by the
+        client for GET_CACHE_TTL seconds.
+        """
+        self.client.invalidate("/markets/")
+
+    def _fetch_market_prices(self, tickers) -> dict:
+        """
+        Get current pricing for several markets in as few requests as possible.
+
+        Unique tickers are priced with bulk GET /markets calls of up to
+        MARKET_BATCH_SIZE tickers each. Any ticker the bulk response leaves
+        out (or every ticker, if a bulk call fails) falls back to single
+        get_market lookups on up to PRICE_FETCH_WORKERS threads.
+
+        Args:
+            tickers: Market tickers (duplicates are fetched once).
+
+        Returns:
+            dict mapping ticker -> market dict as returned by
+            _get_market_price, or the PortfolioError raised for that ticker.
+        """
+        unique = list(dict.fromkeys(tickers))
+        if not unique:
+            return {}
+
+        prices = {}
+        for start in range(0, len(unique), self.MARKET_BATCH_SIZE):
+            batch = unique[start:start + self.MARKET_BATCH_SIZE]
+            try:
+                result = self.client.get_markets(tickers=batch, limit=len(batch))
+            except KalshiAPIError as e:
+                logger.warning("Bulk market lookup failed, pricing individually: %s", e)
+                continue
+            for market in result.get("markets", []):
+                if market.get("ticker") in batch:
+                    prices[market["ticker"]] = _market_pricing(market)
+
+        missing = [t for t in unique if t not in prices]
+        if missing:
+            def fetch(ticker: str):
+                try:
+                    return self._get_market_price(ticker)
+                except PortfolioError as e:
+                    return e
+
+            workers = min(self.PRICE_FETCH_WORKERS, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                prices.update(zip(missing, pool.map(fetch, missing)))
+        return prices
+
+    def _compute_fill_based_realized_pnl(self, all_fills: Optional[list] = None) -> dict:
         """
         Compute realized P&L from fill data using FIFO matching.
 
-        Fetches all fills and groups them by (ticker, side). For each group
-        that has sell fills, matches buys to sells in FIFO order and computes
-        the P&L per matched unit.
+        Groups fills by (ticker, side). For each group that has sell fills,
+        matches buys to sells in FIFO order and computes the P&L per matched
+        unit.
+
+        Args:
+            all_fills: Already-fetched fills. Fetched when not provided.
 
         Returns:
             dict with:
@@ -225,52 +365,63 @@ class PortfolioTracker:
         Raises:
             PortfolioError: If fetching fills fails.
         """
-        all_fills = self._fetch_all_fills()
+        if all_fills is None:
+            all_fills = self._fetch_all_fills()
 
-        # Group fills by (ticker, side)
+        # Group fills by (ticker, side), reading each fill's fields once into
+        # (created_time, count, price, fee_cents) rows split by action. The
+        # price field is chosen once, when the group is created
         groups = {}
         for fill in all_fills:
-            key = (fill.get("ticker", "UNKNOWN"), fill.get("side", "yes"))
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(fill)
+            side = fill.get("side", "yes")
+            key = (fill.get("ticker", "UNKNOWN"), side)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = ([], [], "yes_price" if side == "yes" else "no_price")
+            buys, sells, price_field = group
+            action = fill.get("action")
+            if action != "buy" and action != "sell":
+                continue
+            row = (
+                fill.get("created_time", ""),
+                fill.get("count", 0),
+                fill.get(price_field, 0),
+                _fee_cents(fill.get("fee_cost", "0")) if action == "sell" else 0,
+            )
+            (buys if action == "buy" else sells).append(row)
 
         fill_pnl_by_ticker = {}
         total_gross_pnl = 0
         total_fees = 0
 
-        for (ticker, side), fills in groups.items():
-            buy_fills = [f for f in fills if f.get("action") == "buy"]
-            sell_fills = [f for f in fills if f.get("action") == "sell"]
-
-            if not sell_fills:
+        for (ticker, side), (buy_rows, sell_rows, _) in groups.items():
+            if not sell_rows:
                 continue
 
-            # Sort by created_time (oldest first) for FIFO matching
-            buy_fills.sort(key=lambda f: f.get("created_time", ""))
-            sell_fills.sort(key=lambda f: f.get("created_time", ""))
-
-            price_field = "yes_price" if side == "yes" else "no_price"
+            # Sort by created_time (oldest first) for FIFO matching; the sort
+            # is stable, so same-time fills keep API order
+            buy_rows.sort(key=itemgetter(0))
+            sell_rows.sort(key=itemgetter(0))
 
             # FIFO matching
             realized_pnl = 0
             total_sell_count = 0
+            fees = 0
             buy_idx = 0
             buy_remaining = 0
+            buy_price = 0
+            n_buys = len(buy_rows)
 
-            for sell in sell_fills:
-                sell_count = sell.get("count", 0)
-                sell_price = sell.get(price_field, 0)
+            for _, sell_count, sell_price, sell_fee in sell_rows:
                 total_sell_count += sell_count
+                fees += sell_fee
 
                 remaining = sell_count
-                while remaining > 0 and buy_idx < len(buy_fills):
+                while remaining > 0 and buy_idx < n_buys:
                     if buy_remaining == 0:
-                        buy_remaining = buy_fills[buy_idx].get("count", 0)
+                        _, buy_remaining, buy_price, _ = buy_rows[buy_idx]
 
                     match_qty = min(remaining, buy_remaining)
-                    buy_price = buy_fills[buy_idx].get(price_field, 0)
-
                     realized_pnl += match_qty * (sell_price - buy_price)
 
                     remaining -= match_qty
@@ -279,15 +430,6 @@ class PortfolioTracker:
                     if buy_remaining == 0:
                         buy_idx += 1
 
-            # Sum fees from sell fills
-            fees = 0
-            for sell in sell_fills:
-                fee_str = sell.get("fee_cost", "0")
-                try:
-                    fees += int(round(float(fee_str) * 100))
-                except (ValueError, TypeError):
-                    pass
-
             fill_pnl_by_ticker[ticker] = {
                 "ticker": ticker,
                 "side": side,
@@ -320,16 +462,18 @@ class PortfolioTracker:
         Raises:
             PortfolioError: If fetching positions fails.
         """
-        all_positions = self._fetch_all_positions()
-        return [p for p in all_positions if p.get("position", 0) != 0]
+        # Filtered as pages arrive; closed positions are never collected
+        return [p for p in self._iter_all_positions() if p.get("position", 0) != 0]
 
-    def calculate_position_pnl(self, pos: dict) -> dict:
+    def calculate_position_pnl(self, pos: dict, market: Optional[dict] = None) -> dict:
         """
         Calculate unrealized P&L for a single position.
 
         Args:
             pos: Position dict from the API with keys like ticker, position,
                  market_exposure, etc.
+            market: Pre-fetched pricing from _get_market_price. Looked up
+                 when not provided.
 
         Returns:
             dict with: ticker, title, quantity, side, avg_price, cost, value,
@@ -357,20 +501,17 @@ class PortfolioTracker:
         avg_price = (cost // quantity) if quantity else 0
 
         # Get current market data
-        market = self._get_market_price(ticker)
+        if market is None:
+            market = self._get_market_price(ticker)
         status = market.get("status", "unknown")
         title = market.get("title", "")
         result_value = market.get("result", "")
 
         # Calculate current value
         if result_value:
-            # Settled market
-            if result_value == "yes":
-                value = quantity * 100 if side == "yes" else 0
-            elif result_value == "no":
-                value = 0 if side == "yes" else quantity * 100
-            else:
-                value = 0
+            # Settled market: winners pay 100c, anything else (including
+            # void results) is worth nothing
+            value = quantity * _SETTLED_PAYOUT.get((result_value, side), 0)
         else:
             # Active market — use midpoint pricing
             yes_bid = market.get("yes_bid", 0)
@@ -406,7 +547,7 @@ class PortfolioTracker:
         """
         Calculate aggregate unrealized P&L across all open positions.
 
-        Positions that fail price lookup are skipped with a warning.
+        Positions that fail price lookup are skipped; one warning lists them all.
 
         Returns:
             dict with: total_cost, total_value, total_pnl, positions (list of
@@ -416,6 +557,7 @@ class PortfolioTracker:
             PortfolioError: If fetching positions fails.
         """
         positions = self.get_current_positions()
+        markets = self._fetch_market_prices(p.get("ticker", "UNKNOWN") for p in positions)
 
         total_cost = 0
         total_value = 0
@@ -425,15 +567,23 @@ class PortfolioTracker:
 
         for pos in positions:
             ticker = pos.get("ticker", "UNKNOWN")
-            try:
-                pnl_info = self.calculate_position_pnl(pos)
-                total_cost += pnl_info["cost"]
-                total_value += pnl_info["value"]
-                total_pnl += pnl_info["pnl"]
-                pnl_details.append(pnl_info)
-            except PortfolioError as e:
-                logger.warning("Skipping position %s: %s", ticker, e)
+            market = markets[ticker]
+            if isinstance(market, PortfolioError):
                 errors.append(ticker)
+                continue
+            pnl_info = self.calculate_position_pnl(pos, market=market)
+            total_cost += pnl_info["cost"]
+            total_value += pnl_info["value"]
+            total_pnl += pnl_info["pnl"]
+            pnl_details.append(pnl_info)
+
+        if errors:
+            logger.warning("Skipping %d position(s) that could not be priced: %s",
+                           len(errors), ", ".join(errors))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Pricing errors: %s", "; ".join(
+                    str(markets[t]) for t in dict.fromkeys(errors)
+                ))
 
         return {
             "total_cost": total_cost,
@@ -454,11 +604,54 @@ class PortfolioTracker:
             dict with: gross_pnl (total profit/loss before fees), total_fees,
             net_pnl (gross - fees), settlements (list of per-entry dicts
             with a "source" key indicating "settlement" or "fills").
+            Reused for REALIZED_TTL_SEC seconds; see invalidate_realized().
 
         Raises:
             PortfolioError: If fetching settlements or fills fails.
         """
-        all_settlements = self._fetch_all_settlements()
+        cached = self._cached_realized()
+        if cached is not None:
+            return cached
+        return self._cache_realized(self._compute_realized_pnl())
+
+    def invalidate_realized(self) -> None:
+        """Drop the cached realized P&L so the next call refetches settlements and fills."""
+        self._realized_cache = None
+
+    def _cached_realized(self) -> Optional[dict]:
+        """Return a copy of the cached realized P&L, or None if absent or expired."""
+        cached = self._realized_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return copy.deepcopy(cached[1])
+        return None
+
+    def _cache_realized(self, realized: dict) -> dict:
+        """Store realized P&L for REALIZED_TTL_SEC seconds and return it."""
+        if self.REALIZED_TTL_SEC > 0:
+            self._realized_cache = (
+                time.monotonic() + self.REALIZED_TTL_SEC, copy.deepcopy(realized)
+            )
+        return realized
+
+    def _compute_realized_pnl(self, prefetched: Optional[tuple] = None) -> dict:
+        """
+        Aggregate realized P&L from settlements and fills, uncached.
+
+        Args:
+            prefetched: (settlements_future, fills_future) already in flight.
+                When not provided, both endpoints are walked concurrently here.
+        """
+        if prefetched is not None:
+            settlements_future, fills_future = prefetched
+            all_settlements = settlements_future.result()
+            all_fills = fills_future.result()
+        else:
+            # Settlements and fills are independent paginated endpoints: walk
+            # both at once
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                fills_future = pool.submit(self._fetch_all_fills)
+                all_settlements = self._fetch_all_settlements()
+                all_fills = fills_future.result()
 
         gross_pnl = 0
         total_fees = 0
@@ -470,12 +663,8 @@ class PortfolioTracker:
             no_cost = s.get("no_total_cost", 0)
             total_cost = yes_cost + no_cost
 
-            # Parse fee_cost — API returns it as a dollar string like "0.0900"
-            fee_str = s.get("fee_cost", "0")
-            try:
-                fees = int(round(float(fee_str) * 100))
-            except (ValueError, TypeError):
-                fees = 0
+            # API returns fee_cost as a dollar string like "0.0900"
+            fees = _fee_cents(s.get("fee_cost", "0"))
 
             pnl = revenue - total_cost
 
@@ -493,7 +682,7 @@ class PortfolioTracker:
             total_fees += fees
 
         # Compute fill-based realized P&L for positions sold before settlement
-        fill_results = self._compute_fill_based_realized_pnl()
+        fill_results = self._compute_fill_based_realized_pnl(all_fills)
 
         settled_tickers = {d["ticker"] for d in settlement_details}
         fill_tickers = set(fill_results["fill_pnl_by_ticker"].keys())
@@ -538,24 +727,13 @@ class PortfolioTracker:
             "settlements": settlement_details,
         }
 
-    def display_portfolio_summary(self) -> None:
-        """
-        Print a formatted portfolio summary to stdout.
-
-        Includes account balance, open positions with unrealized P&L,
-        and realized P&L summary.
-        """
-        sep = "=" * 60
-        dash = "-" * 56
-
-        print(sep)
-        print("  Portfolio Summary")
-        print(sep)
-        print()
-
+    def _print_balance_and_positions(
+        self, balance_future: Future, pnl_future: Future, dash: str
+    ) -> None:
+        """Print the balance and open-position sections from in-flight fetches."""
         # Account balance
         try:
-            balance_data = self.client.get_balance()
+            balance_data = balance_future.result()
             balance = balance_data.get("balance", 0)
             portfolio_value = balance_data.get("portfolio_value", 0)
             total_value = balance + portfolio_value
@@ -576,13 +754,12 @@ class PortfolioTracker:
         print()
 
         try:
-            pnl_data = self.calculate_total_pnl()
+            pnl_data = pnl_future.result()
             positions = pnl_data["positions"]
 
             if positions:
-                for pos_pnl in positions:
-                    _print_position_line(pos_pnl)
-                    print()
+                # One write for the whole section rather than several per position
+                print("".join(f"{_format_position_lines(p)}\n\n" for p in positions), end="")
             else:
                 print("  No open positions.")
                 print()
@@ -595,6 +772,43 @@ class PortfolioTracker:
             print("  (Could not load positions)")
             print()
 
+    def display_portfolio_summary(self, include_realized: bool = True) -> None:
+        """
+        Print a formatted portfolio summary to stdout.
+
+        Includes account balance, open positions with unrealized P&L,
+        and realized P&L summary.
+
+        Args:
+            include_realized: When False, skip the realized P&L section and
+                never paginate settlements or fills.
+        """
+        sep = "=" * 60
+        dash = "-" * 56
+
+        print(sep)
+        print("  Portfolio Summary")
+        print(sep)
+        print()
+
+        # Balance, open-position P&L, settlements and fills are independent
+        # API workflows: start them all, then print sections in the usual order
+        realized = self._cached_realized() if include_realized else None
+        prefetched = None
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            balance_future = pool.submit(self.client.get_balance)
+            pnl_future = pool.submit(self.calculate_total_pnl)
+            if include_realized and realized is None:
+                prefetched = (
+                    pool.submit(self._fetch_all_settlements),
+                    pool.submit(self._fetch_all_fills),
+                )
+            self._print_balance_and_positions(balance_future, pnl_future, dash)
+
+        if not include_realized:
+            print(sep)
+            return
+
         # Realized P&L
         print(f"  {dash}")
         print("  Realized P&L")
@@ -602,7 +816,8 @@ class PortfolioTracker:
         print()
 
         try:
-            realized = self.get_realized_pnl()
+            if realized is None:
+                realized = self._cache_realized(self._compute_realized_pnl(prefetched))
             print(f"  Gross P&L:          {_format_pnl(realized['gross_pnl'])}")
             print(f"  Fees Paid:          {_format_dollars(realized['total_fees'])}")
             print(f"  Net Realized P&L:   {_format_pnl(realized['net_pnl'])}")
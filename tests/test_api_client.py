@@ -7,9 +7,15 @@ Integration tests use the sandbox environment for live testing.
 """
 
 import base64
+import functools
+import json
+import logging
 import os
+import re
+import threading
 import pytest
-from unittest.mock import Mock, patch
+import requests
+from unittest.mock import Mock, call, patch
 from datetime import datetime, timezone
 
 # Add parent directory to path for imports
@@ -17,6 +23,23 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+@functools.lru_cache(maxsize=1)
+def _test_rsa_pem() -> str:
+    """Generate a throwaway RSA private key once per session, as PKCS8 PEM."""
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.hazmat.primitives import serialization
+
+    private_key = rsa.generate_private_key(
+        public_exponent=65537,
+        key_size=2048,
+    )
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    ).decode('utf-8')
+
+
 # =============================================================================
 # Unit Tests (mocked, no actual API calls)
 # =============================================================================
@@ -30,20 +53,7 @@ class TestKalshiClientUnit:
         with patch('kalshi_client.get_api_credentials') as mock_creds, \
              patch('kalshi_client.get_api_base_url') as mock_url:
 
-            # Generate a test RSA key
-            from cryptography.hazmat.primitives.asymmetric import rsa
-            from cryptography.hazmat.primitives import serialization
-
-            private_key = rsa.generate_private_key(
-                public_exponent=65537,
-                key_size=2048,
-            )
-            pem = private_key.private_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PrivateFormat.PKCS8,
-                encryption_algorithm=serialization.NoEncryption()
-            ).decode('utf-8')
-
+            pem = _test_rsa_pem()
             mock_creds.return_value = ("test_api_key", pem)
             mock_url.return_value = "https://demo-api.kalshi.co/trade-api/v2"
 
@@ -77,6 +87,38 @@ class TestKalshiClientUnit:
         decoded = base64.b64decode(signature)
         assert len(decoded) > 0
 
+    def test_request_signing_verifies_with_public_key(self, mock_config):
+        """Test that the shared PSS padding yields signatures the public key accepts."""
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+        from kalshi_client import KalshiClient
+
+        client = KalshiClient()
+        path = "/trade-api/v2/portfolio/balance"
+        for timestamp in (1705320000000, 1705320000001):
+            signature = base64.b64decode(client._sign_request("GET", path, timestamp))
+            client._private_key.public_key().verify(
+                signature,
+                f"{timestamp}GET{path}".encode("utf-8"),
+                padding.PSS(mgf=padding.MGF1(hashes.SHA256()),
+                            salt_length=padding.PSS.DIGEST_LENGTH),
+                hashes.SHA256(),
+            )
+
+    def test_clients_with_same_key_share_loaded_key(self, mock_config):
+        """Test that the PEM is parsed once for clients using the same key."""
+        from cryptography.hazmat.primitives import serialization
+        from kalshi_client import KalshiClient
+
+        with patch.dict('kalshi_client._PRIVATE_KEY_CACHE', clear=True), \
+             patch('kalshi_client.serialization.load_pem_private_key',
+                   wraps=serialization.load_pem_private_key) as mock_load:
+            first = KalshiClient()
+            second = KalshiClient()
+
+        assert mock_load.call_count == 1
+        assert first._private_key is second._private_key
+
     def test_auth_headers_generation(self, mock_config):
         """Test that auth headers are properly generated."""
         from kalshi_client import KalshiClient
@@ -90,145 +132,420 @@ class TestKalshiClientUnit:
         assert "KALSHI-ACCESS-TIMESTAMP" in headers
         assert headers["KALSHI-ACCESS-KEY"] == "test_api_key"
 
-    def test_place_order_validation_limit_no_price(self, mock_config):
-        """Test that limit orders require a price."""
-        from kalshi_client import KalshiClient, KalshiAPIError
+    def test_timestamp_ms_truncates_nanoseconds(self, mock_config):
+        """Timestamp is exact integer milliseconds from time_ns, with no float rounding."""
+        from kalshi_client import KalshiClient
+
+        with patch('kalshi_client.time.time_ns', return_value=1705320000123999999):
+            assert KalshiClient._timestamp_ms() == 1705320000123
+
+    def test_auth_headers_reuse_signature_within_same_millisecond(self, mock_config):
+        """Same method/path in the same millisecond is signed only once."""
+        from kalshi_client import KalshiClient
 
         client = KalshiClient()
+        client._timestamp_ms = Mock(return_value=1705320000000)
 
-        with pytest.raises(KalshiAPIError) as exc_info:
-            client.place_order(
-                ticker="TEST-TICKER",
-                side="yes",
-                quantity=1,
-                order_type="limit",
-                price=None
-            )
+        with patch.object(client, "_sign_request", wraps=client._sign_request) as mock_sign:
+            first = client._get_auth_headers("GET", "/trade-api/v2/portfolio/balance")
+            second = client._get_auth_headers("GET", "/trade-api/v2/portfolio/balance")
+            client._get_auth_headers("GET", "/trade-api/v2/portfolio/positions")
 
-        assert "Price is required for limit orders" in str(exc_info.value)
+        assert first == second
+        assert mock_sign.call_count == 2
 
-    def test_place_order_validation_invalid_side(self, mock_config):
-        """Test that side must be 'yes' or 'no'."""
-        from kalshi_client import KalshiClient, KalshiAPIError
+    def test_auth_headers_resign_when_millisecond_changes(self, mock_config):
+        """A new timestamp always produces a fresh signature."""
+        from kalshi_client import KalshiClient
 
         client = KalshiClient()
+        client._timestamp_ms = Mock(side_effect=[1705320000000, 1705320000001])
 
-        with pytest.raises(KalshiAPIError) as exc_info:
-            client.place_order(
-                ticker="TEST-TICKER",
-                side="invalid",
-                quantity=1,
-                order_type="market"
-            )
+        with patch.object(client, "_sign_request", wraps=client._sign_request) as mock_sign:
+            first = client._get_auth_headers("GET", "/trade-api/v2/portfolio/balance")
+            second = client._get_auth_headers("GET", "/trade-api/v2/portfolio/balance")
 
-        assert "Side must be 'yes' or 'no'" in str(exc_info.value)
+        assert mock_sign.call_count == 2
+        assert first["KALSHI-ACCESS-TIMESTAMP"] != second["KALSHI-ACCESS-TIMESTAMP"]
 
-    def test_place_order_validation_invalid_action(self, mock_config):
-        """Test that action must be 'buy' or 'sell'."""
-        from kalshi_client import KalshiClient, KalshiAPIError
+    def test_session_uses_sized_connection_pool(self, mock_config):
+        """Both schemes share an HTTPAdapter sized for concurrent fan-out."""
+        from kalshi_client import KalshiClient
 
         client = KalshiClient()
 
-        with pytest.raises(KalshiAPIError) as exc_info:
-            client.place_order(
-                ticker="TEST-TICKER",
-                side="yes",
-                quantity=1,
-                action="invalid",
-                order_type="market"
-            )
+        adapter = client.session.get_adapter("https://demo-api.kalshi.co")
+        assert adapter is client.session.get_adapter("http://localhost")
+        assert adapter._pool_maxsize == KalshiClient.POOL_MAXSIZE
+        assert adapter._pool_connections == KalshiClient.POOL_CONNECTIONS
 
-        assert "Action must be 'buy' or 'sell'" in str(exc_info.value)
+    def test_session_pool_maxsize_override(self, mock_config):
+        """pool_maxsize sizes the adapter for heavier concurrent workloads."""
+        from kalshi_client import KalshiClient
 
-    def test_place_order_validation_negative_quantity(self, mock_config):
-        """Test that quantity must be positive."""
+        client = KalshiClient(pool_maxsize=64)
+
+        adapter = client.session.get_adapter("https://demo-api.kalshi.co")
+        assert adapter._pool_maxsize == 64
+        assert client.session.headers["Connection"] == "keep-alive"
+
+    @pytest.mark.parametrize("kwargs, message", [
+        pytest.param(
+            {"side": "yes", "quantity": 1, "order_type": "limit", "price": None},
+            "Price is required for limit orders",
+            id="limit_no_price",
+        ),
+        pytest.param(
+            {"side": "invalid", "quantity": 1, "order_type": "market"},
+            "Side must be 'yes' or 'no'",
+            id="invalid_side",
+        ),
+        pytest.param(
+            {"side": "yes", "quantity": 1, "action": "invalid", "order_type": "market"},
+            "Action must be 'buy' or 'sell'",
+            id="invalid_action",
+        ),
+        pytest.param(
+            {"side": "no", "quantity": 1, "action": "sell", "order_type": "stop"},
+            "Order type must be 'market' or 'limit'",
+            id="invalid_order_type",
+        ),
+        pytest.param(
+            {"side": "yes", "quantity": -5, "order_type": "market"},
+            "Quantity must be a positive integer",
+            id="negative_quantity",
+        ),
+        pytest.param(
+            {"side": "yes", "quantity": 0, "order_type": "market"},
+            "Quantity must be a positive integer",
+            id="zero_quantity",
+        ),
+        pytest.param(
+            {"side": "yes", "quantity": 0, "order_type": "stop"},
+            "Quantity must be a positive integer",
+            id="bad_quantity_reported_before_order_type",
+        ),
+        pytest.param(
+            {"side": ["yes"], "quantity": 1, "order_type": "market"},
+            "Side must be 'yes' or 'no'",
+            id="unhashable_side",
+        ),
+        pytest.param(
+            {"side": "yes", "quantity": 1, "order_type": "limit", "price": 150},
+            "Price must be an integer between 1 and 99",
+            id="price_too_high",
+        ),
+        pytest.param(
+            {"side": "yes", "quantity": 1, "order_type": "limit", "price": 0},
+            "Price must be an integer between 1 and 99",
+            id="price_too_low",
+        ),
+    ])
+    def test_place_order_validation(self, mock_config, kwargs, message):
+        """Test that place_order validates side, action, type, quantity and price."""
         from kalshi_client import KalshiClient, KalshiAPIError
 
         client = KalshiClient()
 
-        with pytest.raises(KalshiAPIError) as exc_info:
-            client.place_order(
-                ticker="TEST-TICKER",
-                side="yes",
-                quantity=-5,
-                order_type="market"
-            )
+        with pytest.raises(KalshiAPIError, match=re.escape(message)):
+            client.place_order(ticker="TEST-TICKER", **kwargs)
 
-        assert "Quantity must be a positive integer" in str(exc_info.value)
+    @patch('requests.Session.request')
+    def test_retry_on_server_error(self, mock_request, mock_config):
+        """Test that client retries on 500 errors."""
+        from kalshi_client import KalshiClient
 
-    def test_place_order_validation_zero_quantity(self, mock_config):
-        """Test that quantity cannot be zero."""
-        from kalshi_client import KalshiClient, KalshiAPIError
+        # First two calls return 500, third succeeds
+        mock_response_500 = Mock()
+        mock_response_500.status_code = 500
+
+        mock_response_200 = Mock()
+        mock_response_200.status_code = 200
+        mock_response_200.content = b'{"balance": 10000}'
+
+        mock_request.side_effect = [mock_response_500, mock_response_500, mock_response_200]
 
         client = KalshiClient()
+        # Reduce backoff for faster tests
+        client.RETRY_BACKOFF_BASE = 0.01
 
-        with pytest.raises(KalshiAPIError) as exc_info:
-            client.place_order(
-                ticker="TEST-TICKER",
-                side="yes",
-                quantity=0,
-                order_type="market"
-            )
+        result = client.get_balance()
 
-        assert "Quantity must be a positive integer" in str(exc_info.value)
+        assert result == {"balance": 10000}
+        assert mock_request.call_count == 3
 
-    def test_place_order_validation_price_too_high(self, mock_config):
-        """Test that price must be <= 99."""
-        from kalshi_client import KalshiClient, KalshiAPIError
+    @patch('kalshi_client.time.sleep')
+    @patch('requests.Session.request')
+    def test_retry_on_server_error_honors_retry_after(self, mock_request, mock_sleep, mock_config):
+        """Test that a Retry-After header on a 5xx response sets the wait."""
+        from kalshi_client import KalshiClient
+
+        mock_response_503 = Mock()
+        mock_response_503.status_code = 503
+        mock_response_503.headers = {"Retry-After": "2"}
+
+        mock_response_200 = Mock()
+        mock_response_200.status_code = 200
+        mock_response_200.content = b'{"balance": 10000}'
+
+        mock_request.side_effect = [mock_response_503, mock_response_200]
 
         client = KalshiClient()
+        result = client.get_balance()
 
-        with pytest.raises(KalshiAPIError) as exc_info:
-            client.place_order(
-                ticker="TEST-TICKER",
-                side="yes",
-                quantity=1,
-                order_type="limit",
-                price=150
-            )
+        assert result == {"balance": 10000}
+        mock_sleep.assert_called_once_with(2.0)
 
-        assert "Price must be an integer between 1 and 99" in str(exc_info.value)
+    def test_backoff_jitter_within_bounds_and_capped(self, mock_config):
+        """Test that jittered backoff stays between the base and the cap."""
+        from kalshi_client import KalshiClient
 
-    def test_place_order_validation_price_too_low(self, mock_config):
-        """Test that price must be >= 1."""
-        from kalshi_client import KalshiClient, KalshiAPIError
+        client = KalshiClient()
+        prev = client.RETRY_BACKOFF_BASE
+        for _ in range(50):
+            wait = client._backoff(prev)
+            assert client.RETRY_BACKOFF_BASE <= wait <= min(client.MAX_BACKOFF, prev * 3)
+            prev = wait
+        assert client._backoff(client.MAX_BACKOFF) <= client.MAX_BACKOFF
+
+    @patch('requests.Session.send')
+    def test_request_carries_session_and_auth_headers(self, mock_send, mock_config):
+        """Test that the sent request merges session headers with auth headers."""
+        from kalshi_client import KalshiClient
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"balance": 10000}'
+        mock_send.return_value = mock_response
 
         client = KalshiClient()
+        client.get_balance()
 
-        with pytest.raises(KalshiAPIError) as exc_info:
-            client.place_order(
-                ticker="TEST-TICKER",
-                side="yes",
-                quantity=1,
-                order_type="limit",
-                price=0
-            )
+        prepared = mock_send.call_args[0][0]
+        assert prepared.url.endswith("/portfolio/balance")
+        assert prepared.headers["Content-Type"] == "application/json"
+        assert prepared.headers["KALSHI-ACCESS-KEY"] == "test_api_key"
+        assert "KALSHI-ACCESS-SIGNATURE" in prepared.headers
+
+    @patch('requests.Session.head')
+    def test_warm_up_opens_connection_in_background(self, mock_head, mock_config):
+        """Test that warm_up pre-connects to the API host off the caller's thread."""
+        from kalshi_client import KalshiClient
+
+        client = KalshiClient()
+        client.warm_up().join(timeout=5)
+
+        mock_head.assert_called_once_with(client.base_url, timeout=10)
+
+    @patch('requests.Session.head')
+    def test_warm_up_swallows_connection_errors(self, mock_head, mock_config):
+        """Test that a failed warm-up never surfaces to the caller."""
+        from kalshi_client import KalshiClient
+
+        mock_head.side_effect = requests.exceptions.ConnectionError("down")
+
+        client = KalshiClient()
+        thread = client.warm_up()
+        thread.join(timeout=5)
 
-        assert "Price must be an integer between 1 and 99" in str(exc_info.value)
+        assert not thread.is_alive()
 
     @patch('requests.Session.request')
-    def test_retry_on_server_error(self, mock_request, mock_config):
-        """Test that client retries on 500 errors."""
+    def test_make_request_get_omits_body(self, mock_request, mock_config):
+        """Test that bodyless requests don't thread a data kwarg."""
         from kalshi_client import KalshiClient
 
-        # First two calls return 500, third succeeds
-        mock_response_500 = Mock()
-        mock_response_500.status_code = 500
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"balance": 10000}'
+        mock_request.return_value = mock_response
 
-        mock_response_200 = Mock()
-        mock_response_200.status_code = 200
-        mock_response_200.json.return_value = {"balance": 10000}
+        client = KalshiClient()
+        client.get_balance()
 
-        mock_request.side_effect = [mock_response_500, mock_response_500, mock_response_200]
+        assert "data" not in mock_request.call_args[1]
+
+    @patch('requests.Session.request')
+    def test_get_cache_reuses_recent_response(self, mock_request, mock_config):
+        """Test that a repeated GET within the TTL is served from cache."""
+        from kalshi_client import KalshiClient
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"balance": 10000}'
+        mock_request.return_value = mock_response
 
         client = KalshiClient()
-        # Reduce backoff for faster tests
-        client.RETRY_BACKOFF_BASE = 0.01
 
-        result = client.get_balance()
+        assert client.get_balance() == client.get_balance() == {"balance": 10000}
+        assert mock_request.call_count == 1
 
-        assert result == {"balance": 10000}
-        assert mock_request.call_count == 3
+    @patch('requests.Session.request')
+    def test_get_cache_expires_after_ttl(self, mock_request, mock_config):
+        """Test that a cached GET is refetched once the TTL has passed."""
+        from kalshi_client import KalshiClient
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"balance": 10000}'
+        mock_request.return_value = mock_response
+
+        client = KalshiClient()
+        with patch('kalshi_client.time.monotonic', return_value=100.0) as mock_clock:
+            client.get_balance()
+            mock_clock.return_value = 100.0 + client.GET_CACHE_TTL
+            client.get_balance()
+
+        assert mock_request.call_count == 2
+
+    @patch('requests.Session.request')
+    def test_get_cache_returns_independent_copies(self, mock_request, mock_config):
+        """Test that mutating a cached response does not leak into the next hit."""
+        from kalshi_client import KalshiClient
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"market": {"ticker": "KXBTC"}}'
+        mock_request.return_value = mock_response
+
+        client = KalshiClient()
+        first = client.get_market("KXBTC")
+        first["market"]["ticker"] = "MUTATED"
+
+        assert client.get_market("KXBTC") == {"market": {"ticker": "KXBTC"}}
+        assert mock_request.call_count == 1
+
+    @patch('requests.Session.request')
+    def test_get_cache_skips_bulk_endpoints(self, mock_request, mock_config):
+        """Test that candlestick and market-list GETs are never cached."""
+        from kalshi_client import KalshiClient
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"candlesticks": {}, "markets": []}'
+        mock_request.return_value = mock_response
+
+        client = KalshiClient()
+        for _ in range(2):
+            client.get_batch_candlesticks(["KXBTC-A"], start_ts=1, end_ts=2)
+            client.get_market_candlesticks("KXBTC-A", start_ts=1, end_ts=2)
+            client.get_markets(series_ticker="KXBTC")
+
+        assert mock_request.call_count == 6
+        assert client._get_cache == {}
+
+    def test_get_cache_put_purges_expired_entries(self, mock_config):
+        """Test that storing a response drops every expired entry."""
+        from kalshi_client import KalshiClient
+
+        client = KalshiClient()
+        with patch('kalshi_client.time.monotonic', return_value=100.0) as mock_clock:
+            for i in range(500):
+                client._cache_put((f"/markets/T{i}", ()), b"{}")
+            mock_clock.return_value = 100.0 + client.GET_CACHE_TTL
+            client._cache_put(("/portfolio/balance", ()), b"{}")
+
+        assert list(client._get_cache) == [("/portfolio/balance", ())]
+
+    @patch('requests.Session.request')
+    def test_write_request_invalidates_portfolio_cache(self, mock_request, mock_config):
+        """Test that an order write flushes cached /portfolio responses only."""
+        from kalshi_client import KalshiClient
+
+        def respond(method, url, **kwargs):
+            response = Mock()
+            response.status_code = 200
+            response.content = b'{"ok": true}'
+            return response
+
+        mock_request.side_effect = respond
+
+        client = KalshiClient()
+        client.get_balance()
+        client.get_market("KXBTC")
+        client.cancel_order("order-1")
+        client.get_balance()
+        client.get_market("KXBTC")
+
+        urls = [c[1]["url"] for c in mock_request.call_args_list]
+        assert sum(u.endswith("/portfolio/balance") for u in urls) == 2
+        assert sum(u.endswith("/markets/KXBTC") for u in urls) == 1
+
+    @patch('requests.Session.send')
+    def test_place_order_sends_compact_json_body(self, mock_send, mock_config):
+        """Test that order payloads go out as compact JSON bytes."""
+        from kalshi_client import KalshiClient
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"order": {"order_id": "abc"}}'
+        mock_send.return_value = mock_response
+
+        client = KalshiClient()
+        client.place_order(ticker="TEST-TICKER", side="yes", quantity=2,
+                           order_type="limit", price=40)
+
+        prepared = mock_send.call_args[0][0]
+        assert isinstance(prepared.body, bytes)
+        assert b", " not in prepared.body and b": " not in prepared.body
+        assert json.loads(prepared.body)["yes_price"] == 40
+        assert prepared.headers["Content-Type"] == "application/json"
+
+    @patch('requests.Session.request')
+    def test_debug_log_truncates_large_params(self, mock_request, mock_config, caplog):
+        """Test that DEBUG request logging renders params as truncated JSON."""
+        from kalshi_client import KalshiClient, _Truncated
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"markets": [], "cursor": ""}'
+        mock_request.return_value = mock_response
+
+        client = KalshiClient()
+        tickers = [f"KXBTC-{i:04d}" for i in range(200)]
+        with caplog.at_level(logging.DEBUG, logger="kalshi_client"):
+            client.get_historical_markets(tickers=tickers)
+
+        message = next(r.getMessage() for r in caplog.records
+                       if r.getMessage().startswith("Query params:"))
+        assert message.endswith("...")
+        assert len(message) <= len("Query params: ") + _Truncated.LIMIT + 3
+
+    def test_rate_limiter_throttles_after_burst(self):
+        """Test that requests past the burst wait for their reserved slot."""
+        from kalshi_client import _RateLimiter
+
+        now = [100.0]
+        sleeps = []
+        limiter = _RateLimiter(2.0, clock=lambda: now[0], sleep=sleeps.append)
+
+        for _ in range(4):
+            limiter.acquire()
+
+        # Two go out immediately, then one slot every 0.5s
+        assert sleeps == [0.5, 1.0]
+
+        now[0] += 5.0
+        limiter.acquire()
+        assert len(sleeps) == 2
+
+    @patch('requests.Session.request')
+    def test_requests_pass_through_rate_limiter(self, mock_request, mock_config):
+        """Test that every attempt acquires a limiter slot, and 0 disables it."""
+        from kalshi_client import KalshiClient
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"balance": 10000}'
+        mock_request.return_value = mock_response
+
+        client = KalshiClient(rate_per_sec=5)
+        client._rate_limiter = Mock()
+        client.get_market("KXBTC-A")
+        client.get_market("KXBTC-B")
+        assert client._rate_limiter.acquire.call_count == 2
+
+        assert KalshiClient(rate_per_sec=0)._rate_limiter is None
 
     @patch('requests.Session.request')
     def test_no_retry_on_401(self, mock_request, mock_config):
@@ -241,11 +558,10 @@ class TestKalshiClientUnit:
 
         client = KalshiClient()
 
-        with pytest.raises(KalshiAPIError) as exc_info:
+        with pytest.raises(KalshiAPIError, match="Authentication failed") as exc_info:
             client.get_balance()
 
         assert exc_info.value.status_code == 401
-        assert "Authentication failed" in str(exc_info.value)
         # Should only try once
         assert mock_request.call_count == 1
 
@@ -260,7 +576,7 @@ class TestKalshiClientUnit:
 
         mock_response_200 = Mock()
         mock_response_200.status_code = 200
-        mock_response_200.json.return_value = {"balance": 10000}
+        mock_response_200.content = b'{"balance": 10000}'
 
         mock_request.side_effect = [mock_response_429, mock_response_200]
 
@@ -271,6 +587,45 @@ class TestKalshiClientUnit:
         assert result == {"balance": 10000}
         assert mock_request.call_count == 2
 
+    @patch('kalshi_client.time.sleep')
+    @patch('requests.Session.request')
+    def test_rate_limit_fractional_retry_after(self, mock_request, mock_sleep, mock_config):
+        """Test that a fractional Retry-After on a 429 is honored, not a crash."""
+        from kalshi_client import KalshiClient
+
+        mock_response_429 = Mock()
+        mock_response_429.status_code = 429
+        mock_response_429.headers = {"Retry-After": "1.5"}
+
+        mock_response_200 = Mock()
+        mock_response_200.status_code = 200
+        mock_response_200.content = b'{"balance": 10000}'
+
+        mock_request.side_effect = [mock_response_429, mock_response_200]
+
+        client = KalshiClient()
+        result = client.get_balance()
+
+        assert result == {"balance": 10000}
+        mock_sleep.assert_called_once_with(1.5)
+
+    @patch('kalshi_client.time.sleep')
+    @patch('requests.Session.request')
+    def test_rate_limit_unparseable_retry_after_uses_default(self, mock_request, mock_sleep, mock_config):
+        """Test that a past HTTP-date waits 0s and garbage falls back to the default."""
+        from kalshi_client import KalshiClient
+
+        past_date = Mock(status_code=429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        garbage = Mock(status_code=429, headers={"Retry-After": "soon"})
+        ok = Mock(status_code=200, content=b'{"balance": 10000}')
+        mock_request.side_effect = [past_date, garbage, ok]
+
+        client = KalshiClient()
+        assert client.get_balance() == {"balance": 10000}
+
+        waits = [c[0][0] for c in mock_sleep.call_args_list]
+        assert waits == [0.0, client.DEFAULT_RATE_LIMIT_WAIT]
+
     @patch('requests.Session.request')
     def test_error_parsing(self, mock_request, mock_config):
         """Test that API errors are parsed into exceptions."""
@@ -278,16 +633,43 @@ class TestKalshiClientUnit:
 
         mock_response = Mock()
         mock_response.status_code = 400
-        mock_response.json.return_value = {"message": "Invalid ticker"}
+        mock_response.content = b'{"message": "Invalid ticker"}'
         mock_request.return_value = mock_response
 
         client = KalshiClient()
 
-        with pytest.raises(KalshiAPIError) as exc_info:
+        with pytest.raises(KalshiAPIError, match="Invalid ticker") as exc_info:
             client.get_market("INVALID")
 
         assert exc_info.value.status_code == 400
-        assert "Invalid ticker" in str(exc_info.value)
+
+    @patch('requests.Session.request')
+    def test_invalid_json_raises_api_error(self, mock_request, mock_config):
+        """Test that a malformed success body raises KalshiAPIError."""
+        from kalshi_client import KalshiClient, KalshiAPIError
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b"<html>gateway</html>"
+        mock_request.return_value = mock_response
+
+        client = KalshiClient()
+
+        with pytest.raises(KalshiAPIError, match="Invalid JSON") as exc_info:
+            client.get_balance()
+
+        assert exc_info.value.status_code == 200
+
+    def test_json_codec_falls_back_to_stdlib_without_orjson(self):
+        """Test that the stdlib fallback parses bytes and emits compact bytes."""
+        from kalshi_client import _json_codec
+
+        with patch.dict(sys.modules, {"orjson": None}):
+            codec, dumps = _json_codec()
+
+        assert codec.__name__ == "json"
+        assert codec.loads(b'{"balance": 10000}') == {"balance": 10000}
+        assert dumps({"ticker": "KXBTC", "count": 2}) == b'{"ticker":"KXBTC","count":2}'
 
     @patch('requests.Session.request')
     def test_204_no_content(self, mock_request, mock_config):
@@ -345,19 +727,7 @@ class TestKalshiClientHistoricalMethods:
         """Mock config module — identical to TestKalshiClientUnit fixture."""
         with patch('kalshi_client.get_api_credentials') as mock_creds, \
              patch('kalshi_client.get_api_base_url') as mock_url:
-            from cryptography.hazmat.primitives.asymmetric import rsa
-            from cryptography.hazmat.primitives import serialization
-
-            private_key = rsa.generate_private_key(
-                public_exponent=65537,
-                key_size=2048,
-            )
-            pem = private_key.private_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PrivateFormat.PKCS8,
-                encryption_algorithm=serialization.NoEncryption()
-            ).decode('utf-8')
-
+            pem = _test_rsa_pem()
             mock_creds.return_value = ("test_api_key", pem)
             mock_url.return_value = "https://demo-api.kalshi.co/trade-api/v2"
             yield
@@ -399,6 +769,13 @@ class TestKalshiClientHistoricalMethods:
         call_args = client._make_request.call_args
         assert call_args[1]["params"]["tickers"] == "KXBTC-A,KXBTC-B"
 
+    def test_get_markets_with_tickers_list(self, client):
+        client._make_request = Mock(return_value={"markets": [], "cursor": ""})
+        client.get_markets(tickers=["KXBTC-A", "KXBTC-B"], limit=2)
+        call_args = client._make_request.call_args
+        assert call_args[0][1] == "/markets"
+        assert call_args[1]["params"] == {"limit": 2, "tickers": "KXBTC-A,KXBTC-B"}
+
     def test_get_market_candlesticks_live_path(self, client):
         client._make_request = Mock(return_value={"candlesticks": []})
         client.get_market_candlesticks("KXBTC-25DEC", historical=False)
@@ -468,6 +845,183 @@ class TestKalshiClientHistoricalMethods:
         with pytest.raises(KalshiAPIError, match="empty"):
             client.get_batch_candlesticks([])
 
+    def test_get_batch_historical_candlesticks_fans_out_per_ticker(self, client):
+        client._make_request = Mock(side_effect=lambda method, endpoint, params: {
+            "candlesticks": [{"endpoint": endpoint, "start_ts": params["start_ts"]}]
+        })
+        result = client.get_batch_historical_candlesticks(["KXBTC-A", "KXBTC-B"], start_ts=1000)
+        assert client._make_request.call_count == 2
+        assert result["candlesticks"]["KXBTC-A"] == [
+            {"endpoint": "/historical/markets/KXBTC-A/candlesticks", "start_ts": 1000}
+        ]
+        assert list(result["candlesticks"]) == ["KXBTC-A", "KXBTC-B"]
+
+    def test_get_batch_historical_candlesticks_omits_failed_tickers(self, client):
+        from kalshi_client import KalshiAPIError
+
+        def fake_request(method, endpoint, params):
+            if "KXBTC-A" in endpoint:
+                raise KalshiAPIError("not found", status_code=404)
+            return {"candlesticks": []}
+
+        client._make_request = Mock(side_effect=fake_request)
+        result = client.get_batch_historical_candlesticks(["KXBTC-A", "KXBTC-B"])
+        assert result == {"candlesticks": {"KXBTC-B": []}}
+
+    def test_get_batch_historical_candlesticks_raises_on_empty_tickers(self, client):
+        from kalshi_client import KalshiAPIError
+        with pytest.raises(KalshiAPIError, match="empty"):
+            client.get_batch_historical_candlesticks([])
+
+    def test_batch_cancel_orders_chunks_ids(self, client):
+        client.BATCH_CANCEL_SIZE = 2
+        client._make_request = Mock(side_effect=lambda method, endpoint, json_data: {
+            "orders": [{"order_id": oid} for oid in json_data["ids"]]
+        })
+        result = client.batch_cancel_orders(["o1", "o2", "o3"])
+        assert client._make_request.call_count == 2
+        assert client._make_request.call_args_list[0] == call(
+            "DELETE", "/portfolio/orders/batched", json_data={"ids": ["o1", "o2"]}
+        )
+        assert [o["order_id"] for o in result["orders"]] == ["o1", "o2", "o3"]
+
+    def test_batch_cancel_orders_flattens_api_error_objects(self, client):
+        client._make_request = Mock(return_value={"orders": [
+            {"order_id": "o1", "order": {"order_id": "o1", "status": "canceled"}},
+            {"order_id": "o2", "error": {"code": "not_found", "message": "order not found"}},
+            {"order_id": "o3", "error": {"code": "already_canceled"}},
+        ]})
+        result = client.batch_cancel_orders(["o1", "o2", "o3"])
+        assert result["orders"][0]["order"]["status"] == "canceled"
+        assert result["orders"][1] == {"order_id": "o2", "error": "order not found"}
+        assert result["orders"][2] == {"order_id": "o3", "error": "already_canceled"}
+
+    def test_batch_cancel_orders_api_not_found_records_error(self, client):
+        from kalshi_client import KalshiAPIError
+        client._make_request = Mock(side_effect=KalshiAPIError(
+            "order not found", status_code=404,
+            response_body={"error": {"code": "not_found"}, "message": "order not found"},
+        ))
+        client.cancel_order = Mock()
+        result = client.batch_cancel_orders(["o1"])
+        assert result == {"orders": [{"order_id": "o1", "error": "KalshiAPIError (404): order not found"}]}
+        client.cancel_order.assert_not_called()
+
+    def test_batch_cancel_orders_failed_chunk_keeps_earlier_results(self, client):
+        from kalshi_client import KalshiAPIError
+
+        def fake_request(method, endpoint, json_data):
+            if "o3" in json_data["ids"]:
+                raise KalshiAPIError("server error", status_code=500)
+            return {"orders": [{"order_id": oid} for oid in json_data["ids"]]}
+
+        client.BATCH_CANCEL_SIZE = 2
+        client._make_request = Mock(side_effect=fake_request)
+        client.cancel_order = Mock()
+        result = client.batch_cancel_orders(["o1", "o2", "o3", "o4", "o5"])
+        assert client._make_request.call_count == 3
+        assert result["orders"] == [
+            {"order_id": "o1"},
+            {"order_id": "o2"},
+            {"order_id": "o3", "error": "KalshiAPIError (500): server error"},
+            {"order_id": "o4", "error": "KalshiAPIError (500): server error"},
+            {"order_id": "o5"},
+        ]
+        client.cancel_order.assert_not_called()
+
+    def test_batch_cancel_orders_falls_back_when_endpoint_missing(self, client):
+        from kalshi_client import KalshiAPIError
+        def fake_cancel(order_id):
+            if order_id == "bad":
+                raise KalshiAPIError("gone", status_code=404)
+            return {"order": {"order_id": order_id, "status": "canceled"}}
+
+        client._make_request = Mock(side_effect=KalshiAPIError("not found", status_code=404))
+        client.cancel_order = Mock(side_effect=fake_cancel)
+        result = client.batch_cancel_orders(["o1", "bad"])
+        assert result["orders"][0] == {"order_id": "o1", "order": {"order_id": "o1", "status": "canceled"}}
+        assert result["orders"][1]["order_id"] == "bad"
+        assert "gone" in result["orders"][1]["error"]
+
+    def test_iter_pages_walks_all_pages_in_order(self, client):
+        from kalshi_client import iter_pages
+        pages = {
+            None: {"markets": [{"ticker": "A"}, {"ticker": "B"}], "cursor": "p2"},
+            "p2": {"markets": [{"ticker": "C"}], "cursor": ""},
+        }
+        client._make_request = Mock(
+            side_effect=lambda method, endpoint, params: pages[params.get("cursor")]
+        )
+        tickers = [m["ticker"] for m in iter_pages(client.get_markets, "markets", series_ticker="KXBTC")]
+        assert tickers == ["A", "B", "C"]
+        assert client._make_request.call_count == 2
+        assert all(c[1]["params"]["series_ticker"] == "KXBTC"
+                   for c in client._make_request.call_args_list)
+
+    def test_iter_pages_prefetches_next_page_before_yielding(self, client):
+        from kalshi_client import iter_pages
+        second_page_requested = threading.Event()
+
+        def fetch(cursor=None):
+            if cursor is None:
+                return {"fills": [{"id": 1}], "cursor": "p2"}
+            second_page_requested.set()
+            return {"fills": [{"id": 2}], "cursor": ""}
+
+        it = iter_pages(fetch, "fills")
+        assert next(it) == {"id": 1}
+        # The second page is in flight while the caller holds the first item
+        assert second_page_requested.wait(timeout=5)
+        assert list(it) == [{"id": 2}]
+
+    def test_iter_pages_propagates_page_error(self, client):
+        from kalshi_client import KalshiAPIError, iter_pages
+        client._make_request = Mock(side_effect=KalshiAPIError("server error", status_code=500))
+        with pytest.raises(KalshiAPIError):
+            list(iter_pages(client.get_fills, "fills"))
+
+    def test_iter_pages_stops_at_max_pages(self):
+        from kalshi_client import iter_pages
+        fetch = Mock(return_value={"fills": [{"id": 1}], "cursor": "again"})
+        assert len(list(iter_pages(fetch, "fills", max_pages=3))) == 3
+        assert fetch.call_count == 3
+
+    def test_iter_pages_uses_first_non_empty_key(self):
+        from kalshi_client import iter_pages
+        fetch = Mock(return_value={"market_positions": [], "positions": [{"id": 1}], "cursor": ""})
+        assert list(iter_pages(fetch, ("market_positions", "positions"))) == [{"id": 1}]
+
+    def test_get_orders_for_tickers_filters_single_listing(self, client):
+        pages = {
+            None: {"orders": [{"order_id": "o1", "ticker": "A"}, {"order_id": "o2", "ticker": "X"}],
+                   "cursor": "p2"},
+            "p2": {"orders": [{"order_id": "o3", "ticker": "B"}], "cursor": ""},
+        }
+        client._make_request = Mock(
+            side_effect=lambda method, endpoint, params: pages[params.get("cursor")]
+        )
+        result = client.get_orders_for_tickers({"A", "B"}, status="resting")
+        assert [o["order_id"] for o in result] == ["o1", "o3"]
+        assert client._make_request.call_count == 2
+        params = client._make_request.call_args_list[0][1]["params"]
+        assert params == {"limit": 1000, "status": "resting"}
+
+    def test_get_orders_for_tickers_empty_set_skips_request(self, client):
+        client._make_request = Mock()
+        assert client.get_orders_for_tickers(set()) == []
+        client._make_request.assert_not_called()
+
+    def test_get_fills_for_orders_filters_by_order_id(self, client):
+        client._make_request = Mock(return_value={
+            "fills": [{"order_id": "o1", "count": 2}, {"order_id": "o9", "count": 1}],
+            "cursor": "",
+        })
+        result = client.get_fills_for_orders(["o1"])
+        assert result == [{"order_id": "o1", "count": 2}]
+        client._make_request.assert_called_once_with(
+            "GET", "/portfolio/fills", params={"limit": 1000}
+        )
+
 
 # =============================================================================
 # Integration Tests (requires sandbox credentials)
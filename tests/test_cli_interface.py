@@ -13,7 +13,14 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import pytest
 from unittest.mock import Mock, patch
 
-from cli_interface import TradingCLI, run_trading_cli
+import cli_interface
+from cli_interface import (
+    TradingCLI,
+    format_market_block,
+    format_order_summary,
+    get_int_input,
+    run_trading_cli,
+)
 from trade_executor import TradeExecutionError
 
 
@@ -108,6 +115,34 @@ class TestSearchMarkets:
         out = capsys.readouterr().out
         assert "Error" in out or "error" in out.lower()
 
+    def test_search_markets_repeat_query_uses_cache(self):
+        """Same query/status within the TTL reuses results without a second API call."""
+        cli = _cli_with_mock_executor()
+        cli.executor.search_markets.return_value = [{"ticker": "CACHED-MKT"}]
+        with patch('builtins.input', side_effect=["btc", "1", "btc", "1"]):
+            cli._search_markets()
+            cli._search_markets()
+        assert cli.executor.search_markets.call_count == 1
+
+    def test_search_markets_expired_cache_refetches(self):
+        """Entries older than SEARCH_CACHE_TTL trigger a fresh API call."""
+        cli = _cli_with_mock_executor()
+        cli.executor.search_markets.return_value = [{"ticker": "CACHED-MKT"}]
+        with patch('builtins.input', side_effect=["btc", "1", "btc", "1"]), \
+             patch('cli_interface.time.monotonic', side_effect=[0.0, 1000.0, 1000.0]):
+            cli._search_markets()
+            cli._search_markets()
+        assert cli.executor.search_markets.call_count == 2
+
+    def test_search_cache_evicts_oldest_when_full(self):
+        """Cache never grows beyond SEARCH_CACHE_MAX entries."""
+        cli = _cli_with_mock_executor()
+        cli.executor.search_markets.return_value = []
+        for i in range(TradingCLI.SEARCH_CACHE_MAX + 5):
+            cli._cached_search(f"q{i}", "open")
+        assert len(cli._search_cache) == TradingCLI.SEARCH_CACHE_MAX
+        assert ("q0", "open", None, 50) not in cli._search_cache
+
 
 # =============================================================================
 # Group 3: Place market order (menu option 2)
@@ -139,6 +174,27 @@ class TestPlaceMarketOrder:
             cli._place_market_order()
         cli.executor.place_market_order.assert_not_called()
 
+    def test_place_market_order_reuses_cached_market_info(self):
+        """A second ticker lookup within the TTL does not call get_market_info again."""
+        cli = _cli_with_mock_executor()
+        cli.executor.get_market_info.return_value = self._open_market()
+        with patch('builtins.input', side_effect=["TEST-MKT", "yes", "5", "n",
+                                                  "TEST-MKT", "yes", "5", "n"]):
+            cli._place_market_order()
+            cli._place_market_order()
+        cli.executor.get_market_info.assert_called_once_with("TEST-MKT")
+
+    def test_place_market_order_success_invalidates_market_info(self):
+        """After a successful order the next lookup fetches fresh bid/ask."""
+        cli = _cli_with_mock_executor()
+        cli.executor.get_market_info.return_value = self._open_market()
+        cli.executor.place_market_order.return_value = {"order": {"order_id": "o1"}}
+        with patch('builtins.input', side_effect=["TEST-MKT", "yes", "5", "yes",
+                                                  "TEST-MKT", "yes", "5", "n"]):
+            cli._place_market_order()
+            cli._place_market_order()
+        assert cli.executor.get_market_info.call_count == 2
+
     def test_place_market_order_invalid_side(self, capsys):
         """Side other than 'yes'/'no' rejected before order placement."""
         cli = _cli_with_mock_executor()
@@ -253,6 +309,24 @@ class TestViewOpenOrders:
         out = capsys.readouterr().out
         assert "Error" in out or "error" in out.lower()
 
+    def test_view_open_orders_repeat_uses_cache(self):
+        """Viewing twice within the TTL lists open orders only once."""
+        cli = _cli_with_mock_executor()
+        cli.executor.list_open_orders.return_value = []
+        cli._view_open_orders()
+        cli._view_open_orders()
+        assert cli.executor.list_open_orders.call_count == 1
+
+    def test_cancel_order_invalidates_open_orders_cache(self):
+        """A successful cancel forces the next listing to hit the API."""
+        cli = _cli_with_mock_executor()
+        cli.executor.list_open_orders.return_value = []
+        cli.executor.cancel_order.return_value = {"order": {"status": "cancelled"}}
+        with patch('builtins.input', side_effect=["ord-123", "yes"]):
+            cli._cancel_order()
+        cli._view_open_orders()
+        assert cli.executor.list_open_orders.call_count == 2
+
 
 # =============================================================================
 # Group 6: Cancel order (menu option 5)
@@ -287,6 +361,46 @@ class TestCancelOrder:
         out = capsys.readouterr().out
         assert "Error" in out or "order not found" in out
 
+    def test_cancel_order_multiple_ids_uses_batch_cancel(self, capsys):
+        """Comma-separated IDs go through one executor.cancel_orders call."""
+        cli = _cli_with_mock_executor()
+        cli.executor.list_open_orders.return_value = []
+        cli.executor.cancel_orders.return_value = [
+            {"order_id": "ord-1", "order": {"status": "canceled"}},
+            {"order_id": "ord-2", "error": "gone"},
+        ]
+        with patch('builtins.input', side_effect=["ord-1, ord-2", "yes"]):
+            cli._cancel_order()
+        cli.executor.cancel_orders.assert_called_once_with(["ord-1", "ord-2"])
+        cli.executor.cancel_order.assert_not_called()
+        out = capsys.readouterr().out
+        assert "ord-1: cancelled" in out
+        assert "ord-2: failed (gone)" in out
+
+    def test_cancel_order_partial_batch_logs_only_cancelled(self, capsys):
+        """A mixed batch result reports each order and logs only the cancelled one."""
+        cli, mock_logger = _cli_with_mock_executor_and_logger()
+        cli.executor.list_open_orders.return_value = []
+        cli.executor.cancel_orders.return_value = [
+            {"order_id": "ord-1", "error": "KalshiAPIError (500): server error"},
+            {"order_id": "ord-2", "order": {"status": "canceled"}},
+        ]
+        with patch('builtins.input', side_effect=["ord-1,ord-2", "yes"]):
+            cli._cancel_order()
+        out = capsys.readouterr().out
+        assert "ord-1: failed (KalshiAPIError (500): server error)" in out
+        assert "ord-2: cancelled" in out
+        mock_logger.log_order_cancellation.assert_called_once_with("ord-2")
+
+    def test_cancel_order_batch_error_invalidates_open_orders(self):
+        """A failed batch still drops the open-orders cache."""
+        cli = _cli_with_mock_executor()
+        cli.executor.list_open_orders.return_value = []
+        cli.executor.cancel_orders.side_effect = TradeExecutionError("boom")
+        with patch('builtins.input', side_effect=["ord-1,ord-2", "yes"]):
+            cli._cancel_order()
+        assert cli._open_orders_cache is None
+
 
 # =============================================================================
 # Group 7: Check order status (menu option 6)
@@ -343,6 +457,15 @@ class TestMenuLoop:
         with patch('builtins.input', side_effect=["7"]):
             cli.run()  # must return, not raise
 
+    def test_menu_choice_dispatches_to_handler(self):
+        """Each numbered choice calls its handler from the dispatch table."""
+        cli = TradingCLI()
+        mock_handler = Mock()
+        cli._handlers["4"] = mock_handler
+        with patch('builtins.input', side_effect=["4", "7"]):
+            cli.run()
+        mock_handler.assert_called_once_with()
+
     def test_keyboard_interrupt_exits_cleanly(self, capsys):
         """KeyboardInterrupt during input is caught by run_trading_cli wrapper."""
         with patch('builtins.input', side_effect=KeyboardInterrupt()):
@@ -351,6 +474,45 @@ class TestMenuLoop:
         assert "Interrupted" in out or "Goodbye" in out
 
 
+# =============================================================================
+# Group 8b: Readline completion and history
+# =============================================================================
+
+class TestReadline:
+
+    def test_complete_ticker_matches_last_search(self):
+        """Tab completion offers tickers from the latest search, case-insensitively."""
+        cli = TradingCLI()
+        cli._last_tickers = ["KXBTC-A", "KXBTC-B", "KXETH-A"]
+        assert cli._complete_ticker("kxbtc", 0) == "KXBTC-A"
+        assert cli._complete_ticker("kxbtc", 1) == "KXBTC-B"
+        assert cli._complete_ticker("kxbtc", 2) is None
+
+    def test_enable_history_non_tty_is_noop(self, tmp_path):
+        """History is not loaded or registered for non-interactive stdin."""
+        with patch('cli_interface.sys.stdin') as mock_stdin, \
+             patch('cli_interface.atexit.register') as mock_register, \
+             patch.object(cli_interface, '_history_enabled', False):
+            mock_stdin.isatty.return_value = False
+            cli_interface.enable_history(tmp_path / "history")
+        mock_register.assert_not_called()
+
+    def test_install_completer_whitespace_delims_keep_hyphenated_tickers(self):
+        """Only whitespace splits words, so Tab completes past ticker hyphens."""
+        mock_readline = Mock(__doc__="GNU readline interface")
+        with patch.object(cli_interface, 'readline', mock_readline):
+            cli_interface._install_completer(Mock())
+        mock_readline.set_completer_delims.assert_called_once_with(" \t\n")
+        mock_readline.parse_and_bind.assert_called_once_with("tab: complete")
+
+    def test_install_completer_libedit_uses_bind_syntax(self):
+        """macOS libedit needs its own Tab binding."""
+        mock_readline = Mock(__doc__="Importing this module enables command line editing using libedit readline.")
+        with patch.object(cli_interface, 'readline', mock_readline):
+            cli_interface._install_completer(Mock())
+        mock_readline.parse_and_bind.assert_called_once_with("bind ^I rl_complete")
+
+
 # =============================================================================
 # Group 9: Logger wiring (Task 8)
 # =============================================================================
@@ -433,3 +595,62 @@ class TestLogging:
         cli.executor.cancel_order.return_value = {"order": {"status": "cancelled"}}
         with patch('builtins.input', side_effect=["cancel-no-log-1", "yes"]):
             cli._cancel_order()  # must not raise
+
+
+# =============================================================================
+# Group 10: Display helpers
+# =============================================================================
+
+class TestGetIntInput:
+
+    def test_get_int_input_retries_until_in_bounds(self, capsys):
+        """Out-of-range and non-numeric entries re-prompt with the matching error."""
+        with patch('builtins.input', side_effect=["abc", "0", "100", "42"]):
+            assert get_int_input("> ", min_val=1, max_val=99) == 42
+        out = capsys.readouterr().out
+        assert "valid number" in out
+        assert "at least 1" in out
+        assert "at most 99" in out
+
+    def test_get_int_input_unbounded_accepts_any_int(self):
+        """With no bounds any integer is accepted on the first try."""
+        with patch('builtins.input', side_effect=["-5000"]):
+            assert get_int_input("> ") == -5000
+
+
+class TestFormatMarketBlock:
+
+    def test_format_market_block_with_quotes(self):
+        """Markets with bid/ask show the YES quote line."""
+        block = format_market_block({
+            "ticker": "T-MKT", "title": "x" * 100, "status": "active",
+            "yes_bid": 45, "yes_ask": 55, "volume_24h": 10,
+        })
+        assert block.startswith("  T-MKT\n")
+        assert f"    {'x' * 70}\n" in block
+        assert "YES: 45c bid / 55c ask" in block
+
+    def test_format_market_block_without_quotes(self):
+        """Markets with no bid/ask show only status and volume."""
+        block = format_market_block({"ticker": "T-MKT", "status": "closed"})
+        assert "YES:" not in block
+        assert "Status: closed  |  24h Vol: 0" in block
+
+
+class TestFormatOrderSummary:
+
+    def test_format_order_summary_prefers_remaining_count(self):
+        """remaining_count is shown instead of count when present."""
+        line = format_order_summary({
+            "order": {"order_id": "ord-abcdefghijkl", "ticker": "T-MKT", "side": "yes",
+                      "action": "buy", "status": "resting", "count": 10,
+                      "remaining_count": 3, "yes_price": 42}
+        })
+        assert "BUY 3 YES @ 42c" in line
+        assert "[resting]" in line
+
+    def test_format_order_summary_missing_fields_use_defaults(self):
+        """Missing keys fall back to N/A, zero count, and market pricing."""
+        line = format_order_summary({})
+        assert "N/A" in line
+        assert "N/A 0 N/A @ market" in line
@@ -48,6 +48,14 @@ VALID_ENV_PRODUCTION = {
 }
 
 
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    """Reset the memoized config so each test sees its own patched env."""
+    get_config.cache_clear()
+    yield
+    get_config.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # TestGetRequired
 # ---------------------------------------------------------------------------
@@ -209,6 +217,15 @@ class TestConvenienceFunctions:
         """is_production returns False when environment is sandbox."""
         assert is_production() is False
 
+    @patch.dict(os.environ, VALID_ENV, clear=True)
+    def test_get_config_memoized_returns_same_dict(self):
+        """get_config builds the dict once and returns the cached instance."""
+        first = get_config()
+        os.environ["KALSHI_ENVIRONMENT"] = "production"
+        assert get_config() is first
+        get_config.cache_clear()
+        assert get_config()["environment"] == "production"
+
     @patch.dict(os.environ, VALID_ENV, clear=True)
     def test_validate_config_returns_true(self):
         """validate_config returns True when configuration is valid."""
@@ -1,6 +1,7 @@
 """Tests for data/data_collector.py (Task 11)."""
 
 import os
+import subprocess
 import sys
 
 import pytest
@@ -8,7 +9,9 @@ from unittest.mock import Mock, patch, call
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from kalshi_client import KalshiAPIError
+from kalshi_client import KalshiAPIError, KalshiClient
+from market_series import POPULAR_SERIES
+from trade_executor import TradeExecutor
 from data.data_collector import DataCollector, CollectionSummary
 
 
@@ -18,13 +21,19 @@ from data.data_collector import DataCollector, CollectionSummary
 
 @pytest.fixture
 def mock_client():
-    return Mock()
+    client = Mock()
+    # Run the real historical batch fan-out so tests can stub get_market_candlesticks per ticker
+    client.BATCH_FANOUT_WORKERS = KalshiClient.BATCH_FANOUT_WORKERS
+    client.get_batch_historical_candlesticks.side_effect = (
+        lambda *args, **kwargs: KalshiClient.get_batch_historical_candlesticks(client, *args, **kwargs)
+    )
+    return client
 
 
 @pytest.fixture
 def mock_store():
     store = Mock()
-    store.get_collected_tickers.return_value = set()
+    store.get_collected_tickers.return_value = frozenset()
     store.get_markets.return_value = _empty_df()
     store.save_markets.return_value = 0
     store.save_candles.return_value = 0
@@ -94,6 +103,26 @@ def _candle(ts=1000):
     }
 
 
+# ---------------------------------------------------------------------------
+# Module imports
+# ---------------------------------------------------------------------------
+
+class TestImports:
+    def test_import_does_not_load_trade_executor(self):
+        """POPULAR_SERIES comes from market_series, not trade_executor."""
+        code = "import sys, data.data_collector; print('trade_executor' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_popular_series_trade_executor_alias_is_same_list(self):
+        """TradeExecutor.POPULAR_SERIES is the market_series list, not a copy."""
+        assert TradeExecutor.POPULAR_SERIES is POPULAR_SERIES
+
+
 # ---------------------------------------------------------------------------
 # get_cutoff_ts
 # ---------------------------------------------------------------------------
@@ -130,6 +159,25 @@ class TestCollectSettledMarkets:
         mock_client.get_markets.assert_called_once()
         mock_client.get_historical_markets.assert_called_once()
 
+    def test_fetches_every_series_from_both_endpoints(self, collector, mock_client, mock_store):
+        mock_client.get_markets.return_value = {"markets": [], "cursor": ""}
+        mock_client.get_historical_markets.return_value = {"markets": [], "cursor": ""}
+
+        collector.collect_settled_markets(series_tickers=["KXBTC", "KXETH", "KXFED"])
+
+        live = {c.kwargs["series_ticker"] for c in mock_client.get_markets.call_args_list}
+        hist = {c.kwargs["series_ticker"] for c in mock_client.get_historical_markets.call_args_list}
+        assert live == hist == {"KXBTC", "KXETH", "KXFED"}
+
+    def test_historical_row_wins_over_live_duplicate(self, collector, mock_client, mock_store):
+        live = _market_dict("KXBTC-A", close_time="2099-12-01T00:00:00Z")
+        hist = dict(live, title="historical")
+        mock_client.get_markets.return_value = {"markets": [live], "cursor": ""}
+        mock_client.get_historical_markets.return_value = {"markets": [hist], "cursor": ""}
+
+        result, _ = collector.collect_settled_markets(series_tickers=["KXBTC"])
+        assert result[0]["title"] == "historical"
+
     def test_deduplicates_markets_across_endpoints(self, collector, mock_client, mock_store):
         dup = _market_dict("KXBTC-A", close_time="2025-12-01T00:00:00Z")
         mock_client.get_markets.return_value = {"markets": [dup], "cursor": ""}
@@ -152,6 +200,16 @@ class TestCollectSettledMarkets:
         assert "KXBTC-OLD" not in tickers
         assert "KXBTC-NEW" in tickers
 
+    def test_excludes_markets_with_missing_or_bad_close_time(self, collector, mock_client, mock_store):
+        good = _market_dict("KXBTC-GOOD", close_time="2099-01-01T00:00:00Z")
+        empty = _market_dict("KXBTC-EMPTY", close_time="")
+        bad = _market_dict("KXBTC-BAD", close_time="not-a-date")
+        mock_client.get_markets.return_value = {"markets": [good, empty, bad], "cursor": ""}
+        mock_client.get_historical_markets.return_value = {"markets": [], "cursor": ""}
+
+        result, _ = collector.collect_settled_markets(series_tickers=["KXBTC"])
+        assert [m["ticker"] for m in result] == ["KXBTC-GOOD"]
+
     def test_saves_filtered_markets_to_store(self, collector, mock_client, mock_store):
         mock_client.get_markets.return_value = {
             "markets": [_market_dict("KXBTC-A", close_time="2025-12-01T00:00:00Z")],
@@ -189,7 +247,7 @@ class TestCollectSettledMarkets:
 
 class TestCollectCandlesticks:
     def test_skips_tickers_already_in_store(self, collector, mock_client, mock_store):
-        mock_store.get_collected_tickers.return_value = {"KXBTC-A", "KXBTC-B"}
+        mock_store.get_collected_tickers.return_value = frozenset({"KXBTC-A", "KXBTC-B"})
         mock_client.get_historical_cutoff.return_value = {"live_cutoff_ts": 9999}
 
         result = collector.collect_candlesticks(["KXBTC-A", "KXBTC-B"])
@@ -247,6 +305,24 @@ class TestCollectCandlesticks:
         assert "KXBTC-A" in result
         assert "KXBTC-B" in result
 
+    def test_historical_fetches_concurrently_and_saves_every_ticker(
+        self, collector, mock_client, mock_store
+    ):
+        tickers = [f"KXBTC-{i:03d}" for i in range(20)]
+        future_cutoff = int(__import__("datetime").datetime(2099, 1, 1).timestamp())
+        mock_store.get_markets.return_value = _markets_df(
+            [(t, "2020-01-01T00:00:00Z") for t in tickers]
+        )
+        mock_client.get_historical_cutoff.return_value = {"live_cutoff_ts": future_cutoff}
+        mock_client.get_market_candlesticks.return_value = {"candlesticks": [_candle()]}
+        mock_store.save_candles.return_value = 1
+
+        result = collector.collect_candlesticks(tickers)
+        assert result == {t: 1 for t in tickers}
+        assert mock_client.get_market_candlesticks.call_count == 20
+        saved = {c.args[0] for c in mock_store.save_candles.call_args_list}
+        assert saved == set(tickers)
+
     def test_batches_live_tickers_in_chunks_of_100(self, collector, mock_client, mock_store):
         tickers = [f"KXBTC-{i:03d}" for i in range(150)]
         # All live (no settlement info in store → defaults to live)
@@ -257,6 +333,26 @@ class TestCollectCandlesticks:
         collector.collect_candlesticks(tickers)
         assert mock_client.get_batch_candlesticks.call_count == 2  # 100 + 50
 
+    def test_live_batches_fetched_concurrently_and_one_failure_isolated(
+        self, collector, mock_client, mock_store
+    ):
+        tickers = [f"KXBTC-{i:03d}" for i in range(250)]
+        mock_store.get_markets.return_value = _empty_df()
+        mock_client.get_historical_cutoff.return_value = {"live_cutoff_ts": 1000}
+
+        def fake_batch(batch, **kwargs):
+            if batch[0] == "KXBTC-100":
+                raise KalshiAPIError("boom", status_code=500)
+            return {"candlesticks": {t: [_candle()] for t in batch}}
+
+        mock_client.get_batch_candlesticks.side_effect = fake_batch
+        mock_store.save_candles.return_value = 1
+
+        result = collector.collect_candlesticks(tickers)
+        assert mock_client.get_batch_candlesticks.call_count == 3
+        assert sum(result.values()) == 150
+        assert all(result[f"KXBTC-{i:03d}"] == 0 for i in range(100, 200))
+
     def test_prints_start_line_and_progress_for_live_tickers(
         self, collector, mock_client, mock_store, capsys
     ):
@@ -322,6 +418,21 @@ class TestCollectCandlesticks:
         mock_client.get_market_candlesticks.assert_called_once()
         mock_client.get_batch_candlesticks.assert_not_called()
 
+    def test_unparseable_timestamp_routes_to_live(self, collector, mock_client, mock_store):
+        """A garbage timestamp is treated as unknown and goes through the live batch."""
+        future_cutoff = int(__import__("datetime").datetime(2099, 1, 1).timestamp())
+        mock_store.get_markets.return_value = _markets_df_with_close_time([
+            ("KXBTC-A", "not-a-date", ""),
+            ("KXBTC-B", "2020-01-01T00:00:00.123Z", ""),
+        ])
+        mock_client.get_historical_cutoff.return_value = {"live_cutoff_ts": future_cutoff}
+        mock_client.get_batch_candlesticks.return_value = {"candlesticks": {}}
+        mock_client.get_market_candlesticks.return_value = {"candlesticks": []}
+
+        collector.collect_candlesticks(["KXBTC-A", "KXBTC-B"])
+        assert mock_client.get_batch_candlesticks.call_args[0][0] == ["KXBTC-A"]
+        assert mock_client.get_market_candlesticks.call_args[0][0] == "KXBTC-B"
+
 
 # ---------------------------------------------------------------------------
 # run
@@ -345,6 +456,18 @@ class TestRun:
         assert isinstance(summary, CollectionSummary)
         assert summary.markets_found >= 0
 
+    def test_run_compacts_store_after_collecting_candles(self, collector, mock_client, mock_store):
+        mock_client.get_markets.return_value = {
+            "markets": [_market_dict("KXBTC-A", close_time="2099-12-01T00:00:00Z")],
+            "cursor": "",
+        }
+        mock_client.get_historical_markets.return_value = {"markets": [], "cursor": ""}
+        mock_client.get_historical_cutoff.return_value = {"live_cutoff_ts": 1000}
+        mock_client.get_batch_candlesticks.return_value = {"candlesticks": {}}
+
+        collector.run(series_tickers=["KXBTC"], days_back=180)
+        mock_store.compact.assert_called_once()
+
     def test_run_prints_summary(self, collector, mock_client, mock_store, capsys):
         mock_client.get_markets.return_value = {"markets": [], "cursor": ""}
         mock_client.get_historical_markets.return_value = {"markets": [], "cursor": ""}
@@ -2,9 +2,12 @@
 
 import os
 import sys
+from datetime import datetime, timezone
+from pathlib import Path
 
 import pandas as pd
 import pytest
+from unittest.mock import patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -79,6 +82,33 @@ class TestSaveMarkets:
         count = store.save_markets([_market("KXBTC-A")])
         assert count == 0
 
+    def test_duplicate_ticker_in_batch_keeps_last(self, store):
+        first, second = _market("KXBTC-A"), _market("KXBTC-A")
+        second["title"] = "updated"
+        count = store.save_markets([first, second])
+        df = pd.read_csv(store.markets_path)
+        assert count == 1
+        assert list(df["title"]) == ["updated"]
+
+    def test_update_replaces_existing_row_and_keeps_others(self, store):
+        store.save_markets([_market("KXBTC-A"), _market("KXBTC-B")])
+        updated = _market("KXBTC-A")
+        updated["title"] = "updated"
+        count = store.save_markets([updated, _market("KXBTC-C")])
+        df = pd.read_csv(store.markets_path)
+        assert count == 1
+        assert list(df["ticker"]) == ["KXBTC-B", "KXBTC-A", "KXBTC-C"]
+        assert df.loc[df["ticker"] == "KXBTC-A", "title"].item() == "updated"
+
+    def test_new_tickers_appended_without_full_read(self, store):
+        store.save_markets([_market("KXBTC-A")])
+        with patch("data.data_store.pd.read_csv", wraps=pd.read_csv) as mock_read:
+            count = store.save_markets([_market("KXBTC-B")])
+        assert count == 1
+        mock_read.assert_called_once()
+        assert mock_read.call_args.kwargs["usecols"] == ["ticker"]
+        assert list(pd.read_csv(store.markets_path)["ticker"]) == ["KXBTC-A", "KXBTC-B"]
+
     def test_settlement_value_dollars_converted_to_cents(self, store):
         m = _market()
         m["settlement_value_dollars"] = 0.75
@@ -91,6 +121,19 @@ class TestSaveMarkets:
         assert count == 0
         assert not os.path.exists(store.markets_path)
 
+    def test_invalid_settlement_value_stored_as_zero(self, store):
+        m = _market()
+        m["settlement_value_dollars"] = "n/a"
+        store.save_markets([m])
+        df = pd.read_csv(store.markets_path)
+        assert df.iloc[0]["settlement_value_cents"] == 0
+
+    def test_missing_text_fields_stored_as_empty(self, store):
+        store.save_markets([{"ticker": "KXBTC-A"}])
+        df = pd.read_csv(store.markets_path, keep_default_na=False)
+        assert list(df.columns) == DataStore.MARKETS_COLUMNS
+        assert df.iloc[0]["title"] == ""
+
     def test_missing_settlement_value_defaults_to_zero(self, store):
         m = _market()
         del m["settlement_value_dollars"]
@@ -115,9 +158,24 @@ class TestSaveCandles:
     def test_upsert_deduplicates_on_composite_key(self, store):
         store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
         store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
+        assert len(store.get_candles()) == 1
+        store.compact()
         df = pd.read_csv(store.candles_path)
         assert len(df) == 1
 
+    def test_appends_without_rereading_full_file(self, store):
+        store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
+        with patch("data.data_store.pd.read_csv") as mock_read:
+            store.save_candles("KXBTC-B", [_candle(2000)], granularity=1440)
+        mock_read.assert_not_called()
+        assert len(pd.read_csv(store.candles_path)) == 2
+
+    def test_updated_key_keeps_last_values(self, store):
+        store.save_candles("KXBTC-A", [_candle(1000, close=40)], granularity=1440)
+        store.save_candles("KXBTC-A", [_candle(1000, close=60)], granularity=1440)
+        df = store.get_candles(ticker="KXBTC-A")
+        assert list(df["close_cents"]) == [60]
+
     def test_duplicate_returns_0(self, store):
         store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
         count = store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
@@ -140,6 +198,40 @@ class TestSaveCandles:
         assert row["yes_bid_cents"] == 50
         assert row["yes_ask_cents"] == 52
 
+    def test_period_end_ts_matches_isoformat(self, store):
+        store.save_candles("KXBTC-A", [_candle(end_period_ts=1701388800)], granularity=1440)
+        df = pd.read_csv(store.candles_path)
+        assert df["period_end_ts"].iloc[0] == "2023-12-01T00:00:00+00:00"
+
+    def test_period_end_ts_matches_datetime_for_many_timestamps(self, store):
+        stamps = [1, 1000, 951782400, 1701388800, 4102444799]
+        store.save_candles("KXBTC-A", [_candle(ts) for ts in stamps], granularity=1440)
+        df = pd.read_csv(store.candles_path)
+        expected = [datetime.fromtimestamp(ts, tz=timezone.utc).isoformat() for ts in stamps]
+        assert list(df["period_end_ts"]) == expected
+
+    def test_missing_nested_fields_default_to_zero(self, store):
+        sparse = {"end_period_ts": 1000, "price": {"close": 45}}
+        store.save_candles("KXBTC-A", [_candle(2000), sparse], granularity=1440)
+        df = store.get_candles(ticker="KXBTC-A")
+        row = df[df["period_end_ts"].str.startswith("1970-01-01T00:16")].iloc[0]
+        assert row["close_cents"] == 45
+        assert row["open_cents"] == 0
+        assert row["yes_bid_cents"] == 0
+        assert row["volume"] == 0
+
+    def test_null_price_fields_stay_null(self, store):
+        no_trades = _candle(1000)
+        no_trades["price"] = {"open": None, "high": None, "low": None, "close": None}
+        store.save_candles("KXBTC-A", [_candle(2000), no_trades], granularity=1440)
+        df = store.get_candles(ticker="KXBTC-A")
+        row = df[df["period_end_ts"].str.startswith("1970-01-01T00:16")].iloc[0]
+        assert pd.isna(row["open_cents"])
+        assert pd.isna(row["close_cents"])
+        assert row["volume"] == 1200
+        other = df[df["period_end_ts"].str.startswith("1970-01-01T00:33")].iloc[0]
+        assert other["close_cents"] == 51
+
     def test_empty_list_returns_0(self, store):
         count = store.save_candles("KXBTC-A", [], granularity=1440)
         assert count == 0
@@ -153,6 +245,30 @@ class TestSaveCandles:
         assert not os.path.exists(store.candles_path)
 
 
+# ---------------------------------------------------------------------------
+# compact
+# ---------------------------------------------------------------------------
+
+class TestCompact:
+    def test_returns_0_when_file_absent(self, store):
+        assert store.compact() == 0
+
+    def test_removes_stale_duplicates_keeping_last(self, store):
+        store.save_candles("KXBTC-A", [_candle(1000, close=40)], granularity=1440)
+        store.save_candles("KXBTC-A", [_candle(1000, close=60)], granularity=1440)
+        store.save_candles("KXBTC-A", [_candle(2000)], granularity=1440)
+        assert store.compact() == 1
+        df = pd.read_csv(store.candles_path)
+        assert len(df) == 2
+        assert df.loc[df["period_end_ts"].str.startswith("1970-01-01T00:16"), "close_cents"].item() == 60
+
+    def test_no_duplicates_leaves_file_untouched(self, store):
+        store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
+        mtime = os.stat(store.candles_path).st_mtime_ns
+        assert store.compact() == 0
+        assert os.stat(store.candles_path).st_mtime_ns == mtime
+
+
 # ---------------------------------------------------------------------------
 # get_markets
 # ---------------------------------------------------------------------------
@@ -185,6 +301,38 @@ class TestGetMarkets:
         df = store.get_markets(status="settled")
         assert list(df["ticker"]) == ["KXBTC-A"]
 
+    def test_columns_restricts_result(self, store):
+        store.save_markets([_market("KXBTC-A", status="settled")])
+        df = store.get_markets(status="settled", columns=["ticker", "close_time"])
+        assert list(df.columns) == ["ticker", "close_time"]
+        assert list(df["ticker"]) == ["KXBTC-A"]
+
+    def test_blank_text_fields_read_as_empty_strings(self, store):
+        m = _market("KXBTC-A")
+        m["settlement_ts"] = ""
+        store.save_markets([m])
+        df = store.get_markets(columns=["ticker", "settlement_ts"])
+        assert df["settlement_ts"].iloc[0] == ""
+        assert df["settlement_ts"].isna().sum() == 0
+
+    def test_upsert_keeps_na_like_text_of_untouched_rows(self, store):
+        kept = _market("KXBTC-A")
+        kept["result"] = "NA"
+        store.save_markets([kept, _market("KXBTC-B")])
+        store.save_markets([_market("KXBTC-B", status="finalized")])
+        df = store.get_markets(columns=["ticker", "result", "status"]).set_index("ticker")
+        assert df.loc["KXBTC-A", "result"] == "NA"
+        assert df.loc["KXBTC-B", "status"] == "finalized"
+
+    def test_repeat_read_uses_cache_until_file_changes(self, store):
+        store.save_markets([_market("KXBTC-A")])
+        with patch("data.data_store.pd.read_csv", wraps=pd.read_csv) as mock_read:
+            store.get_markets()
+            store.get_markets()
+            assert mock_read.call_count == 1
+        store.save_markets([_market("KXBTC-B")])
+        assert len(store.get_markets()) == 2
+
 
 # ---------------------------------------------------------------------------
 # get_candles
@@ -226,6 +374,13 @@ class TestTickerHasCandles:
         store.save_candles("KXBTC-A", [_candle()], granularity=1440)
         assert store.ticker_has_candles("KXBTC-A") is True
 
+    def test_repeated_lookups_do_not_read_candles(self, store):
+        store.save_candles("KXBTC-A", [_candle()], granularity=1440)
+        with patch("data.data_store._read_table") as mock_read:
+            assert store.ticker_has_candles("KXBTC-A") is True
+            assert store.ticker_has_candles("KXBTC-B") is False
+        mock_read.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # get_collected_tickers
@@ -240,7 +395,117 @@ class TestGetCollectedTickers:
         store.save_candles("KXBTC-B", [_candle(2000)], granularity=1440)
         assert store.get_collected_tickers() == {"KXBTC-A", "KXBTC-B"}
 
+    def test_answers_from_index_without_reading_candles(self, store):
+        store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
+        store.save_candles("KXBTC-B", [_candle(1000)], granularity=1440)
+        fresh = DataStore(markets_path=store.markets_path, candles_path=store.candles_path)
+        with patch("data.data_store._read_ticker_set") as mock_scan:
+            assert fresh.get_collected_tickers() == {"KXBTC-A", "KXBTC-B"}
+        mock_scan.assert_not_called()
+
+    def test_index_lists_each_ticker_once(self, store):
+        store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
+        store.save_candles("KXBTC-A", [_candle(2000)], granularity=1440)
+        store.save_candles("KXBTC-B", [_candle(1000)], granularity=1440)
+        assert Path(store.tickers_index_path).read_text().split() == ["KXBTC-A", "KXBTC-B"]
+
+    def test_missing_index_rebuilt_reading_only_ticker_column(self, store):
+        store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
+        os.remove(store.tickers_index_path)
+        fresh = DataStore(markets_path=store.markets_path, candles_path=store.candles_path)
+        with patch("data.data_store.pacsv", None), \
+             patch("data.data_store.pd.read_csv", wraps=pd.read_csv) as mock_read:
+            assert fresh.get_collected_tickers() == {"KXBTC-A"}
+            fresh.get_collected_tickers()
+        mock_read.assert_called_once_with(store.candles_path, usecols=["ticker"])
+        assert Path(store.tickers_index_path).read_text().split() == ["KXBTC-A"]
+
+    def test_rebuild_uses_pyarrow_reader_when_available(self, store):
+        pytest.importorskip("pyarrow")
+        store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
+        store.save_candles("KXBTC-B", [_candle(1000)], granularity=1440)
+        os.remove(store.tickers_index_path)
+        fresh = DataStore(markets_path=store.markets_path, candles_path=store.candles_path)
+        with patch("data.data_store.pd.read_csv") as mock_read:
+            assert fresh.get_collected_tickers() == {"KXBTC-A", "KXBTC-B"}
+        mock_read.assert_not_called()
+
+    def test_recreated_candles_file_resets_index(self, store):
+        store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
+        os.remove(store.candles_path)
+        store.save_candles("KXBTC-B", [_candle(1000)], granularity=1440)
+        assert store.get_collected_tickers() == {"KXBTC-B"}
+
+    def test_returns_frozenset_snapshot(self, store):
+        store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
+        tickers = store.get_collected_tickers()
+        assert isinstance(tickers, frozenset)
+        store.save_candles("KXBTC-B", [_candle(1000)], granularity=1440)
+        assert tickers == {"KXBTC-A"}
+        assert store.get_collected_tickers() == {"KXBTC-A", "KXBTC-B"}
+
     def test_multiple_candles_same_ticker_counted_once(self, store):
         store.save_candles("KXBTC-A", [_candle(1000), _candle(2000)], granularity=1440)
         tickers = store.get_collected_tickers()
         assert tickers == {"KXBTC-A"}
+
+
+# ---------------------------------------------------------------------------
+# Parquet backend
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def parquet_store(tmp_path):
+    pytest.importorskip("pyarrow")
+    return DataStore(
+        markets_path=str(tmp_path / "markets.parquet"),
+        candles_path=str(tmp_path / "candles.parquet"),
+    )
+
+
+class TestParquetBackend:
+    def test_new_keys_are_written_as_separate_parts(self, parquet_store):
+        parquet_store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
+        parquet_store.save_candles("KXBTC-B", [_candle(2000)], granularity=1440)
+        parts = list(Path(parquet_store.candles_path).glob("part-*.parquet"))
+        assert len(parts) == 2
+        assert parquet_store.get_collected_tickers() == {"KXBTC-A", "KXBTC-B"}
+
+    def test_updated_key_rewrites_single_deduplicated_part(self, parquet_store):
+        parquet_store.save_candles("KXBTC-A", [_candle(1000, close=40)], granularity=1440)
+        parquet_store.save_candles("KXBTC-B", [_candle(1000)], granularity=1440)
+        count = parquet_store.save_candles("KXBTC-A", [_candle(1000, close=60)], granularity=1440)
+        assert count == 0
+        parts = list(Path(parquet_store.candles_path).glob("part-*.parquet"))
+        assert len(parts) == 1
+        df = parquet_store.get_candles(ticker="KXBTC-A")
+        assert len(df) == 1
+        assert df.iloc[0]["close_cents"] == 60
+
+    def test_mixed_batch_counts_only_new_keys(self, parquet_store):
+        parquet_store.save_candles("KXBTC-A", [_candle(1000, close=40)], granularity=1440)
+        count = parquet_store.save_candles(
+            "KXBTC-A", [_candle(1000, close=60), _candle(2000)], granularity=1440
+        )
+        assert count == 1
+        df = parquet_store.get_candles(ticker="KXBTC-A")
+        assert len(df) == 2
+        assert sorted(df["close_cents"]) == [51, 60]
+
+    def test_all_null_price_batch_keeps_part_schema(self, parquet_store):
+        parquet_store.save_candles("KXBTC-A", [_candle(1000)], granularity=1440)
+        no_trades = _candle(2000)
+        no_trades["price"] = {"open": None, "high": None, "low": None, "close": None}
+        parquet_store.save_candles("KXBTC-A", [no_trades], granularity=1440)
+        df = parquet_store.get_candles(ticker="KXBTC-A")
+        assert len(df) == 2
+        assert df["close_cents"].isna().sum() == 1
+
+    def test_markets_round_trip_with_filters(self, parquet_store):
+        assert parquet_store.save_markets([
+            _market("KXBTC-A", status="settled"),
+            _market("KXBTC-B", status="open"),
+        ]) == 2
+        assert parquet_store.save_markets([_market("KXBTC-A", status="settled")]) == 0
+        df = parquet_store.get_markets(status="settled", columns=["ticker"])
+        assert list(df["ticker"]) == ["KXBTC-A"]
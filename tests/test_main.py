@@ -130,6 +130,12 @@ class TestMainAppMenuRouting:
             app.run()
             mock_method.assert_called_once()
 
+    def test_launch_trading_invalidates_realized_pnl_cache(self, app):
+        with patch("main.TradingCLI") as MockCLI:
+            MockCLI.return_value.run.side_effect = RuntimeError("boom")
+            app._launch_trading()
+        app.tracker.invalidate_realized.assert_called_once_with()
+
     def test_menu_choice_3_calls_view_open_orders(self, app):
         with patch("main.validate_config"), \
              patch("builtins.input", side_effect=["3", "6"]), \
@@ -385,6 +391,12 @@ class TestShutdownAndEntryPoint:
             app.run()
         mock_input.assert_not_called()
 
+    def test_run_warms_up_client_connection(self, app):
+        with patch('main.validate_config'), \
+             patch('builtins.input', side_effect=["6"]):
+            app.run()
+        app.client.warm_up.assert_called_once()
+
     def test_run_handles_keyboard_interrupt_without_raising(self, app):
         with patch('main.validate_config'), \
              patch('builtins.input', side_effect=KeyboardInterrupt()):
@@ -6,6 +6,9 @@ These tests use mocked KalshiClient to test position tracking,
 P&L calculations, and display output without making real API calls.
 """
 
+import logging
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, call
 
@@ -15,7 +18,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from portfolio_tracker import (
     PortfolioTracker, PortfolioError,
-    _format_dollars, _format_pnl, _print_position_line,
+    _fee_cents, _format_dollars, _format_pnl, _format_position_lines,
 )
 from kalshi_client import KalshiAPIError
 
@@ -23,7 +26,11 @@ from kalshi_client import KalshiAPIError
 @pytest.fixture
 def mock_client():
     """Create a mock KalshiClient."""
-    return Mock()
+    client = Mock()
+    # Bulk market lookups find nothing by default, so pricing falls back
+    # to per-ticker get_market calls
+    client.get_markets.return_value = {"markets": [], "cursor": ""}
+    return client
 
 
 @pytest.fixture
@@ -71,6 +78,45 @@ class TestHelperFunctions:
         """Formats None P&L as zero."""
         assert _format_pnl(None) == "+$0.00"
 
+    def test_fee_cents_parses_dollar_strings(self):
+        """Parses API fee strings into cents, treating bad values as zero."""
+        assert _fee_cents("0.0900") == 9
+        assert _fee_cents(None) == 0
+        assert _fee_cents("n/a") == 0
+
+    def test_format_dollars_large_amount_exact(self):
+        """Formats large cent amounts exactly, with zero-padded cents."""
+        assert _format_dollars(123456789005) == "$1234567890.05"
+
+    def test_format_dollars_float_cents_rounded(self):
+        """Rounds float cent amounts to the nearest cent instead of raising."""
+        assert _format_dollars(1234.6) == "$12.35"
+        assert _format_dollars(-50.0) == "$0.50"
+        assert _format_pnl(-7.2) == "-$0.07"
+
+    def test_format_pnl_sub_dollar_loss(self):
+        """Formats a loss under a dollar with a leading zero."""
+        assert _format_pnl(-7) == "-$0.07"
+
+    def test_format_position_lines_full_block(self):
+        """Formats ticker, title, sizing and P&L lines in display order."""
+        pos = {"ticker": "A", "title": "Will A happen?", "quantity": 5, "side": "yes",
+               "avg_price": 50, "cost": 250, "value": 360, "pnl": 110, "status": "active"}
+        assert _format_position_lines(pos) == (
+            "  A\n"
+            "    Will A happen?\n"
+            "    5 YES @ 50c  |  Cost: $2.50  |  Value: $3.60\n"
+            "    P&L: +$1.10 (+44.0%)  |  Status: active"
+        )
+
+    def test_format_position_lines_omits_empty_title(self):
+        """Leaves out the title line when the market has no title."""
+        pos = {"ticker": "B", "quantity": 1, "side": "no", "avg_price": 40,
+               "cost": 40, "value": 30, "pnl": -10, "status": "active"}
+        assert _format_position_lines(pos).splitlines()[:2] == [
+            "  B", "    1 NO @ 40c  |  Cost: $0.40  |  Value: $0.30"
+        ]
+
 
 # =============================================================================
 # Get Current Positions Tests
@@ -117,7 +163,7 @@ class TestGetCurrentPositions:
         result = tracker.get_current_positions()
 
         assert len(result) == 1
-        mock_client.get_positions.assert_called_once_with(limit=100, cursor=None)
+        mock_client.get_positions.assert_called_once_with(limit=1000, cursor=None)
 
     def test_pagination_multiple_pages(self, tracker, mock_client):
         """Fetches positions across multiple pages."""
@@ -136,8 +182,60 @@ class TestGetCurrentPositions:
 
         assert len(result) == 2
         assert mock_client.get_positions.call_count == 2
-        mock_client.get_positions.assert_any_call(limit=100, cursor=None)
-        mock_client.get_positions.assert_any_call(limit=100, cursor="page2")
+        mock_client.get_positions.assert_any_call(limit=1000, cursor=None)
+        mock_client.get_positions.assert_any_call(limit=1000, cursor="page2")
+
+    def test_paginate_rejected_page_limit_falls_back_once(self, tracker, mock_client):
+        """A 400 on the large page size retries with the fallback and remembers it."""
+        def get_positions(limit, cursor):
+            if limit > 100:
+                raise KalshiAPIError("limit too large", status_code=400)
+            return {"market_positions": [{"ticker": "A", "position": 1}], "cursor": ""}
+
+        mock_client.get_positions.side_effect = get_positions
+
+        assert len(tracker.get_current_positions()) == 1
+        assert len(tracker.get_current_positions()) == 1
+
+        limits = [c[1]["limit"] for c in mock_client.get_positions.call_args_list]
+        assert limits == [1000, 100, 100]
+
+    def test_paginate_other_client_error_not_retried(self, tracker, mock_client):
+        """Errors other than 400 surface without a smaller-page retry."""
+        mock_client.get_positions.side_effect = KalshiAPIError("Forbidden", status_code=403)
+
+        with pytest.raises(PortfolioError):
+            tracker.get_current_positions()
+        assert mock_client.get_positions.call_count == 1
+
+    def test_iter_all_positions_yields_before_last_page(self, tracker, mock_client):
+        """Positions from page one are available while page two is in flight."""
+        first_consumed = threading.Event()
+
+        def get_positions(limit, cursor):
+            if cursor is None:
+                return {"market_positions": [{"ticker": "A", "position": 1}], "cursor": "p2"}
+            # Only answers once the caller has already consumed page one
+            assert first_consumed.wait(timeout=5)
+            return {"market_positions": [{"ticker": "B", "position": 0}], "cursor": ""}
+
+        mock_client.get_positions.side_effect = get_positions
+
+        positions = tracker._iter_all_positions()
+        assert next(positions)["ticker"] == "A"
+        first_consumed.set()
+        assert [p["ticker"] for p in positions] == ["B"]
+
+    def test_iter_paginated_no_restart_after_items_yielded(self, tracker, mock_client):
+        """A 400 on a later page fails instead of re-yielding earlier pages."""
+        mock_client.get_positions.side_effect = [
+            {"market_positions": [{"ticker": "A", "position": 1}], "cursor": "p2"},
+            KalshiAPIError("bad cursor", status_code=400),
+        ]
+
+        with pytest.raises(PortfolioError):
+            tracker.get_current_positions()
+        assert mock_client.get_positions.call_count == 2
 
     def test_handles_positions_key(self, tracker, mock_client):
         """Works with 'positions' key instead of 'market_positions'."""
@@ -344,6 +442,22 @@ class TestCalculatePositionPnl:
         assert result["value"] == 0
         assert result["pnl"] == -150
 
+    def test_settled_unknown_result_worth_nothing(self, tracker, mock_client):
+        """A settled result other than yes/no (e.g. void) is valued at zero."""
+        mock_client.get_market.return_value = {
+            "market": {
+                "yes_bid": 0, "yes_ask": 0,
+                "last_price": 50, "status": "settled",
+                "title": "Voided", "result": "void",
+            }
+        }
+
+        pos = {"ticker": "VOID", "position": 4, "market_exposure": 200}
+        result = tracker.calculate_position_pnl(pos)
+
+        assert result["value"] == 0
+        assert result["pnl"] == -200
+
     def test_fallback_to_last_price(self, tracker, mock_client):
         """Uses last_price when bid/ask are zero."""
         mock_client.get_market.return_value = {
@@ -420,12 +534,13 @@ class TestCalculateTotalPnl:
             ],
             "cursor": "",
         }
-        mock_client.get_market.side_effect = [
-            {"market": {"yes_bid": 70, "yes_ask": 74, "last_price": 72,
-                         "status": "active", "title": "A", "result": ""}},
-            {"market": {"yes_bid": 40, "yes_ask": 44, "last_price": 42,
-                         "status": "active", "title": "B", "result": ""}},
-        ]
+        markets = {
+            "A": {"market": {"yes_bid": 70, "yes_ask": 74, "last_price": 72,
+                              "status": "active", "title": "A", "result": ""}},
+            "B": {"market": {"yes_bid": 40, "yes_ask": 44, "last_price": 42,
+                              "status": "active", "title": "B", "result": ""}},
+        }
+        mock_client.get_market.side_effect = lambda ticker: markets[ticker]
 
         result = tracker.calculate_total_pnl()
 
@@ -461,11 +576,13 @@ class TestCalculateTotalPnl:
             ],
             "cursor": "",
         }
-        mock_client.get_market.side_effect = [
-            {"market": {"yes_bid": 60, "yes_ask": 64, "last_price": 62,
-                         "status": "active", "title": "Good", "result": ""}},
-            KalshiAPIError("Not found", status_code=404),
-        ]
+        def get_market(ticker):
+            if ticker == "BAD":
+                raise KalshiAPIError("Not found", status_code=404)
+            return {"market": {"yes_bid": 60, "yes_ask": 64, "last_price": 62,
+                               "status": "active", "title": "Good", "result": ""}}
+
+        mock_client.get_market.side_effect = get_market
 
         result = tracker.calculate_total_pnl()
 
@@ -494,6 +611,162 @@ class TestCalculateTotalPnl:
         assert result["positions"] == []
         assert result["errors"] == ["BAD1", "BAD2"]
 
+    def test_calculate_total_pnl_logs_one_warning_for_all_failures(
+        self, tracker, mock_client, caplog
+    ):
+        """Pricing failures are reported in a single aggregated warning."""
+        mock_client.get_positions.return_value = {
+            "market_positions": [
+                {"ticker": f"BAD{i}", "position": 1, "market_exposure": 10} for i in range(5)
+            ],
+            "cursor": "",
+        }
+        mock_client.get_market.side_effect = KalshiAPIError("Down", status_code=503)
+
+        with caplog.at_level(logging.WARNING, logger="portfolio_tracker"):
+            result = tracker.calculate_total_pnl()
+
+        assert len(result["errors"]) == 5
+        warnings = [r for r in caplog.records if r.levelno >= logging.WARNING]
+        assert len(warnings) == 1
+        assert "5 position(s)" in warnings[0].getMessage()
+        assert "BAD0" in warnings[0].getMessage()
+
+    def test_calculate_total_pnl_prices_markets_concurrently(self, tracker, mock_client):
+        """Market lookups overlap instead of running one after another."""
+        mock_client.get_positions.return_value = {
+            "market_positions": [
+                {"ticker": "A", "position": 1, "market_exposure": 50},
+                {"ticker": "B", "position": 1, "market_exposure": 50},
+            ],
+            "cursor": "",
+        }
+        both_in_flight = threading.Barrier(2, timeout=5)
+
+        def get_market(ticker):
+            # Only passes once both lookups are running at the same time
+            both_in_flight.wait()
+            return {"market": {"last_price": 50, "status": "active", "result": ""}}
+
+        mock_client.get_market.side_effect = get_market
+
+        result = tracker.calculate_total_pnl()
+
+        assert [p["ticker"] for p in result["positions"]] == ["A", "B"]
+        assert result["errors"] == []
+
+    def test_calculate_total_pnl_fetches_each_ticker_once(self, tracker, mock_client):
+        """Positions sharing a ticker reuse a single market lookup."""
+        mock_client.get_positions.return_value = {
+            "market_positions": [
+                {"ticker": "A", "position": 2, "market_exposure": 100},
+                {"ticker": "A", "position": -1, "market_exposure": 40},
+            ],
+            "cursor": "",
+        }
+        mock_client.get_market.return_value = {
+            "market": {"last_price": 60, "status": "active", "result": ""}
+        }
+
+        result = tracker.calculate_total_pnl()
+
+        mock_client.get_market.assert_called_once_with("A")
+        assert [p["side"] for p in result["positions"]] == ["yes", "no"]
+
+    def test_calculate_total_pnl_prices_from_bulk_markets_call(self, tracker, mock_client):
+        """All positions are priced by one GET /markets call, not one per ticker."""
+        mock_client.get_positions.return_value = {
+            "market_positions": [
+                {"ticker": "A", "position": 5, "market_exposure": 250},
+                {"ticker": "B", "position": 3, "market_exposure": 150},
+            ],
+            "cursor": "",
+        }
+        mock_client.get_markets.return_value = {
+            "markets": [
+                {"ticker": "B", "last_price": 42, "status": "active", "result": ""},
+                {"ticker": "A", "last_price": 72, "status": "active", "result": ""},
+            ],
+            "cursor": "",
+        }
+
+        result = tracker.calculate_total_pnl()
+
+        mock_client.get_markets.assert_called_once_with(tickers=["A", "B"], limit=2)
+        mock_client.get_market.assert_not_called()
+        assert result["total_value"] == 5 * 72 + 3 * 42
+        assert [p["ticker"] for p in result["positions"]] == ["A", "B"]
+
+    def test_calculate_total_pnl_bulk_miss_falls_back_to_get_market(self, tracker, mock_client):
+        """Tickers absent from the bulk response are looked up individually."""
+        mock_client.get_positions.return_value = {
+            "market_positions": [
+                {"ticker": "A", "position": 1, "market_exposure": 50},
+                {"ticker": "OLD", "position": 1, "market_exposure": 50},
+            ],
+            "cursor": "",
+        }
+        mock_client.get_markets.return_value = {
+            "markets": [{"ticker": "A", "last_price": 60, "status": "active", "result": ""}],
+            "cursor": "",
+        }
+        mock_client.get_market.return_value = {
+            "market": {"last_price": 0, "status": "settled", "result": "yes"}
+        }
+
+        result = tracker.calculate_total_pnl()
+
+        mock_client.get_market.assert_called_once_with("OLD")
+        assert result["total_value"] == 60 + 100
+
+    def test_calculate_total_pnl_bulk_error_falls_back_to_get_market(self, tracker, mock_client):
+        """A failed bulk call still prices every position one by one."""
+        mock_client.get_positions.return_value = {
+            "market_positions": [{"ticker": "A", "position": 2, "market_exposure": 100}],
+            "cursor": "",
+        }
+        mock_client.get_markets.side_effect = KalshiAPIError("Down", status_code=500)
+        mock_client.get_market.return_value = {
+            "market": {"last_price": 55, "status": "active", "result": ""}
+        }
+
+        result = tracker.calculate_total_pnl()
+
+        assert result["total_value"] == 110
+        assert result["errors"] == []
+
+    def test_calculate_total_pnl_batches_bulk_lookups(self, tracker, mock_client):
+        """Tickers are split into MARKET_BATCH_SIZE chunks."""
+        tracker.MARKET_BATCH_SIZE = 2
+        tickers = ["A", "B", "C"]
+        mock_client.get_positions.return_value = {
+            "market_positions": [
+                {"ticker": t, "position": 1, "market_exposure": 10} for t in tickers
+            ],
+            "cursor": "",
+        }
+        mock_client.get_markets.side_effect = lambda tickers, limit: {
+            "markets": [{"ticker": t, "last_price": 50} for t in tickers],
+        }
+
+        result = tracker.calculate_total_pnl()
+
+        assert [c[1]["tickers"] for c in mock_client.get_markets.call_args_list] == [
+            ["A", "B"], ["C"]
+        ]
+        assert len(result["positions"]) == 3
+
+    def test_price_fetch_workers_fit_client_connection_pool(self):
+        """Concurrent price lookups never outnumber the client's pooled connections."""
+        from kalshi_client import KalshiClient
+        assert PortfolioTracker.PRICE_FETCH_WORKERS <= KalshiClient.POOL_MAXSIZE
+
+    def test_invalidate_prices_flushes_client_market_cache(self, tracker, mock_client):
+        """invalidate_prices drops cached market GETs but not portfolio data."""
+        tracker.invalidate_prices()
+
+        mock_client.invalidate.assert_called_once_with("/markets/")
+
     def test_fetch_error_propagates(self, tracker, mock_client):
         """PortfolioError from position fetch propagates up."""
         mock_client.get_positions.side_effect = KalshiAPIError("Down", status_code=500)
@@ -609,6 +882,86 @@ class TestGetRealizedPnl:
 
         assert result["settlements"][0]["source"] == "settlement"
 
+    def test_get_realized_pnl_reuses_result_within_ttl(self, tracker, mock_client):
+        """A second call inside REALIZED_TTL_SEC makes no API requests."""
+        self._no_fills(mock_client)
+        mock_client.get_settlements.return_value = {
+            "settlements": [
+                {"ticker": "A", "revenue": 100, "yes_total_cost": 50,
+                 "no_total_cost": 0, "fee_cost": "0.0000", "market_result": "yes"},
+            ],
+            "cursor": "",
+        }
+
+        with patch("portfolio_tracker.time.monotonic", return_value=1000.0):
+            first = tracker.get_realized_pnl()
+            first["settlements"].clear()
+            second = tracker.get_realized_pnl()
+
+        assert mock_client.get_settlements.call_count == 1
+        assert mock_client.get_fills.call_count == 1
+        # Callers get their own copy of the cached result
+        assert second["gross_pnl"] == 50
+        assert len(second["settlements"]) == 1
+
+    def test_get_realized_pnl_refetches_after_ttl(self, tracker, mock_client):
+        """The cached result expires after REALIZED_TTL_SEC."""
+        self._no_fills(mock_client)
+        mock_client.get_settlements.return_value = {"settlements": [], "cursor": ""}
+
+        with patch("portfolio_tracker.time.monotonic") as mock_clock:
+            mock_clock.return_value = 1000.0
+            tracker.get_realized_pnl()
+            mock_clock.return_value = 1000.0 + tracker.REALIZED_TTL_SEC
+            tracker.get_realized_pnl()
+
+        assert mock_client.get_settlements.call_count == 2
+
+    def test_invalidate_realized_forces_refetch(self, tracker, mock_client):
+        """invalidate_realized drops the cached result."""
+        self._no_fills(mock_client)
+        mock_client.get_settlements.return_value = {"settlements": [], "cursor": ""}
+
+        tracker.get_realized_pnl()
+        tracker.invalidate_realized()
+        tracker.get_realized_pnl()
+
+        assert mock_client.get_settlements.call_count == 2
+
+    def test_get_realized_pnl_failure_is_not_cached(self, tracker, mock_client):
+        """A failed fetch leaves nothing cached, so the next call retries."""
+        self._no_fills(mock_client)
+        mock_client.get_settlements.side_effect = [
+            KalshiAPIError("Error", status_code=500),
+            {"settlements": [], "cursor": ""},
+        ]
+
+        with pytest.raises(PortfolioError):
+            tracker.get_realized_pnl()
+        assert tracker.get_realized_pnl()["gross_pnl"] == 0
+
+    def test_get_realized_pnl_fetches_settlements_and_fills_concurrently(
+        self, tracker, mock_client
+    ):
+        """Settlements and fills pages are requested at the same time."""
+        both_in_flight = threading.Barrier(2, timeout=5)
+
+        def settlements(**kwargs):
+            both_in_flight.wait()
+            return {"settlements": [], "cursor": ""}
+
+        def fills(**kwargs):
+            both_in_flight.wait()
+            return {"fills": [], "cursor": ""}
+
+        mock_client.get_settlements.side_effect = settlements
+        mock_client.get_fills.side_effect = fills
+
+        result = tracker.get_realized_pnl()
+
+        assert result["gross_pnl"] == 0
+        assert result["settlements"] == []
+
 
 # =============================================================================
 # Display Portfolio Summary Tests
@@ -743,6 +1096,107 @@ class TestDisplayPortfolioSummary:
         assert "NOTE:" in output
         assert "estimated from fill data" in output
 
+    def test_display_portfolio_summary_balance_and_positions_fetched_concurrently(
+        self, tracker, mock_client, capsys
+    ):
+        """Balance and positions are in flight together; output order is unchanged."""
+        self._no_fills(mock_client)
+        positions_started = threading.Event()
+
+        def slow_balance():
+            # Only returns once the positions fetch has started in parallel
+            assert positions_started.wait(timeout=5)
+            return {"balance": 25000, "portfolio_value": 0}
+
+        def positions(**kwargs):
+            positions_started.set()
+            return {"market_positions": [], "cursor": ""}
+
+        mock_client.get_balance.side_effect = slow_balance
+        mock_client.get_positions.side_effect = positions
+        mock_client.get_settlements.return_value = {
+            "settlements": [], "cursor": "",
+        }
+
+        tracker.display_portfolio_summary()
+
+        output = capsys.readouterr().out
+        assert output.index("Account Balance") < output.index("Open Positions")
+        assert output.index("Open Positions") < output.index("Realized P&L")
+
+    def test_display_portfolio_summary_starts_all_fetches_together(
+        self, tracker, mock_client, capsys
+    ):
+        """Balance, positions, settlements and fills are all in flight at once."""
+        all_in_flight = threading.Barrier(4, timeout=5)
+
+        def arrive(response):
+            def fetch(**kwargs):
+                all_in_flight.wait()
+                return response
+            return fetch
+
+        mock_client.get_balance.side_effect = arrive({"balance": 100, "portfolio_value": 0})
+        mock_client.get_positions.side_effect = arrive({"market_positions": [], "cursor": ""})
+        mock_client.get_settlements.side_effect = arrive({"settlements": [], "cursor": ""})
+        mock_client.get_fills.side_effect = arrive({"fills": [], "cursor": ""})
+
+        tracker.display_portfolio_summary()
+
+        output = capsys.readouterr().out
+        assert "Net Realized P&L:   +$0.00" in output
+
+    def test_display_portfolio_summary_fresh_realized_skips_fetch(
+        self, tracker, mock_client, capsys
+    ):
+        """A cached realized P&L is shown without re-walking settlements and fills."""
+        self._no_fills(mock_client)
+        mock_client.get_balance.return_value = {"balance": 100, "portfolio_value": 0}
+        mock_client.get_positions.return_value = {"market_positions": [], "cursor": ""}
+        mock_client.get_settlements.return_value = {"settlements": [], "cursor": ""}
+
+        tracker.display_portfolio_summary()
+        tracker.display_portfolio_summary()
+
+        assert mock_client.get_settlements.call_count == 1
+        assert mock_client.get_fills.call_count == 1
+        assert mock_client.get_positions.call_count == 2
+        assert capsys.readouterr().out.count("Net Realized P&L") == 2
+
+    def test_display_portfolio_summary_exclude_realized_skips_fetch(
+        self, tracker, mock_client, capsys
+    ):
+        """include_realized=False never paginates settlements or fills."""
+        mock_client.get_balance.return_value = {"balance": 100, "portfolio_value": 0}
+        mock_client.get_positions.return_value = {"market_positions": [], "cursor": ""}
+
+        tracker.display_portfolio_summary(include_realized=False)
+
+        output = capsys.readouterr().out
+        mock_client.get_settlements.assert_not_called()
+        mock_client.get_fills.assert_not_called()
+        assert "Open Positions" in output
+        assert "Realized P&L" not in output
+
+    def test_display_portfolio_summary_balance_error_still_shows_positions(
+        self, tracker, mock_client, capsys
+    ):
+        """A balance failure is reported without dropping the positions section."""
+        self._no_fills(mock_client)
+        mock_client.get_balance.side_effect = KalshiAPIError("boom", status_code=500)
+        mock_client.get_positions.return_value = {
+            "market_positions": [], "cursor": "",
+        }
+        mock_client.get_settlements.return_value = {
+            "settlements": [], "cursor": "",
+        }
+
+        tracker.display_portfolio_summary()
+
+        output = capsys.readouterr().out
+        assert "(unavailable)" in output
+        assert "No open positions" in output
+
 
 # =============================================================================
 # Fetch All Fills Tests
@@ -761,7 +1215,7 @@ class TestFetchAllFills:
         result = tracker._fetch_all_fills()
 
         assert len(result) == 2
-        mock_client.get_fills.assert_called_once_with(limit=100, cursor=None)
+        mock_client.get_fills.assert_called_once_with(limit=1000, cursor=None)
 
     def test_fetches_fills_multiple_pages(self, tracker, mock_client):
         """Paginates through multiple pages of fills."""
@@ -802,7 +1256,7 @@ class TestFetchAllSettlements:
         result = tracker._fetch_all_settlements()
 
         assert len(result) == 2
-        mock_client.get_settlements.assert_called_once_with(limit=100, cursor=None)
+        mock_client.get_settlements.assert_called_once_with(limit=1000, cursor=None)
 
     def test_fetches_settlements_multiple_pages(self, tracker, mock_client):
         """Paginates through multiple pages of settlements."""
@@ -251,6 +251,25 @@ class TestCancelOrder:
 
         assert "Failed to cancel order" in str(exc_info.value)
 
+    def test_cancel_orders_batches_ids(self, executor, mock_client):
+        """Passes cleaned IDs to the batch cancel and returns per-order results."""
+        mock_client.batch_cancel_orders.return_value = {
+            "orders": [{"order_id": "a1", "order": {"status": "canceled"}}],
+        }
+
+        result = executor.cancel_orders(["a1", " ", ""])
+
+        mock_client.batch_cancel_orders.assert_called_once_with(["a1"])
+        assert result == [{"order_id": "a1", "order": {"status": "canceled"}}]
+
+    def test_cancel_orders_empty_ids(self, executor, mock_client):
+        """Rejects a list with no usable order IDs."""
+        with pytest.raises(TradeExecutionError) as exc_info:
+            executor.cancel_orders(["", "  "])
+
+        assert "Order IDs cannot be empty" in str(exc_info.value)
+        mock_client.batch_cancel_orders.assert_not_called()
+
 
 # =============================================================================
 # Order Status Tests
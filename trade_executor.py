@@ -10,6 +10,7 @@ import logging
 from typing import Optional
 
 from kalshi_client import KalshiClient, KalshiAPIError
+from market_series import POPULAR_SERIES
 
 
 logger = logging.getLogger(__name__)
@@ -129,6 +130,32 @@ class TradeExecutor:
             logger.error("Failed to cancel order %s: %s", order_id, e)
             raise TradeExecutionError(f"Failed to cancel order: {e}")
 
+    def cancel_orders(self, order_ids: list) -> list:
+        """
+        Cancel several pending orders in batched API calls.
+
+        Args:
+            order_ids: The order IDs to cancel
+
+        Returns:
+            List of per-order results, each with order_id and either
+            order (cancelled order details) or error
+
+        Raises:
+            TradeExecutionError: If no valid IDs are given or the batch fails
+        """
+        order_ids = [oid.strip() for oid in order_ids if oid and oid.strip()]
+        if not order_ids:
+            raise TradeExecutionError("Order IDs cannot be empty")
+
+        try:
+            result = self.client.batch_cancel_orders(order_ids)
+            logger.info("Batch cancel requested for %d orders", len(order_ids))
+            return result.get("orders", [])
+        except KalshiAPIError as e:
+            logger.error("Failed to cancel %d orders: %s", len(order_ids), e)
+            raise TradeExecutionError(f"Failed to cancel orders: {e}")
+
     def get_order_status(self, order_id: str) -> dict:
         """
         Get the status of an order.
@@ -205,35 +232,8 @@ class TradeExecutor:
         except TradeExecutionError:
             return False
 
-    # Popular series on Kalshi (searched in order)
-    POPULAR_SERIES = [
-        # Crypto
-        "KXBTC",      # Bitcoin price
-        "KXETH",      # Ethereum price
-        # Financial / Economic
-        "INXD",       # S&P 500 / indexes
-        "KXFED",      # Federal Reserve
-        "KXCPI",      # Inflation / CPI
-        "KXGDP",      # GDP
-        "KXJOBS",     # Jobs / employment
-        "KXRATE",     # Interest rates
-        # Politics
-        "PRES",       # Presidential / politics
-        "KXELECT",    # Elections
-        # Sports
-        "KXNBA",      # NBA
-        "KXNFL",      # NFL
-        "KXMLB",      # MLB
-        "KXNHL",      # NHL
-        "KXSOCCER",   # Soccer
-        "KXNCAAMB",   # NCAA basketball
-        # Entertainment / Events
-        "KXFIRSTSUPERBOWLSONG",  # Super Bowl halftime
-        "KXSUPERBOWL",           # Super Bowl
-        "KXOSCARS",              # Oscars
-        "KXGRAMMYS",             # Grammys
-        "KXEMMYS",               # Emmys
-    ]
+    # Series searched by search_markets; defined in market_series
+    POPULAR_SERIES = POPULAR_SERIES
 
     def search_markets(
         self,